@@ -0,0 +1,435 @@
+"""Render a one-page PNG or PDF report per person in a roster.
+
+    python batch_reports.py roster.csv reports/ --format pdf --workers 8
+
+The roster has the columns of ``batch_score.py`` plus an optional ``id``
+(used as the file name, so it should be unique; the row number otherwise),
+``name`` and ``age``. Each report shows the BMI and body-fat results, the
+body-fat category chart and the BMI silhouette from the SVG Body page.
+
+Pages are drawn on explicit Agg figures, never through pyplot. Every worker
+process builds one page template when it starts and, per person, only
+updates the texts, the chart curve, bands and marker and the silhouette
+image before saving. The SVG figures are rasterized once by the parent and
+handed to the workers. Each report is written to a temporary file and
+renamed when complete, so a run can be interrupted and started again: rows
+whose report already exists are skipped. Rows that cannot be scored are
+listed in ``errors.csv`` in the output directory and not retried; delete
+the file to retry them.
+"""
+import argparse
+import collections
+import csv
+import functools
+import os
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+import svg_assets
+import svg_morph
+from batch_score import read_chunks, score_chunk
+from body_composition import bmi_category_index, calculate_body_fat_percentage
+from body_fat_chart import DPI, FEMALE_BANDS, MALE_BANDS, WEIGHT_RANGE
+
+FORMATS = ('png', 'pdf')
+# A4 portrait, in inches.
+PAGE_SIZE = (8.27, 11.69)
+WEIGHTS = np.linspace(*WEIGHT_RANGE, 300)
+# Figure shown for each BMI category, as on the SVG Body page.
+SILHOUETTES = ('underweight', 'healthy', 'unhealthy', 'unhealthy')
+SILHOUETTE_PX = 460
+
+_PATH_TAG = re.compile(r'<path\s([^>]*?)/?>')
+_ATTRIBUTE = re.compile(r'([\w-]+)="([^"]*)"')
+_STYLE_RULE = re.compile(r'([^{}]+)\{([^}]*)\}')
+
+
+def _declarations(style):
+    return dict(
+        (name.strip(), value.strip()) for name, _, value in
+        (item.partition(':') for item in style.split(';') if ':' in item)
+    )
+
+
+def _class_styles(markup):
+    styles = collections.defaultdict(dict)
+    sheet = re.search(r'<style>(.*?)</style>', markup, re.S)
+    for selectors, body in _STYLE_RULE.findall(sheet.group(1) if sheet else ''):
+        for selector in selectors.split(','):
+            styles[selector.strip().lstrip('.')].update(_declarations(body))
+    return styles
+
+
+def _radial_gradients(markup):
+    gradients = {}
+    for attributes, body in re.findall(r'<radialGradient\s([^>]*)>(.*?)</radialGradient>', markup, re.S):
+        attributes = dict(_ATTRIBUTE.findall(attributes))
+        stops = [(float(offset), svg_morph._hex_to_rgb(color) / 255)
+                 for offset, color in re.findall(r'offset="([\d.]+)"\s+stop-color="(#[0-9a-fA-F]+)"', body)]
+        gradients[attributes['id']] = (float(attributes['cx']), float(attributes['cy']), float(attributes['r']), stops)
+    return gradients
+
+
+def _gradient_image(gradient, width, height, shape):
+    cx, cy, r, stops = gradient
+    y, x = np.mgrid[0:height:shape[0] * 1j, 0:width:shape[1] * 1j]
+    t = np.clip(np.hypot(x - cx, y - cy) / r, 0, 1)
+    offsets = [offset for offset, _ in stops]
+    return np.dstack([np.interp(t, offsets, [color[i] for _, color in stops]) for i in range(3)])
+
+
+@functools.lru_cache(maxsize=None)
+def rasterize_silhouette(name, height_px=SILHOUETTE_PX):
+    """RGBA array of an SVG figure, ``height_px`` tall on a transparent background.
+
+    Paths are flattened with :mod:`svg_morph` and drawn with matplotlib, which
+    covers what the bundled figures use: solid and radial-gradient fills and
+    solid, round-capped or dotted strokes.
+    """
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+    from matplotlib.patches import PathPatch
+    from matplotlib.path import Path
+
+    markup = svg_assets.load(name).markup.decode('utf-8')
+    width, height = (float(v) for v in re.search(r'viewBox="0 0 ([\d.]+) ([\d.]+)"', markup).groups())
+    scale = height_px / height
+    figure = Figure(figsize=(width * scale / DPI, height_px / DPI), dpi=DPI)
+    figure.patch.set_alpha(0)
+    canvas = FigureCanvasAgg(figure)
+    ax = figure.add_axes((0, 0, 1, 1))
+    ax.set_axis_off()
+    ax.set_xlim(0, width)
+    ax.set_ylim(height, 0)
+
+    classes = _class_styles(markup)
+    gradients = _radial_gradients(markup)
+    for tag in _PATH_TAG.findall(markup):
+        attributes = dict(_ATTRIBUTE.findall(tag))
+        style = {}
+        for cls in attributes.get('class', '').split():
+            style.update(classes.get(cls, {}))
+        style.update(_declarations(attributes.get('style', '')))
+
+        path = Path.make_compound_path(*(Path(points) for points in svg_morph.flatten_subpaths(attributes['d'])))
+        fill = style.get('fill', '#000')
+        stroke = style.get('stroke', 'none')
+        stroke_width = float(style.get('stroke-width', '1').rstrip('px'))
+        gradient = re.fullmatch(r'url\(#([\w-]+)\)', fill)
+        patch = PathPatch(
+            path,
+            facecolor='none' if fill == 'none' or gradient else fill,
+            edgecolor=stroke,
+            linewidth=stroke_width * scale * 72 / DPI if stroke != 'none' and stroke_width else 0,
+            capstyle='round' if style.get('stroke-linecap') == 'round' else 'butt',
+        )
+        dashes = [float(v) for v in style.get('stroke-dasharray', '').replace(',', ' ').split()]
+        if any(dashes):
+            # Dash lengths are in points and matplotlib scales them by the line width.
+            patch.set_linestyle((0, [max(v * scale * 72 / DPI, 1e-3) / patch.get_linewidth() for v in dashes]))
+        ax.add_patch(patch)
+        if gradient and gradient.group(1) in gradients:
+            shape = (round(height_px), round(width * scale))
+            ax.imshow(_gradient_image(gradients[gradient.group(1)], width, height, shape),
+                      extent=(0, width, height, 0), clip_path=patch, zorder=patch.get_zorder() - 0.5)
+
+    canvas.draw()
+    return np.asarray(canvas.buffer_rgba()).copy()
+
+
+def silhouettes():
+    """Rasterized figure for every name in ``SILHOUETTES``."""
+    return {name: rasterize_silhouette(name) for name in set(SILHOUETTES)}
+
+
+def report_name(value):
+    return re.sub(r'[^\w.-]+', '_', str(value)).strip('._') or '_'
+
+
+def _number(value, fmt, suffix=''):
+    return '-' if value is None or np.isnan(value) else f'{value:{fmt}}{suffix}'
+
+
+def chart_limits(bfp, bands):
+    """Y limits of the category chart, snapped to tens so that pages share a few chart backgrounds."""
+    top = max(max(high or low for low, high, _, _ in bands), bfp) + 3
+    bottom = min(0, bfp - 3)
+    return 10 * np.floor(bottom / 10), 10 * np.ceil(top / 10)
+
+
+class _ReportTemplate:
+    """One reusable page. With ``blit``, the artists that change per person are
+    animated and drawn over cached backgrounds: the header per silhouette and
+    the chart per (gender, y limits)."""
+
+    FIELDS = ('BMI', 'BMI category', 'Body fat', 'Percentiles (BMI / body fat)', 'Gender', 'Weight', 'Height',
+              'Neck', 'Waist', 'Hip')
+    # Figure fraction dividing the header from the chart.
+    SPLIT = 0.49
+
+    def __init__(self, figures, blit=True):
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        from matplotlib.figure import Figure
+        from matplotlib.legend import Legend
+        from matplotlib.patches import Rectangle
+        from matplotlib.transforms import Bbox
+
+        self.figures = figures
+        self.blit = blit
+        self.figure = figure = Figure(figsize=PAGE_SIZE, dpi=DPI)
+        self.canvas = FigureCanvasAgg(figure)
+        figure.text(0.08, 0.94, 'Body composition report', fontsize=20, weight='bold')
+        self.subtitle = figure.text(0.08, 0.915, '', fontsize=12, color='0.35')
+
+        self.values = {}
+        for i, field in enumerate(self.FIELDS):
+            y = 0.86 - i * 0.032
+            figure.text(0.08, y, field, fontsize=11, color='0.35')
+            self.values[field] = figure.text(0.58, y, '', fontsize=11, weight='bold', ha='right')
+
+        ax = figure.add_axes((0.64, 0.52, 0.3, 0.38))
+        ax.set_axis_off()
+        widest = max(image.shape[1] for image in figures.values())
+        ax.set_xlim(-widest / 2, widest / 2)
+        ax.set_ylim(max(image.shape[0] for image in figures.values()), 0)
+        self.silhouette_name = next(iter(figures))
+        self.silhouette = ax.imshow(figures[self.silhouette_name], interpolation='none')
+
+        # Same chart as body_fat_chart, with both genders' bands built up front and toggled.
+        self.axes = ax = figure.add_axes((0.1, 0.07, 0.85, 0.38))
+        self.curve, = ax.plot(WEIGHTS, np.zeros_like(WEIGHTS), label='Body Fat %')
+        self.bands = {}
+        self.open_bands = {}
+        self.legends = {}
+        for gender, bands in (('male', MALE_BANDS), ('female', FEMALE_BANDS)):
+            rectangles = []
+            for low, high, color, label in bands:
+                rectangle = Rectangle((WEIGHTS[0], low), WEIGHTS[-1] - WEIGHTS[0], (high or low) - low,
+                                      color=color, alpha=0.3, label=label)
+                ax.add_patch(rectangle)
+                rectangles.append(rectangle)
+                if high is None:
+                    # Like fill_between in the app, the open-ended band runs up to the curve.
+                    self.open_bands[gender] = rectangle
+            self.bands[gender] = rectangles
+            # Opaque, so its pixels can be pasted back over the open-ended band.
+            legend = Legend(ax, [self.curve] + rectangles, ['Body Fat %'] + [label for *_, label in bands],
+                            loc='upper left', framealpha=1)
+            ax.add_artist(legend)
+            self.legends[gender] = legend
+        # matplotlib's default 5% margins, fixed so the chart backgrounds can be reused.
+        margin = 0.05 * (WEIGHTS[-1] - WEIGHTS[0])
+        ax.set_xlim(WEIGHTS[0] - margin, WEIGHTS[-1] + margin)
+        ax.set_title('Body Fat Percentage Categories')
+        ax.set_xlabel('Weight (kg)')
+        ax.set_ylabel('Body Fat %')
+        ax.grid(True)
+        self.marker = ax.scatter([np.nan], [np.nan], color='black', zorder=5)
+        self.label = ax.text(0, 0, '', fontsize=12, verticalalignment='bottom')
+
+        self.gender = None
+        self.limits = None
+        # Drawn before and after pasting the legend back, in the order a full draw stacks them.
+        self.below_legend = [*self.open_bands.values(), self.curve, self.label]
+        self.above_legend = [self.marker, self.subtitle, *self.values.values()]
+        for artist in self.below_legend + self.above_legend:
+            artist.set_animated(blit)
+        width, height = self.canvas.get_width_height()
+        split = round(height * self.SPLIT)
+        self._header_box = Bbox.from_extents(0, split, width, height)
+        self._chart_box = Bbox.from_extents(0, 0, width, split)
+        self._headers = {}
+        self._charts = {}
+
+    def update(self, person):
+        """Point the template's artists at ``person`` (a scored roster row)."""
+        gender, units = person['gender'], person['units']
+        weight_unit, length_unit = ('kg', 'cm') if units == 'metric' else ('lb', 'in')
+        bmi, bfp = person['bmi'], person['body_fat_percentage']
+        name = person.get('name')
+        self.subtitle.set_text(name if isinstance(name, str) and name else person['report'])
+        self.values['BMI'].set_text(f'{bmi:.2f}')
+        self.values['BMI category'].set_text(person['bmi_category'])
+        self.values['Body fat'].set_text(f'{bfp:.2f}%')
+        self.values['Percentiles (BMI / body fat)'].set_text(
+            f"{_number(person.get('bmi_percentile'), '.0f')} / {_number(person.get('body_fat_percentile'), '.0f')}")
+        self.values['Gender'].set_text(gender)
+        self.values['Weight'].set_text(_number(person['weight'], 'g', f' {weight_unit}'))
+        self.values['Height'].set_text(_number(person['height'], 'g', f' {length_unit}'))
+        self.values['Neck'].set_text(_number(person['neck'], 'g', f' {length_unit}'))
+        self.values['Waist'].set_text(_number(person['waist'], 'g', f' {length_unit}'))
+        self.values['Hip'].set_text(_number(person['hip'], 'g', f' {length_unit}') if gender == 'female' else '-')
+
+        name = SILHOUETTES[int(bmi_category_index(bmi))]
+        if name != self.silhouette_name:
+            image = self.figures[name]
+            self.silhouette.set_data(image)
+            self.silhouette.set_extent((-image.shape[1] / 2, image.shape[1] / 2, image.shape[0], 0))
+            self.silhouette_name = name
+
+        bfp_values = calculate_body_fat_percentage(
+            WEIGHTS, person['height'], person['neck'], person['waist'], person['hip'], gender, units)
+        self.curve.set_ydata(bfp_values)
+        if gender != self.gender:
+            for band_gender in self.bands:
+                for rectangle in self.bands[band_gender]:
+                    rectangle.set_visible(band_gender == gender)
+                self.legends[band_gender].set_visible(band_gender == gender)
+            self.gender = gender
+        open_band = self.open_bands[gender]
+        open_band.set_height(np.nanmax(bfp_values) - open_band.get_y())
+        limits = chart_limits(bfp, MALE_BANDS if gender == 'male' else FEMALE_BANDS)
+        if limits != self.limits:
+            self.axes.set_ylim(*limits)
+            self.limits = limits
+        self.marker.set_offsets([[person['weight'], bfp]])
+        self.label.set_position((person['weight'], bfp))
+        self.label.set_text(f' {bfp}%')
+
+    def render(self):
+        """RGBA buffer of the page; without ``blit`` every artist is redrawn."""
+        if not self.blit:
+            self.canvas.draw()
+            return np.asarray(self.canvas.buffer_rgba())
+        chart_key = (self.gender, self.limits)
+        if self.silhouette_name not in self._headers or chart_key not in self._charts:
+            self.canvas.draw()
+            self._headers.setdefault(self.silhouette_name, self.canvas.copy_from_bbox(self._header_box))
+            legend = self.legends[self.gender].get_window_extent()
+            self._charts.setdefault(chart_key, (self.canvas.copy_from_bbox(self._chart_box),
+                                                self.canvas.copy_from_bbox(legend)))
+        chart, legend = self._charts[chart_key]
+        self.canvas.restore_region(self._headers[self.silhouette_name])
+        self.canvas.restore_region(chart)
+        self._draw(self.below_legend)
+        self.canvas.restore_region(legend)
+        self._draw(self.above_legend)
+        return np.asarray(self.canvas.buffer_rgba())
+
+    def _draw(self, artists):
+        for artist in artists:
+            if artist.get_visible():
+                self.figure.draw_artist(artist)
+
+    def save(self, path, fmt):
+        tmp_path = f'{path}.{os.getpid()}.tmp'
+        if fmt == 'png':
+            from PIL import Image
+
+            Image.fromarray(self.render()).convert('RGB').save(tmp_path, format='png', compress_level=1)
+        else:
+            self.figure.savefig(tmp_path, format=fmt)
+        os.replace(tmp_path, path)
+
+
+_template = None
+
+
+def _init_worker(figures, fmt):
+    global _template
+    # PDF pages stay vector, so only PNG reports are blitted.
+    _template = _ReportTemplate(figures, blit=fmt == 'png')
+
+
+def render_chunk(frame, out_dir, fmt):
+    """Score ``frame`` and write one report per valid row; returns ``(written, [(report, error), ...])``."""
+    scored = score_chunk(frame)
+    written = 0
+    failed = []
+    for person in scored.to_dict('records'):
+        if person['error']:
+            failed.append((person['report'], person['error']))
+            continue
+        _template.update(person)
+        _template.save(os.path.join(out_dir, f"{person['report']}.{fmt}"), fmt)
+        written += 1
+    return written, failed
+
+
+def _pending_rows(roster, out_dir, fmt, chunk_size, errors_path):
+    """Roster chunks with a ``report`` name column, minus rows already rendered or listed in ``errors_path``.
+
+    Yields ``(chunk, skipped)``.
+    """
+    done = {os.path.splitext(name)[0] for name in os.listdir(out_dir) if name.endswith(f'.{fmt}')}
+    if os.path.exists(errors_path):
+        with open(errors_path, newline='') as f:
+            done.update(row['report'] for row in csv.DictReader(f))
+    row = 0
+    for chunk in read_chunks(roster, chunk_size):
+        ids = chunk['id'] if 'id' in chunk else [f'{i:06d}' for i in range(row, row + len(chunk))]
+        chunk = chunk.assign(report=[report_name(value) for value in ids])
+        row += len(chunk)
+        todo = ~chunk['report'].isin(done)
+        yield chunk[todo], int((~todo).sum())
+
+
+def run(roster, out_dir, fmt='png', chunk_size=200, workers=None, log=sys.stderr):
+    if fmt not in FORMATS:
+        raise ValueError(f'format must be one of {", ".join(FORMATS)}')
+    workers = workers or os.cpu_count() or 1
+    os.makedirs(out_dir, exist_ok=True)
+    errors_path = os.path.join(out_dir, 'errors.csv')
+    written = skipped = failed = 0
+    started = time.perf_counter()
+    figures = silhouettes()
+
+    def record(result):
+        nonlocal written, failed
+        count, errors = result
+        written += count
+        failed += len(errors)
+        if errors:
+            new_file = not os.path.exists(errors_path)
+            with open(errors_path, 'a', newline='') as f:
+                writer = csv.writer(f)
+                if new_file:
+                    writer.writerow(['report', 'error'])
+                writer.writerows(errors)
+        elapsed = time.perf_counter() - started
+        print(f'{written:,} written, {skipped:,} already done, {failed:,} failed, '
+              f'{written / elapsed:,.1f} reports/s', file=log)
+
+    if workers == 1:
+        _init_worker(figures, fmt)
+        for chunk, already_done in _pending_rows(roster, out_dir, fmt, chunk_size, errors_path):
+            skipped += already_done
+            if len(chunk):
+                record(render_chunk(chunk, out_dir, fmt))
+    else:
+        # Like batch_score, at most two chunks per worker are in flight. Each
+        # worker builds its page template once, in the initializer.
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(figures, fmt)) as pool:
+            pending = collections.deque()
+            for chunk, already_done in _pending_rows(roster, out_dir, fmt, chunk_size, errors_path):
+                skipped += already_done
+                if len(chunk):
+                    pending.append(pool.submit(render_chunk, chunk, out_dir, fmt))
+                if len(pending) >= 2 * workers:
+                    record(pending.popleft().result())
+            while pending:
+                record(pending.popleft().result())
+
+    elapsed = time.perf_counter() - started
+    print(f'Done: {written:,} reports ({skipped:,} already done, {failed:,} failed) in {elapsed:.2f}s, '
+          f'{written / max(elapsed, 1e-9):,.1f} reports/s', file=log)
+    return written, skipped, failed
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Render one report per person in a roster.')
+    parser.add_argument('roster', help='roster .csv or .parquet file')
+    parser.add_argument('output', help='directory for the reports')
+    parser.add_argument('--format', choices=FORMATS, default='png', help='report format (default: png)')
+    parser.add_argument('--chunk-size', type=int, default=200, help='rows per worker task (default: 200)')
+    parser.add_argument('--workers', type=int, default=None, help='worker processes (default: CPU count)')
+    args = parser.parse_args(argv)
+    run(args.roster, args.output, args.format, args.chunk_size, args.workers)
+
+
+if __name__ == '__main__':
+    main()
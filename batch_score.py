@@ -0,0 +1,175 @@
+"""Score a CSV or Parquet file of people in bounded-memory chunks.
+
+    python batch_score.py people.csv scores.parquet --chunk-size 200000 --workers 8
+
+Input columns: weight, height, neck, waist, hip, gender, units, and
+optionally age for population percentiles (see ``percentiles.py``). Rows that
+cannot be scored keep their place in the output with empty metrics and a
+reason in the ``error`` column.
+"""
+import argparse
+import collections
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from body_composition import calculate_bmi, calculate_body_fat_percentage, get_bmi_category
+from percentiles import percentiles
+
+NUMERIC_COLUMNS = ['weight', 'height', 'neck', 'waist', 'hip']
+INPUT_COLUMNS = NUMERIC_COLUMNS + ['gender', 'units']
+GENDERS = ('male', 'female')
+UNITS = ('metric', 'imperial')
+
+
+def _is_parquet(path):
+    return path.lower().endswith(('.parquet', '.pq'))
+
+
+def read_chunks(path, chunk_size):
+    if _is_parquet(path):
+        import pyarrow.parquet as pq
+
+        for batch in pq.ParquetFile(path).iter_batches(batch_size=chunk_size):
+            yield batch.to_pandas()
+    else:
+        # Everything is read as text, so pass-through columns cannot change type from one
+        # chunk to the next; score_chunk converts the inputs it needs to numbers.
+        yield from pd.read_csv(path, chunksize=chunk_size, dtype=str)
+
+
+class ChunkWriter:
+    def __init__(self, path):
+        self.path = path
+        self._parquet_writer = None
+        self._wrote_header = False
+
+    def write(self, frame):
+        if _is_parquet(self.path):
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+
+            table = pa.Table.from_pandas(frame, preserve_index=False)
+            if self._parquet_writer is None:
+                self._parquet_writer = pq.ParquetWriter(self.path, table.schema)
+            self._parquet_writer.write_table(table)
+        else:
+            frame.to_csv(self.path, mode='a' if self._wrote_header else 'w', header=not self._wrote_header, index=False)
+            self._wrote_header = True
+
+    def close(self):
+        if self._parquet_writer is not None:
+            self._parquet_writer.close()
+
+
+def _validate(frame):
+    error = pd.Series('', index=frame.index, dtype=object)
+
+    def flag(mask, reason):
+        error[mask & (error == '')] = reason
+
+    for column in NUMERIC_COLUMNS:
+        if column != 'hip':
+            flag(frame[column].isna(), f'missing or non-numeric {column}')
+    flag(~frame['gender'].isin(GENDERS), 'gender must be male or female')
+    flag(~frame['units'].isin(UNITS), 'units must be metric or imperial')
+    flag((frame['weight'] <= 0) | (frame['height'] <= 0), 'weight and height must be positive')
+    # A missing hip compares False here; it only matters for women, checked below.
+    flag((frame['neck'] <= 0) | (frame['waist'] <= 0) | (frame['hip'] <= 0), 'circumferences must be positive')
+    flag((frame['gender'] == 'female') & frame['hip'].isna(), 'missing or non-numeric hip')
+    return error
+
+
+def score_chunk(frame):
+    frame = frame.copy()
+    for column in INPUT_COLUMNS:
+        if column not in frame:
+            frame[column] = 'metric' if column == 'units' else np.nan
+    # Always float64, so every chunk of a Parquet output has the same schema.
+    for column in NUMERIC_COLUMNS:
+        frame[column] = pd.to_numeric(frame[column], errors='coerce').astype(float)
+    for column in ('gender', 'units'):
+        frame[column] = frame[column].astype(str).str.strip().str.lower()
+    # Text pass-through columns are typed as strings even when a chunk has only blanks.
+    for column in frame.columns.difference(INPUT_COLUMNS + ['age']):
+        if frame[column].dtype == object or isinstance(frame[column].dtype, pd.StringDtype):
+            frame[column] = frame[column].astype('string')
+
+    error = _validate(frame)
+    valid = (error == '').to_numpy()
+    values = {column: frame[column].to_numpy(dtype=float) for column in NUMERIC_COLUMNS}
+    gender = frame['gender'].to_numpy()
+    units = frame['units'].to_numpy()
+
+    bmi = np.where(valid, calculate_bmi(values['weight'], values['height'], units), np.nan)
+    bfp = np.where(valid, calculate_body_fat_percentage(
+        values['weight'], values['height'], values['neck'], values['waist'], values['hip'], gender, units), np.nan)
+    category = np.where(valid, get_bmi_category(bmi)[0], '')
+
+    error[valid & np.isnan(bfp)] = 'circumferences give a non-positive log argument'
+    frame['bmi'] = np.round(bmi, 2)
+    frame['body_fat_percentage'] = bfp
+    frame['bmi_category'] = category
+    if 'age' in frame:
+        frame['age'] = pd.to_numeric(frame['age'], errors='coerce').astype(float)
+        age = frame['age'].to_numpy()
+        frame['bmi_percentile'] = np.round(percentiles(bmi, gender, age, 'bmi'), 1)
+        frame['body_fat_percentile'] = np.round(percentiles(bfp, gender, age, 'body_fat_percentage'), 1)
+    frame['error'] = error
+    return frame
+
+
+def run(input_path, output_path, chunk_size=100_000, workers=None, log=sys.stderr):
+    workers = workers or os.cpu_count() or 1
+    writer = ChunkWriter(output_path)
+    rows = bad_rows = 0
+    started = time.perf_counter()
+
+    def write(frame):
+        nonlocal rows, bad_rows
+        writer.write(frame)
+        rows += len(frame)
+        bad_rows += int((frame['error'] != '').sum())
+        elapsed = time.perf_counter() - started
+        print(f'{rows:,} rows, {bad_rows:,} bad, {rows / elapsed:,.0f} rows/s', file=log)
+
+    try:
+        if workers == 1:
+            for chunk in read_chunks(input_path, chunk_size):
+                write(score_chunk(chunk))
+        else:
+            # At most two chunks per worker are in flight, so memory is bounded
+            # by chunk_size regardless of the input size; results are written
+            # in input order.
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                pending = collections.deque()
+                for chunk in read_chunks(input_path, chunk_size):
+                    pending.append(pool.submit(score_chunk, chunk))
+                    if len(pending) >= 2 * workers:
+                        write(pending.popleft().result())
+                while pending:
+                    write(pending.popleft().result())
+    finally:
+        writer.close()
+
+    elapsed = time.perf_counter() - started
+    print(f'Done: {rows:,} rows ({bad_rows:,} bad) in {elapsed:.2f}s, {rows / max(elapsed, 1e-9):,.0f} rows/s', file=log)
+    return rows, bad_rows
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Batch BMI / body-fat scoring for CSV or Parquet files.')
+    parser.add_argument('input', help='input .csv or .parquet file')
+    parser.add_argument('output', help='output .csv or .parquet file')
+    parser.add_argument('--chunk-size', type=int, default=100_000, help='rows per chunk (default: 100000)')
+    parser.add_argument('--workers', type=int, default=None, help='worker processes (default: CPU count)')
+    args = parser.parse_args(argv)
+    run(args.input, args.output, args.chunk_size, args.workers)
+
+
+if __name__ == '__main__':
+    main()
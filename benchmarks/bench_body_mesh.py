@@ -0,0 +1,28 @@
+"""Triangle count, Plotly JSON size and build time of body_mesh per level of detail.
+
+    python benchmarks/bench_body_mesh.py
+"""
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import body_mesh  # noqa: E402
+
+
+def per_call_ms(stmt, number):
+    return min(timeit.repeat(stmt, number=number, repeat=5)) / number * 1000
+
+
+def main():
+    print(f'{"lod":<8} {"triangles":>10} {"json KB":>9} {"vertices ms":>12} {"figure ms":>10}')
+    for lod in body_mesh.LEVELS_OF_DETAIL:
+        _, stats = body_mesh.body_mesh_figure(70, 170, 40, 80, 100, lod=lod)
+        vertices_ms = per_call_ms(lambda: body_mesh.body_vertices(70, 170, 40, 80, 100, lod=lod), 200)
+        figure_ms = per_call_ms(lambda: body_mesh.body_mesh_figure(70, 170, 40, 80, 100, lod=lod), 5)
+        print(f'{lod:<8} {stats["triangles"]:>10,} {body_mesh.payload_bytes(lod) / 1024:>9.1f} {vertices_ms:>12.3f} {figure_ms:>10.1f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,83 @@
+"""Cold-start time-to-first-render and peak RSS for each page.
+
+    python benchmarks/bench_cold_start.py [--runs 3] [--update-budget]
+
+Every measurement runs in a fresh interpreter. ``first_render_ms`` is the
+first AppTest run of the page (page imports plus the initial render, before
+"Calculate"); ``peak_rss_mb`` is the child's peak resident set size. Exits
+non-zero when a page exceeds ``cold_start_budget.json``; ``--update-budget``
+rewrites the budget from the current medians plus headroom.
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BUDGET_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'cold_start_budget.json')
+PAGES = ['streamlit_app.py', 'pages/alt.py', 'pages/shapes.py', 'pages/SVG Body.py']
+HEADROOM = 1.5
+
+CHILD = r'''
+import json, resource, sys, time
+sys.path.insert(0, sys.argv[1])
+from streamlit.testing.v1 import AppTest
+at = AppTest.from_file(sys.argv[2], default_timeout=120)
+started = time.perf_counter()
+at.run()
+elapsed = time.perf_counter() - started
+if at.exception:
+    sys.exit(f'{sys.argv[2]} raised: {at.exception[0].value}')
+print(json.dumps({
+    'first_render_ms': elapsed * 1000,
+    'peak_rss_mb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+}))
+'''
+
+
+def measure(page, runs):
+    samples = []
+    for _ in range(runs):
+        out = subprocess.run([sys.executable, '-c', CHILD, ROOT, os.path.join(ROOT, page)],
+                             capture_output=True, text=True, check=True)
+        samples.append(json.loads(out.stdout.strip().splitlines()[-1]))
+    return {key: statistics.median(s[key] for s in samples) for key in samples[0]}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--runs', type=int, default=3)
+    parser.add_argument('--update-budget', action='store_true')
+    args = parser.parse_args(argv)
+
+    budget = {}
+    if os.path.exists(BUDGET_PATH):
+        with open(BUDGET_PATH) as f:
+            budget = json.load(f)
+
+    results = {page: measure(page, args.runs) for page in PAGES}
+    failures = []
+    print(f'{"page":<20} {"first render ms":>16} {"budget":>8} {"peak RSS MB":>12} {"budget":>8}')
+    for page, result in results.items():
+        limits = budget.get(page, {})
+        print(f'{page:<20} {result["first_render_ms"]:>16.0f} {limits.get("first_render_ms", "-"):>8} '
+              f'{result["peak_rss_mb"]:>12.1f} {limits.get("peak_rss_mb", "-"):>8}')
+        failures += [f'{page}: {key} {result[key]:.1f} > {limit}' for key, limit in limits.items() if result[key] > limit]
+
+    if args.update_budget:
+        budget = {page: {key: round(value * HEADROOM) for key, value in result.items()} for page, result in results.items()}
+        with open(BUDGET_PATH, 'w') as f:
+            json.dump(budget, f, indent=2)
+            f.write('\n')
+        print(f'Wrote {BUDGET_PATH}')
+        return 0
+
+    for failure in failures:
+        print(f'FAIL: {failure}', file=sys.stderr)
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,236 @@
+"""Benchmark suite: compute, rendering, payload sizes and page reruns.
+
+    python benchmarks/bench_suite.py                       # writes benchmarks/results/<timestamp>.json
+    python benchmarks/bench_suite.py --baseline old.json   # also flags regressions against a previous run
+
+Every metric is lower-is-better (times and bytes). With ``--baseline`` a
+metric regresses when it grows by more than ``--threshold`` (default 25%),
+and the script exits non-zero.
+"""
+import argparse
+import datetime
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import timeit
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import numpy as np  # noqa: E402
+
+import body_composition  # noqa: E402
+import body_fat_chart  # noqa: E402
+import body_mesh  # noqa: E402
+import svg_morph  # noqa: E402
+
+RESULTS_DIR = os.path.join(ROOT, 'benchmarks', 'results')
+PAGES = ['streamlit_app.py', 'pages/alt.py', 'pages/shapes.py', 'pages/SVG Body.py']
+BATCH_ROWS = 1_000_000
+
+
+def per_call(stmt, number, repeat=5):
+    return min(timeit.repeat(stmt, number=number, repeat=repeat)) / number
+
+
+def wall(fn):
+    started = time.perf_counter()
+    fn()
+    return time.perf_counter() - started
+
+
+def bench_compute(metrics):
+    metrics['compute.bmi_scalar_us'] = per_call(lambda: body_composition.calculate_bmi(70.0, 170.0), 20000) * 1e6
+    metrics['compute.bfp_scalar_us'] = per_call(
+        lambda: body_composition.calculate_body_fat_percentage(70.0, 170.0, 40.0, 80.0, None, 'male'), 5000) * 1e6
+
+    rng = np.random.default_rng(0)
+    weight = rng.uniform(40, 150, BATCH_ROWS)
+    height = rng.uniform(140, 200, BATCH_ROWS)
+    neck = rng.uniform(30, 45, BATCH_ROWS)
+    waist = rng.uniform(60, 120, BATCH_ROWS)
+    hip = rng.uniform(80, 130, BATCH_ROWS)
+    gender = rng.choice(['male', 'female'], BATCH_ROWS)
+    metrics['compute.bmi_batch_1m_ms'] = per_call(lambda: body_composition.calculate_bmi(weight, height), 1) * 1e3
+    metrics['compute.bfp_batch_1m_ms'] = per_call(
+        lambda: body_composition.calculate_body_fat_percentage(weight, height, neck, waist, hip, gender), 1) * 1e3
+    metrics['compute.category_batch_1m_ms'] = per_call(
+        lambda: body_composition.get_bmi_category(weight / (height / 100) ** 2), 1) * 1e3
+
+
+def bench_rendering(metrics):
+    args = (170.0, 40.0, 80.0, None, 'male', 70.0, 16.2)
+    body_fat_chart.cache_clear()
+    metrics['render.body_fat_chart_cold_ms'] = wall(lambda: body_fat_chart.render_body_fat_chart(*args)) * 1e3
+    metrics['render.body_fat_chart_warm_ms'] = per_call(lambda: body_fat_chart.render_body_fat_chart(*args), 20) * 1e3
+    metrics['render.body_fat_chart_png_ms'] = per_call(lambda: body_fat_chart.render_body_fat_chart_png(*args), 10) * 1e3
+
+    for lod in body_mesh.LEVELS_OF_DETAIL:
+        body_mesh.body_mesh_figure(70, 170, 40, 80, None, lod=lod)
+        metrics[f'render.body_mesh_{lod}_ms'] = per_call(
+            lambda: body_mesh.body_mesh_figure(70, 170, 40, 80, None, lod=lod), 5) * 1e3
+        metrics[f'payload.body_mesh_{lod}_bytes'] = body_mesh.payload_bytes(lod)
+
+    uncached = svg_morph._body_svg.__wrapped__
+    metrics['render.svg_morph_uncached_us'] = per_call(lambda: uncached(24.0, 0.47, 0.58), 500) * 1e6
+    metrics['render.svg_morph_cached_us'] = per_call(lambda: svg_morph.body_svg(24.0, 80, 100, 170), 20000) * 1e6
+    metrics['payload.svg_morph_bytes'] = len(svg_morph.body_svg(24.0, 80, 100, 170))
+
+
+# Page reruns run in a fresh interpreter each, so one page's caches and
+# imports do not leak into the next measurement.
+PAGE_CHILD = r'''
+import json, sys, time
+sys.path.insert(0, sys.argv[1])
+import streamlit.testing.v1.app_test as app_test
+from streamlit.testing.v1 import AppTest
+
+# AppTest builds a fresh in-memory media store per run; keep hold of it to size st.image files.
+media_stores = []
+
+
+class RecordingMediaFileStorage(app_test.MemoryMediaFileStorage):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        media_stores.append(self)
+
+
+app_test.MemoryMediaFileStorage = RecordingMediaFileStorage
+
+
+def leaves(node):
+    children = getattr(node, 'children', None)
+    if isinstance(children, dict):
+        for child in children.values():
+            yield from leaves(child)
+    else:
+        yield node
+
+
+def payload_bytes(at):
+    """Serialized element protos plus media files (e.g. st.image PNGs) of the last run."""
+    storage = media_stores[-1]
+    total = 0
+    for element in leaves(at._tree):
+        proto = getattr(element, 'proto', None)
+        if proto is None:
+            continue
+        total += proto.ByteSize()
+        for image in getattr(proto, 'imgs', []):
+            if image.url.startswith('/mock/media/'):
+                total += storage.get_file(image.url.rsplit('/', 1)[1]).content_size
+    return total
+
+
+def timed(fn):
+    started = time.perf_counter()
+    fn()
+    return (time.perf_counter() - started) * 1000
+
+
+at = AppTest.from_file(sys.argv[2], default_timeout=120)
+result = {'first_run_ms': timed(at.run)}
+calculate = next(b for b in at.sidebar.button if b.label == 'Calculate')
+result['calculate_ms'] = timed(lambda: calculate.click().run())
+result['calculate_bytes'] = payload_bytes(at)
+weight = next(s for s in at.sidebar.slider if s.label.startswith('Weight'))
+weight.set_value(weight.value + 5)
+result['calculate_changed_ms'] = timed(lambda: next(b for b in at.sidebar.button if b.label == 'Calculate').click().run())
+result['calculate_repeat_ms'] = timed(lambda: next(b for b in at.sidebar.button if b.label == 'Calculate').click().run())
+if at.exception:
+    sys.exit(f'{sys.argv[2]} raised: {at.exception[0].value}')
+print(json.dumps(result))
+'''
+
+
+def bench_pages(metrics, runs):
+    for page in PAGES:
+        samples = []
+        for _ in range(runs):
+            # A fresh history database per run keeps the benchmark out of data/ and its reads constant.
+            with tempfile.TemporaryDirectory() as tmp:
+                env = dict(os.environ, BMI_HISTORY_DB=os.path.join(tmp, 'history.sqlite3'))
+                out = subprocess.run([sys.executable, '-c', PAGE_CHILD, ROOT, os.path.join(ROOT, page)],
+                                     capture_output=True, text=True, check=True, env=env)
+            samples.append(json.loads(out.stdout.strip().splitlines()[-1]))
+        name = os.path.splitext(os.path.basename(page))[0].replace(' ', '_').lower()
+        for key in samples[0]:
+            prefix = 'payload' if key.endswith('_bytes') else 'rerun'
+            metrics[f'{prefix}.{name}.{key}'] = statistics.median(s[key] for s in samples)
+
+
+def git_revision():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT, capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(metrics, baseline, threshold):
+    regressions = []
+    for key, value in sorted(metrics.items()):
+        old = baseline.get(key)
+        if not old:
+            continue
+        ratio = value / old
+        flag = 'REGRESSION' if ratio > 1 + threshold else ''
+        print(f'{key:<48} {old:>14.3f} -> {value:>14.3f} {ratio:>7.2f}x {flag}')
+        if flag:
+            regressions.append(key)
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--output', help='results file (default: benchmarks/results/<timestamp>.json)')
+    parser.add_argument('--baseline', help='previous results file to compare against')
+    parser.add_argument('--threshold', type=float, default=0.25, help='allowed relative growth (default: 0.25)')
+    parser.add_argument('--page-runs', type=int, default=3, help='fresh-process runs per page (default: 3)')
+    parser.add_argument('--skip-pages', action='store_true', help='skip the AppTest page reruns')
+    args = parser.parse_args(argv)
+
+    metrics = {}
+    bench_compute(metrics)
+    bench_rendering(metrics)
+    if not args.skip_pages:
+        bench_pages(metrics, args.page_runs)
+
+    now = datetime.datetime.now(datetime.timezone.utc)
+    results = {
+        'meta': {
+            'timestamp': now.isoformat(timespec='seconds'),
+            'git_revision': git_revision(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'numpy': np.__version__,
+        },
+        'metrics': metrics,
+    }
+    output = args.output or os.path.join(RESULTS_DIR, now.strftime('%Y%m%dT%H%M%SZ') + '.json')
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, 'w') as f:
+        json.dump(results, f, indent=2, sort_keys=True)
+        f.write('\n')
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            regressions = compare(metrics, json.load(f)['metrics'], args.threshold)
+    else:
+        for key, value in sorted(metrics.items()):
+            print(f'{key:<48} {value:>14.3f}')
+        regressions = []
+    print(f'Wrote {output}')
+
+    for key in regressions:
+        print(f'FAIL: {key} regressed by more than {args.threshold:.0%}', file=sys.stderr)
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,45 @@
+"""Per-call cost of svg_morph, uncached and cached.
+
+    python benchmarks/bench_svg_morph.py [--budget-ms 1.0]
+
+Exits non-zero when an uncached morph exceeds the budget.
+"""
+import argparse
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np  # noqa: E402
+
+import svg_morph  # noqa: E402
+
+
+def per_call_ms(stmt, number):
+    return min(timeit.repeat(stmt, number=number, repeat=5)) / number * 1000
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--budget-ms', type=float, default=1.0)
+    args = parser.parse_args(argv)
+
+    bmis = iter(np.random.default_rng(0).uniform(15, 35, 1_000_000))
+    uncached = svg_morph._body_svg.__wrapped__
+    results = {
+        'morph_vertices': per_call_ms(lambda: svg_morph.morph_vertices(next(bmis), 1.1, 0.9), 2000),
+        'body_svg (uncached)': per_call_ms(lambda: uncached(next(bmis), 0.47, 0.58), 2000),
+        'body_svg (cached)': per_call_ms(lambda: svg_morph.body_svg(24.0, 80, 100, 170), 20000),
+    }
+    for name, ms in results.items():
+        print(f'{name:<22} {ms * 1000:8.1f} us/call')
+
+    if results['body_svg (uncached)'] > args.budget_ms:
+        print(f'FAIL: uncached morph exceeds {args.budget_ms} ms budget', file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,157 @@
+"""Load generator for score_service.py: micro-batched vs one request per scoring call.
+
+    python benchmarks/load_service.py --connections 64 --duration 5
+
+Starts the service twice on a local port, once with ``--max-batch 1`` (every
+request scored on its own) and once with micro-batching, drives each with
+keep-alive connections from ``--client-procs`` processes, and prints
+throughput, client-side p50/p99 latency and the server's own /stats.
+"""
+import argparse
+import asyncio
+import json
+import multiprocessing
+import os
+import random
+import socket
+import subprocess
+import sys
+import time
+
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _request(person, host):
+    body = json.dumps(person).encode()
+    return (f'POST /score HTTP/1.1\r\nHost: {host}\r\nContent-Type: application/json\r\n'
+            f'Content-Length: {len(body)}\r\n\r\n').encode() + body
+
+
+def _people(count, seed):
+    rng = random.Random(seed)
+    people = []
+    for _ in range(count):
+        gender = rng.choice(('male', 'female'))
+        person = {'weight': round(rng.uniform(45, 120), 1), 'height': round(rng.uniform(150, 200), 1),
+                  'neck': round(rng.uniform(30, 45), 1), 'waist': round(rng.uniform(65, 115), 1), 'gender': gender}
+        if gender == 'female':
+            person['hip'] = round(rng.uniform(85, 125), 1)
+        people.append(person)
+    return people
+
+
+async def _read_response(reader):
+    length = 0
+    while True:
+        line = await reader.readuntil(b'\r\n')
+        if line == b'\r\n':
+            break
+        if line[:15].lower() == b'content-length:':
+            length = int(line[15:])
+    return await reader.readexactly(length)
+
+
+async def _connection(host, port, requests, deadline, latencies):
+    reader, writer = await asyncio.open_connection(host, port)
+    i = 0
+    while time.perf_counter() < deadline:
+        started = time.perf_counter()
+        writer.write(requests[i % len(requests)])
+        await _read_response(reader)
+        latencies.append(time.perf_counter() - started)
+        i += 1
+    writer.close()
+
+
+async def _drive(host, port, connections, duration, seed):
+    requests = [_request(person, host) for person in _people(1000, seed)]
+    latencies = []
+    deadline = time.perf_counter() + duration
+    await asyncio.gather(*(_connection(host, port, requests, deadline, latencies) for _ in range(connections)))
+    return latencies
+
+
+def _client(args):
+    host, port, connections, duration, seed = args
+    return asyncio.run(_drive(host, port, connections, duration, seed))
+
+
+def _free_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def _wait_for_port(port, timeout=10):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            socket.create_connection(('127.0.0.1', port), timeout=0.2).close()
+            return
+        except OSError:
+            time.sleep(0.05)
+    raise RuntimeError(f'service did not start on port {port}')
+
+
+def _stats(port):
+    with socket.create_connection(('127.0.0.1', port)) as sock:
+        sock.sendall(b'GET /stats HTTP/1.1\r\nHost: localhost\r\nConnection: close\r\n\r\n')
+        data = b''
+        while chunk := sock.recv(65536):
+            data += chunk
+    return json.loads(data.split(b'\r\n\r\n', 1)[1])
+
+
+def run_case(name, server_args, connections, duration, client_procs):
+    port = _free_port()
+    server = subprocess.Popen([sys.executable, os.path.join(ROOT, 'score_service.py'), '--port', str(port),
+                               *server_args], cwd=ROOT, stderr=subprocess.DEVNULL)
+    try:
+        _wait_for_port(port)
+        per_proc = max(connections // client_procs, 1)
+        with multiprocessing.Pool(client_procs) as pool:
+            started = time.perf_counter()
+            samples = pool.map(_client, [('127.0.0.1', port, per_proc, duration, seed) for seed in range(client_procs)])
+            elapsed = time.perf_counter() - started
+        stats = _stats(port)
+    finally:
+        server.terminate()
+        server.wait()
+    latencies = np.concatenate([np.asarray(s) for s in samples]) * 1000
+    return {
+        'case': name,
+        'requests': len(latencies),
+        'rps': len(latencies) / elapsed,
+        'p50_ms': float(np.percentile(latencies, 50)),
+        'p99_ms': float(np.percentile(latencies, 99)),
+        'server_p50_ms': stats['latency_ms']['p50'],
+        'server_p99_ms': stats['latency_ms']['p99'],
+        'mean_batch_size': stats['mean_batch_size'],
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--connections', type=int, default=64, help='keep-alive connections in total (default: 64)')
+    parser.add_argument('--duration', type=float, default=5.0, help='seconds per case (default: 5)')
+    parser.add_argument('--client-procs', type=int, default=2, help='client processes (default: 2)')
+    parser.add_argument('--max-wait-ms', type=float, default=2.0, help='batching window of the batched case')
+    args = parser.parse_args(argv)
+
+    results = [
+        run_case('one per call', ['--max-batch', '1'], args.connections, args.duration, args.client_procs),
+        run_case('micro-batched', ['--max-wait-ms', str(args.max_wait_ms)], args.connections, args.duration,
+                 args.client_procs),
+    ]
+    print(f'{"case":<14} {"requests":>9} {"req/s":>9} {"p50 ms":>8} {"p99 ms":>8} '
+          f'{"srv p50":>8} {"srv p99":>8} {"batch":>6}')
+    for r in results:
+        print(f'{r["case"]:<14} {r["requests"]:>9,} {r["rps"]:>9,.0f} {r["p50_ms"]:>8.2f} {r["p99_ms"]:>8.2f} '
+              f'{r["server_p50_ms"]:>8.2f} {r["server_p99_ms"]:>8.2f} {r["mean_batch_size"]:>6.1f}')
+    print(f'Throughput gain: {results[1]["rps"] / results[0]["rps"]:.2f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,38 @@
+"""Persistent canvas component for the body-shape pages.
+
+The renderer in ``frontend/body_canvas/index.html`` is loaded once per
+iframe. On later reruns Streamlit keeps the iframe and only posts the new
+numeric arguments, which the canvas redraws in place on the next animation
+frame.
+"""
+import os
+
+import streamlit.components.v1 as components
+
+_component = components.declare_component(
+    'body_canvas',
+    path=os.path.join(os.path.dirname(os.path.abspath(__file__)), 'frontend', 'body_canvas'),
+)
+
+# variant -> (canvas width, canvas height, iframe height)
+VARIANTS = {
+    'simple': (400, 800, 800),
+    'gendered': (550, 670, 700),
+}
+
+
+def body_canvas(bmi, weight, height, gender='male', color='lightgray', variant='gendered', key=None):
+    width, canvas_height, frame_height = VARIANTS[variant]
+    return _component(
+        variant=variant,
+        bmi=round(float(bmi), 2),
+        weight=float(weight),
+        height=float(height),
+        gender=gender,
+        color=color,
+        width=width,
+        canvas_height=canvas_height,
+        frame_height=frame_height,
+        key=key,
+        default=None,
+    )
@@ -0,0 +1,66 @@
+from lazy_import import lazy_import
+
+np = lazy_import('numpy')
+
+LB_TO_KG = 0.453592
+IN_TO_CM = 2.54
+
+BMI_BINS = (18.5, 25.0, 30.0)
+BMI_LABELS = ('underweight', 'normal weight', 'overweight', 'obese')
+BMI_COLORS = ('#ADD8E6', '#90EE90', '#FFD700', '#FF6347')
+
+# U.S. Navy circumference method: 495 / (a - b * log10(circumference) + c * log10(height)) - 450
+NAVY_MALE = (1.0324, 0.19077, 0.15456)
+NAVY_FEMALE = (1.29579, 0.35004, 0.22100)
+# Shown when calculate_body_fat_percentage returns NaN for valid-looking inputs.
+BODY_FAT_UNDEFINED = ('Body fat percentage is undefined for these measurements: the waist '
+                      '(plus the hip, for women) must be larger than the neck.')
+
+
+def _scalar_or_array(values):
+    return values.item() if np.ndim(values) == 0 else values
+
+
+def _unit_factors(units):
+    imperial = np.asarray(units) == 'imperial'
+    return np.where(imperial, LB_TO_KG, 1.0), np.where(imperial, IN_TO_CM, 1.0)
+
+
+def calculate_bmi(weight, height, units='metric'):
+    """BMI for scalars or arrays of any broadcastable shape."""
+    weight_factor, length_factor = _unit_factors(units)
+    weight = np.asarray(weight, dtype=float) * weight_factor
+    height = np.asarray(height, dtype=float) * length_factor
+    return _scalar_or_array(weight / (height / 100) ** 2)
+
+
+def calculate_body_fat_percentage(weight, height, neck, waist, hip, gender, units='metric'):
+    """Navy body-fat % for scalars or arrays; invalid measurements give NaN."""
+    _, length_factor = _unit_factors(units)
+    height = np.asarray(height, dtype=float) * length_factor
+    neck = np.asarray(neck, dtype=float) * length_factor
+    waist = np.asarray(waist, dtype=float) * length_factor
+    hip = np.asarray(np.nan if hip is None else hip, dtype=float) * length_factor
+
+    male = np.asarray(gender) == 'male'
+    a = np.where(male, NAVY_MALE[0], NAVY_FEMALE[0])
+    b = np.where(male, NAVY_MALE[1], NAVY_FEMALE[1])
+    c = np.where(male, NAVY_MALE[2], NAVY_FEMALE[2])
+    circumference = np.where(male, waist - neck, waist + hip - neck)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        circumference = np.where(circumference > 0, circumference, np.nan)
+        bfp = 495 / (a - b * np.log10(circumference) + c * np.log10(height)) - 450
+
+    # Weight does not enter the formula, but the result still broadcasts against it.
+    return _scalar_or_array(np.round(bfp, 2) + np.zeros(np.shape(weight)))
+
+
+def bmi_category_index(bmi):
+    """Index into BMI_LABELS / BMI_COLORS for each BMI value."""
+    return np.asarray(np.digitize(bmi, BMI_BINS))
+
+
+def get_bmi_category(bmi):
+    index = bmi_category_index(bmi)
+    return _scalar_or_array(np.asarray(BMI_LABELS)[index]), _scalar_or_array(np.asarray(BMI_COLORS)[index])
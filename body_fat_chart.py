@@ -0,0 +1,164 @@
+"""Body-fat category chart rendered on explicit Agg figures with an LRU cache.
+
+The expensive part of the chart (curve, category bands, legend, grid) only
+depends on the quantized body measurements, so it is drawn once per cache
+key and kept as a blitting background. Each request then restores that
+background and draws only the user's marker and label on top.
+"""
+import collections
+import io
+import threading
+
+from body_composition import calculate_body_fat_percentage
+from lazy_import import lazy_import
+
+np = lazy_import('numpy')
+
+FIGSIZE = (12, 6)
+DPI = 100
+QUANTUM = 0.5
+# The weight slider's range, so every marker lands inside the fixed template axes.
+WEIGHT_RANGE = (30.0, 150.0)
+
+MALE_BANDS = [
+    (0, 6, 'blue', 'Essential fat'),
+    (6, 14, 'green', 'Athletes'),
+    (14, 18, 'yellow', 'Fitness'),
+    (18, 25, 'orange', 'Average'),
+    (25, None, 'red', 'Obese'),
+]
+FEMALE_BANDS = [
+    (0, 13, 'blue', 'Essential fat'),
+    (13, 21, 'green', 'Athletes'),
+    (21, 25, 'yellow', 'Fitness'),
+    (25, 32, 'orange', 'Average'),
+    (32, None, 'red', 'Obese'),
+]
+
+CacheInfo = collections.namedtuple('CacheInfo', ['hits', 'misses', 'entries', 'bytes', 'max_bytes'])
+
+
+def _quantize(value):
+    return None if value is None else round(float(value) / QUANTUM) * QUANTUM
+
+
+def chart_key(height, neck, waist, hip, gender, units='metric'):
+    return (gender, units, _quantize(height), _quantize(neck), _quantize(waist), _quantize(hip if gender == 'female' else None))
+
+
+class _ChartTemplate:
+    def __init__(self, key):
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        from matplotlib.figure import Figure
+
+        gender, units, height, neck, waist, hip = key
+        weights = np.linspace(*WEIGHT_RANGE, 300)
+        bfp_values = calculate_body_fat_percentage(weights, height, neck, waist, hip, gender, units)
+
+        self.figure = Figure(figsize=FIGSIZE, dpi=DPI)
+        self.canvas = FigureCanvasAgg(self.figure)
+        self.axes = ax = self.figure.add_subplot()
+        ax.plot(weights, bfp_values, label='Body Fat %')
+        for low, high, color, label in MALE_BANDS if gender == 'male' else FEMALE_BANDS:
+            ax.fill_between(weights, low, np.nanmax(bfp_values) if high is None else high, color=color, alpha=0.3, label=label)
+        ax.set_title('Body Fat Percentage Categories')
+        ax.set_xlabel('Weight (kg)')
+        ax.set_ylabel('Body Fat %')
+        ax.legend(loc='upper left')
+        ax.grid(True)
+
+        # Animated artists are skipped by canvas.draw() and blitted per request.
+        self.marker = ax.scatter([np.nan], [np.nan], color='black', zorder=5, animated=True)
+        self.label = ax.text(0, 0, '', fontsize=12, verticalalignment='bottom', animated=True)
+        self.canvas.draw()
+        self.background = self.canvas.copy_from_bbox(self.figure.bbox)
+        self.lock = threading.Lock()
+
+    @property
+    def nbytes(self):
+        width, height = self.canvas.get_width_height()
+        # Agg render buffer plus the saved background.
+        return 2 * width * height * 4
+
+    def render(self, user_weight, user_bfp):
+        with self.lock:
+            self.canvas.restore_region(self.background)
+            self.marker.set_offsets([[user_weight, user_bfp]])
+            self.label.set_position((user_weight, user_bfp))
+            self.label.set_text(f' {user_bfp}%')
+            self.axes.draw_artist(self.marker)
+            self.axes.draw_artist(self.label)
+            rgba = np.asarray(self.canvas.buffer_rgba()).copy()
+        return rgba
+
+
+class ChartCache:
+    def __init__(self, max_bytes=64 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._entries = collections.OrderedDict()
+        self._bytes = 0
+        self._building = {}
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            template = self._entries.get(key)
+            if template is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return template
+            build_lock = self._building.setdefault(key, threading.Lock())
+
+        # Build outside the cache lock so other keys are not blocked, but only
+        # once per key when many sessions ask for the same chart at once.
+        with build_lock:
+            with self._lock:
+                template = self._entries.get(key)
+                if template is not None:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return template
+                self.misses += 1
+            try:
+                template = _ChartTemplate(key)
+                with self._lock:
+                    self._entries[key] = template
+                    self._bytes += template.nbytes
+                    while self._bytes > self.max_bytes and len(self._entries) > 1:
+                        _, evicted = self._entries.popitem(last=False)
+                        self._bytes -= evicted.nbytes
+            finally:
+                with self._lock:
+                    self._building.pop(key, None)
+        return template
+
+    def cache_info(self):
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, len(self._entries), self._bytes, self.max_bytes)
+
+    def cache_clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            self.hits = self.misses = 0
+
+
+_cache = ChartCache()
+cache_info = _cache.cache_info
+cache_clear = _cache.cache_clear
+
+
+def render_body_fat_chart(height, neck, waist, hip, gender, user_weight, user_bfp, units='metric'):
+    """RGBA array of the category chart with the user's marker drawn on top."""
+    template = _cache.get(chart_key(height, neck, waist, hip, gender, units))
+    return template.render(user_weight, user_bfp)
+
+
+def render_body_fat_chart_png(*args, **kwargs):
+    from PIL import Image
+
+    buffer = io.BytesIO()
+    Image.fromarray(render_body_fat_chart(*args, **kwargs)).save(buffer, format='png', compress_level=1)
+    return buffer.getvalue()
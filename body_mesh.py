@@ -0,0 +1,159 @@
+"""Procedural 3D body mesh built from elliptical cross-sections.
+
+The body is a stack of horizontal ellipses whose circumferences come from
+the user's neck, waist and hip measurements (plus a few proportions derived
+from height and BMI). Ring count and segments per ring are fixed by the
+level of detail, so the face indices and the unit-circle table are built
+once per LOD and cached; a new user only costs one outer product for the
+vertex positions.
+"""
+from __future__ import annotations
+
+import functools
+from dataclasses import dataclass
+
+from body_composition import IN_TO_CM, LB_TO_KG, calculate_bmi
+from lazy_import import lazy_import
+
+np = lazy_import('numpy')
+
+# LOD name -> (rings, segments per ring); triangles = 2 * segments * rings.
+LEVELS_OF_DETAIL = {
+    'low': (16, 16),
+    'medium': (52, 48),
+    'high': (157, 160),
+}
+
+# Fraction of height for each keyframe, from the soles to the top of the head.
+KEYFRAMES = (0.0, 0.04, 0.28, 0.45, 0.52, 0.62, 0.72, 0.80, 0.84, 0.87, 0.93, 0.985, 1.0)
+# Depth / width of the cross-section at each keyframe.
+ASPECT = (0.60, 0.60, 0.60, 0.62, 0.70, 0.75, 0.70, 0.45, 1.00, 1.00, 0.90, 0.90, 0.90)
+
+
+@dataclass(frozen=True)
+class MeshTopology:
+    rings: int
+    segments: int
+    levels: np.ndarray
+    cos: np.ndarray
+    sin: np.ndarray
+    i: np.ndarray
+    j: np.ndarray
+    k: np.ndarray
+
+    @property
+    def triangles(self):
+        return len(self.i)
+
+
+@functools.lru_cache(maxsize=None)
+def topology(lod='medium'):
+    rings, segments = LEVELS_OF_DETAIL[lod]
+    theta = np.linspace(0, 2 * np.pi, segments, endpoint=False)
+
+    # Quads between neighbouring rings, split into two triangles each.
+    ring = np.arange(rings - 1)[:, None] * segments
+    seg = np.arange(segments)[None, :]
+    a = ring + seg
+    b = ring + (seg + 1) % segments
+    c = a + segments
+    d = b + segments
+    side_i = np.concatenate([a.ravel(), b.ravel()])
+    side_j = np.concatenate([b.ravel(), d.ravel()])
+    side_k = np.concatenate([c.ravel(), c.ravel()])
+
+    # Fans to a centre vertex at the bottom and top of the stack.
+    bottom, top = rings * segments, rings * segments + 1
+    seg = seg.ravel()
+    cap_i = np.concatenate([np.full(segments, bottom), np.full(segments, top)])
+    cap_j = np.concatenate([(seg + 1) % segments, (rings - 1) * segments + seg])
+    cap_k = np.concatenate([seg, (rings - 1) * segments + (seg + 1) % segments])
+
+    index_dtype = np.uint16 if rings * segments + 2 <= np.iinfo(np.uint16).max else np.uint32
+    return MeshTopology(
+        rings=rings,
+        segments=segments,
+        levels=np.linspace(0, 1, rings),
+        cos=np.cos(theta),
+        sin=np.sin(theta),
+        i=np.concatenate([side_i, cap_i]).astype(index_dtype),
+        j=np.concatenate([side_j, cap_j]).astype(index_dtype),
+        k=np.concatenate([side_k, cap_k]).astype(index_dtype),
+    )
+
+
+def _ellipse_semi_axis(circumference, aspect):
+    # Ramanujan's perimeter approximation solved for the semi-major axis at a fixed aspect ratio.
+    return circumference / (np.pi * (3 * (1 + aspect) - np.sqrt((3 + aspect) * (1 + 3 * aspect))))
+
+
+def cross_section_circumferences(weight, height, neck, waist, hip=None):
+    """Circumference (cm) at each keyframe."""
+    build = np.sqrt(calculate_bmi(weight, height) / 22.0)
+    if hip is None:
+        hip = max(waist * 1.02, 0.52 * height * build)
+    chest = max(waist * 1.05, 0.55 * height * build)
+    head = 0.335 * height
+    return np.array([
+        0.40 * hip, 0.40 * hip, 0.60 * hip, 0.90 * hip, hip, waist,
+        chest, 1.15 * chest, neck, neck, head, 0.55 * head, 0.0,
+    ])
+
+
+def body_vertices(weight, height, neck, waist, hip=None, units='metric', lod='medium'):
+    """(x, y, z) float32 vertex arrays for the body, z pointing up, in cm."""
+    if units == 'imperial':
+        height, neck, waist = height * IN_TO_CM, neck * IN_TO_CM, waist * IN_TO_CM
+        hip = hip * IN_TO_CM if hip is not None else None
+        weight = weight * LB_TO_KG
+    mesh = topology(lod)
+    circumference = np.interp(mesh.levels, KEYFRAMES, cross_section_circumferences(weight, height, neck, waist, hip))
+    aspect = np.interp(mesh.levels, KEYFRAMES, ASPECT)
+    half_width = _ellipse_semi_axis(circumference, aspect)
+
+    x = np.outer(half_width, mesh.cos).ravel()
+    y = np.outer(half_width * aspect, mesh.sin).ravel()
+    z = np.repeat(mesh.levels * height, mesh.segments)
+    x = np.concatenate([x, [0.0, 0.0]])
+    y = np.concatenate([y, [0.0, 0.0]])
+    z = np.concatenate([z, [0.0, height]])
+    return x.astype(np.float32), y.astype(np.float32), z.astype(np.float32)
+
+
+@functools.lru_cache(maxsize=None)
+def payload_bytes(lod='medium'):
+    """JSON size of the figure at ``lod``, measured once on a reference body.
+
+    Vertex arrays are sent as fixed-size binary blocks, so the size barely
+    depends on the measurements (well under 1%).
+    """
+    fig, _ = body_mesh_figure(70, 170, 40, 80, None, lod=lod)
+    return len(fig.to_json())
+
+
+def body_mesh_figure(weight, height, neck, waist, hip=None, units='metric', lod='medium'):
+    """Plotly figure of the body mesh and a dict with its LOD and triangle count (size: :func:`payload_bytes`)."""
+    import plotly.graph_objects as go
+
+    mesh = topology(lod)
+    x, y, z = body_vertices(weight, height, neck, waist, hip, units, lod)
+    extent = float(z.max())
+    fig = go.Figure(data=[
+        go.Mesh3d(
+            x=x, y=y, z=z, i=mesh.i, j=mesh.j, k=mesh.k,
+            color='lightblue',
+            opacity=0.9,
+            flatshading=lod == 'low',
+            hoverinfo='skip',
+        )
+    ])
+    fig.update_layout(
+        scene=dict(
+            xaxis=dict(nticks=4, range=[-extent / 2, extent / 2], title='Width (cm)'),
+            yaxis=dict(nticks=4, range=[-extent / 2, extent / 2], title='Depth (cm)'),
+            zaxis=dict(nticks=4, range=[0, extent], title='Height (cm)'),
+            aspectmode='cube',
+        ),
+        margin=dict(l=0, r=0, t=0, b=0),
+    )
+    return fig, {'lod': lod, 'triangles': mesh.triangles}
@@ -0,0 +1,266 @@
+"""Append-only measurement history with per-day trend aggregates.
+
+Each calculation is appended to a SQLite database in WAL mode as a compact
+integer record (user id, unix seconds, BMI and body fat in hundredths). The
+same write folds the measurement into a ``daily`` row per user and day that
+keeps count, min, max and the sums a least-squares slope needs. Rolling
+7/30/90-day trends are combined from at most 90 of those rows, so reading a
+user's trends never scans their raw history.
+
+Writes go through one background thread per process that commits whatever
+arrived within ``FLUSH_INTERVAL`` in a single transaction, so concurrent
+sessions queue in memory instead of contending for the database lock.
+:meth:`HistoryStore.wait` lets a page read its own write.
+
+The database lives at ``BMI_HISTORY_DB`` (default ``data/history.sqlite3``).
+"""
+import atexit
+import functools
+import logging
+import math
+import os
+import queue
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_PATH = os.path.join(ROOT, 'data', 'history.sqlite3')
+
+WINDOWS = (7, 30, 90)
+FLUSH_INTERVAL = 0.05
+MAX_BATCH = 1024
+DAY = 86400
+# Stored values are hundredths of a BMI point / body-fat percent.
+SCALE = 100
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS users (
+    id INTEGER PRIMARY KEY,
+    key TEXT NOT NULL UNIQUE
+);
+CREATE TABLE IF NOT EXISTS measurements (
+    user_id INTEGER NOT NULL,
+    ts INTEGER NOT NULL,
+    bmi INTEGER NOT NULL,
+    body_fat INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS daily (
+    user_id INTEGER NOT NULL,
+    day INTEGER NOT NULL,
+    n INTEGER NOT NULL,
+    t_sum REAL NOT NULL,
+    tt_sum REAL NOT NULL,
+    bmi_min REAL NOT NULL,
+    bmi_max REAL NOT NULL,
+    bmi_sum REAL NOT NULL,
+    bmi_t_sum REAL NOT NULL,
+    fat_min REAL NOT NULL,
+    fat_max REAL NOT NULL,
+    fat_sum REAL NOT NULL,
+    fat_t_sum REAL NOT NULL,
+    PRIMARY KEY (user_id, day)
+) WITHOUT ROWID;
+"""
+
+# t is the time of day as a fraction, so the sums stay small; reads shift them to a common origin.
+UPSERT_DAILY = """
+INSERT INTO daily VALUES (:u, :d, 1, :t, :t * :t, :bmi, :bmi, :bmi, :t * :bmi, :fat, :fat, :fat, :t * :fat)
+ON CONFLICT (user_id, day) DO UPDATE SET
+    n = n + 1,
+    t_sum = t_sum + excluded.t_sum,
+    tt_sum = tt_sum + excluded.tt_sum,
+    bmi_min = min(bmi_min, excluded.bmi_min),
+    bmi_max = max(bmi_max, excluded.bmi_max),
+    bmi_sum = bmi_sum + excluded.bmi_sum,
+    bmi_t_sum = bmi_t_sum + excluded.bmi_t_sum,
+    fat_min = min(fat_min, excluded.fat_min),
+    fat_max = max(fat_max, excluded.fat_max),
+    fat_sum = fat_sum + excluded.fat_sum,
+    fat_t_sum = fat_t_sum + excluded.fat_t_sum
+"""
+
+
+@dataclass(frozen=True)
+class Trend:
+    days: int
+    count: int
+    bmi_min: float
+    bmi_max: float
+    bmi_slope: float
+    body_fat_min: float
+    body_fat_max: float
+    body_fat_slope: float
+
+
+def _connect(path):
+    conn = sqlite3.connect(path, timeout=30, check_same_thread=False, isolation_level=None)
+    conn.execute('PRAGMA journal_mode=WAL')
+    conn.execute('PRAGMA synchronous=NORMAL')
+    return conn
+
+
+class HistoryStore:
+    def __init__(self, path=DEFAULT_PATH, flush_interval=FLUSH_INTERVAL):
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.path = path
+        self.flush_interval = flush_interval
+        self._reader = _connect(path)
+        self._reader.executescript(SCHEMA)
+        self._read_lock = threading.Lock()
+        self._queue = queue.SimpleQueue()
+        self._user_ids = {}
+        self._submitted = 0
+        self._committed = 0
+        self._committed_cond = threading.Condition()
+        self._writer = threading.Thread(target=self._write_loop, name='history-writer', daemon=True)
+        self._writer.start()
+
+    def record(self, user, bmi, body_fat, ts=None):
+        """Queue one measurement; returns a ticket for :meth:`wait`. Non-finite values are skipped."""
+        if not (math.isfinite(bmi) and math.isfinite(body_fat)):
+            return self._submitted
+        row = (user, int(time.time() if ts is None else ts), round(bmi * SCALE), round(body_fat * SCALE))
+        # Queue under the lock so tickets reach the writer in order and wait() cannot pass an unwritten row.
+        with self._committed_cond:
+            self._submitted += 1
+            ticket = self._submitted
+            self._queue.put(row)
+        return ticket
+
+    def wait(self, ticket, timeout=1.0):
+        """Block until the write behind ``ticket`` is committed; False on timeout."""
+        with self._committed_cond:
+            return self._committed_cond.wait_for(lambda: self._committed >= ticket, timeout)
+
+    def flush(self, timeout=5.0):
+        return self.wait(self._submitted, timeout)
+
+    def _write_loop(self):
+        conn = _connect(self.path)
+        while True:
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + self.flush_interval
+            while len(batch) < MAX_BATCH:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            try:
+                self._commit(conn, batch)
+            except sqlite3.Error:
+                # Losing a batch of history beats killing the writer and blocking every page that waits on it.
+                logging.getLogger(__name__).exception('Dropped %d history records', len(batch))
+            with self._committed_cond:
+                self._committed += len(batch)
+                self._committed_cond.notify_all()
+
+    def _commit(self, conn, batch):
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            rows, daily = [], []
+            for user, ts, bmi, body_fat in batch:
+                user_id = self._user_id(conn, user)
+                rows.append((user_id, ts, bmi, body_fat))
+                daily.append({'u': user_id, 'd': ts // DAY, 't': ts % DAY / DAY,
+                              'bmi': bmi / SCALE, 'fat': body_fat / SCALE})
+            conn.executemany('INSERT INTO measurements VALUES (?, ?, ?, ?)', rows)
+            conn.executemany(UPSERT_DAILY, daily)
+            conn.execute('COMMIT')
+        except BaseException:
+            conn.execute('ROLLBACK')
+            # Ids of users created in the rolled-back transaction are gone.
+            self._user_ids.clear()
+            raise
+
+    def _user_id(self, conn, user):
+        user_id = self._user_ids.get(user)
+        if user_id is None:
+            conn.execute('INSERT OR IGNORE INTO users (key) VALUES (?)', (user,))
+            user_id = conn.execute('SELECT id FROM users WHERE key = ?', (user,)).fetchone()[0]
+            self._user_ids[user] = user_id
+        return user_id
+
+    def daily(self, user, days=max(WINDOWS), now=None):
+        """Per-day rows of the last ``days`` days, oldest first, as dicts keyed by column name."""
+        today = int(time.time() if now is None else now) // DAY
+        with self._read_lock:
+            cursor = self._reader.execute(
+                'SELECT daily.* FROM daily JOIN users ON users.id = daily.user_id '
+                'WHERE users.key = ? AND day > ? ORDER BY day', (user, today - days))
+            columns = [c[0] for c in cursor.description]
+            return [dict(zip(columns, row)) for row in cursor.fetchall()]
+
+    def trends(self, user, windows=WINDOWS, now=None):
+        """:class:`Trend` per window that has data; slopes are per day."""
+        rows = self.daily(user, max(windows), now)
+        today = int(time.time() if now is None else now) // DAY
+        trends = {}
+        for days in windows:
+            window = [row for row in rows if row['day'] > today - days]
+            if window:
+                trends[days] = Trend(
+                    days=days,
+                    count=sum(row['n'] for row in window),
+                    bmi_min=min(row['bmi_min'] for row in window),
+                    bmi_max=max(row['bmi_max'] for row in window),
+                    bmi_slope=_slope(window, 'bmi', today - days),
+                    body_fat_min=min(row['fat_min'] for row in window),
+                    body_fat_max=max(row['fat_max'] for row in window),
+                    body_fat_slope=_slope(window, 'fat', today - days),
+                )
+        return trends
+
+
+def _slope(rows, metric, origin):
+    # Least squares over all measurements, with each day's sums shifted to t = day - origin + time of day.
+    n = t = tt = y = ty = 0.0
+    for row in rows:
+        offset = row['day'] - origin
+        n += row['n']
+        t += row['t_sum'] + offset * row['n']
+        tt += row['tt_sum'] + 2 * offset * row['t_sum'] + offset * offset * row['n']
+        y += row[f'{metric}_sum']
+        ty += row[f'{metric}_t_sum'] + offset * row[f'{metric}_sum']
+    denominator = n * tt - t * t
+    if n < 2 or denominator <= 1e-12 * n * n:
+        return math.nan
+    return (n * ty - t * y) / denominator
+
+
+@functools.lru_cache(maxsize=None)
+def store(path=None):
+    """Process-wide store, shared by every session."""
+    history = HistoryStore(path or os.environ.get('BMI_HISTORY_DB') or DEFAULT_PATH)
+    atexit.register(history.flush)
+    return history
+
+
+def trend_figure(rows):
+    """Plotly figure of daily mean BMI and body fat with their min-max bands, from :meth:`HistoryStore.daily` rows."""
+    import plotly.graph_objects as go
+
+    dates = [time.strftime('%Y-%m-%d', time.gmtime(row['day'] * DAY)) for row in rows]
+    fig = go.Figure()
+    for metric, name, color, axis in (('bmi', 'BMI', '#1f77b4', 'y'), ('fat', 'Body fat %', '#d62728', 'y2')):
+        fig.add_trace(go.Scatter(
+            x=dates + dates[::-1],
+            y=[row[f'{metric}_max'] for row in rows] + [row[f'{metric}_min'] for row in rows[::-1]],
+            fill='toself', fillcolor=color, opacity=0.15, line=dict(width=0),
+            hoverinfo='skip', showlegend=False, yaxis=axis,
+        ))
+        fig.add_trace(go.Scatter(
+            x=dates, y=[row[f'{metric}_sum'] / row['n'] for row in rows],
+            name=name, mode='lines+markers', line=dict(color=color), yaxis=axis,
+        ))
+    fig.update_layout(
+        yaxis=dict(title='BMI'),
+        yaxis2=dict(title='Body fat %', overlaying='y', side='right'),
+        margin=dict(l=0, r=0, t=30, b=0),
+        legend=dict(orientation='h', y=1.1),
+    )
+    return fig
@@ -0,0 +1,338 @@
+"""Timing spans around the stages of a page run.
+
+Pages wrap their run in :func:`page_run` and each stage in :func:`span`::
+
+    @page_run('streamlit_app')
+    def main():
+        with span('widgets'):
+            ...
+
+Every span records its wall time, the bytes of the messages Streamlit sent
+to the browser while it was open (plus anything reported through
+:func:`add_bytes`, e.g. the PNG behind an ``st.image``), and, when
+``tracemalloc`` is tracing, the peak Python allocations above the level at
+which it started. Allocation figures are process-wide, so they are only
+exact while a single session is running.
+
+When the outermost span of a run closes, the run goes to every configured
+output:
+
+* ``BMI_METRICS_LOG=path``: one JSON line per run, rotated at
+  ``BMI_METRICS_LOG_BYTES`` (10 MB by default, 5 backups).
+* ``BMI_METRICS_SNAPSHOT=path``: Prometheus text-format snapshot of the
+  per-stage aggregates, rewritten at most once a second.
+* ``BMI_METRICS_PORT=port``: the same snapshot served at ``/metrics`` on
+  127.0.0.1; set ``BMI_METRICS_HOST`` (e.g. ``0.0.0.0``) to expose it to
+  other hosts.
+* ``BMI_METRICS_PANEL=1``: a "Run timings" table in the sidebar.
+
+``BMI_METRICS=1`` turns collection on without any output (for
+:func:`snapshot` in scripts), and ``BMI_METRICS_ALLOCATIONS=1`` starts
+``tracemalloc``, which slows allocation-heavy stages down noticeably. With
+nothing configured, :func:`span` returns a shared no-op context manager and
+:func:`add_bytes` returns immediately.
+"""
+import atexit
+import contextlib
+import json
+import logging
+import logging.handlers
+import os
+import threading
+import time
+import tracemalloc
+
+# Histogram bucket bounds for span durations, in seconds.
+BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+SNAPSHOT_INTERVAL = 1.0
+DEFAULT_HOST = '127.0.0.1'
+LOG_BACKUPS = 5
+
+_NULL_SPAN = contextlib.nullcontext()
+_local = threading.local()
+_lock = threading.Lock()
+_stages = {}
+_logger = logging.getLogger('bmi.metrics')
+_config = {}
+_enabled = False
+_last_snapshot = 0.0
+_server = None
+
+
+def configure(enabled=False, log_path=None, log_bytes=10_000_000, snapshot_path=None, port=None, panel=False,
+              track_allocations=False, host=DEFAULT_HOST):
+    """Set the outputs; collection is on when any output is set or ``enabled`` is true."""
+    global _enabled
+    _logger.handlers.clear()
+    _logger.propagate = False
+    if log_path:
+        handler = logging.handlers.RotatingFileHandler(log_path, maxBytes=log_bytes, backupCount=LOG_BACKUPS)
+        handler.setFormatter(logging.Formatter('%(message)s'))
+        _logger.addHandler(handler)
+        _logger.setLevel(logging.INFO)
+    if port:
+        _serve(port, host)
+    if track_allocations and not tracemalloc.is_tracing():
+        tracemalloc.start()
+    _config.update(snapshot_path=snapshot_path, panel=panel)
+    _enabled = bool(enabled or log_path or snapshot_path or port or panel)
+
+
+def configure_from_env(environ=os.environ):
+    configure(
+        enabled=environ.get('BMI_METRICS') == '1',
+        log_path=environ.get('BMI_METRICS_LOG'),
+        log_bytes=int(environ.get('BMI_METRICS_LOG_BYTES', 10_000_000)),
+        snapshot_path=environ.get('BMI_METRICS_SNAPSHOT'),
+        port=int(environ['BMI_METRICS_PORT']) if environ.get('BMI_METRICS_PORT') else None,
+        host=environ.get('BMI_METRICS_HOST') or DEFAULT_HOST,
+        panel=environ.get('BMI_METRICS_PANEL') == '1',
+        track_allocations=environ.get('BMI_METRICS_ALLOCATIONS') == '1',
+    )
+
+
+class Span:
+    def __init__(self, name, page=None):
+        self.name = name
+        self.page = page
+        self.children = []
+        self.bytes_sent = 0
+        self.peak_alloc = None
+        self.error = None
+        self.duration = None
+
+    def __enter__(self):
+        stack = _stack()
+        if stack:
+            stack[-1].children.append(self)
+        else:
+            _count_sent_bytes()
+        stack.append(self)
+        if tracemalloc.is_tracing():
+            current, peak = tracemalloc.get_traced_memory()
+            _fold_peak(stack[:-1], peak)
+            tracemalloc.reset_peak()
+            self._alloc_base = self._alloc_peak = current
+        self._started = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.duration = time.perf_counter() - self._started
+        stack = _stack()
+        if tracemalloc.is_tracing() and hasattr(self, '_alloc_base'):
+            _fold_peak(stack, tracemalloc.get_traced_memory()[1])
+            self.peak_alloc = self._alloc_peak - self._alloc_base
+        stack.pop()
+        if exc_type is not None:
+            # Includes Streamlit's StopException / RerunException for runs cut short by a newer rerun.
+            self.error = exc_type.__name__
+        if stack:
+            stack[-1].bytes_sent += self.bytes_sent
+        else:
+            _record(self)
+        return False
+
+    def walk(self, depth=0):
+        """(depth, span) pairs in pre-order."""
+        yield depth, self
+        for child in self.children:
+            yield from child.walk(depth + 1)
+
+    def as_dict(self):
+        return {
+            'page': self.page,
+            'error': self.error,
+            'spans': [
+                {
+                    'stage': span.name,
+                    'depth': depth,
+                    'ms': round(span.duration * 1000, 3),
+                    'bytes': span.bytes_sent,
+                    'peak_alloc_bytes': span.peak_alloc,
+                }
+                for depth, span in self.walk()
+            ],
+        }
+
+
+def _stack():
+    try:
+        return _local.stack
+    except AttributeError:
+        _local.stack = []
+        return _local.stack
+
+
+def _fold_peak(spans, peak):
+    for span in spans:
+        if hasattr(span, '_alloc_peak'):
+            span._alloc_peak = max(span._alloc_peak, peak)
+
+
+def span(name, page=None):
+    """Time a stage. ``page`` labels the run when this is the outermost span (e.g. a fragment rerun)."""
+    if not _enabled:
+        return _NULL_SPAN
+    return Span(name, page)
+
+
+def add_bytes(count):
+    """Count ``count`` bytes sent outside the element messages (media files) against the open span."""
+    if not _enabled:
+        return
+    stack = _stack()
+    if stack:
+        stack[-1].bytes_sent += count
+
+
+@contextlib.contextmanager
+def page_run(page):
+    """Span for a whole page run; shows the sidebar panel afterwards when configured. Also a decorator."""
+    if not _enabled:
+        yield
+        return
+    with Span('run', page) as root:
+        yield
+    if _config.get('panel'):
+        debug_panel(root)
+
+
+def _count_sent_bytes():
+    # Wrap the session's message queue once so every element sent while a span is open is counted.
+    from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+    ctx = get_script_run_ctx(suppress_warning=True)
+    if ctx is None or getattr(ctx._enqueue, '_counts_bytes', False):
+        return
+    enqueue = ctx._enqueue
+
+    def counting_enqueue(msg):
+        stack = _stack()
+        if stack:
+            stack[-1].bytes_sent += msg.ByteSize()
+        enqueue(msg)
+
+    counting_enqueue._counts_bytes = True
+    ctx._enqueue = counting_enqueue
+
+
+def _record(root):
+    global _last_snapshot
+    with _lock:
+        for _, span in root.walk():
+            stats = _stages.get((root.page, span.name))
+            if stats is None:
+                stats = _stages[root.page, span.name] = {
+                    'buckets': [0] * len(BUCKETS), 'count': 0, 'sum': 0.0, 'bytes': 0, 'peak_alloc': 0, 'errors': 0,
+                }
+            for i, bound in enumerate(BUCKETS):
+                if span.duration <= bound:
+                    stats['buckets'][i] += 1
+            stats['count'] += 1
+            stats['sum'] += span.duration
+            stats['bytes'] += span.bytes_sent
+            stats['peak_alloc'] = max(stats['peak_alloc'], span.peak_alloc or 0)
+            stats['errors'] += span.error is not None
+        write_snapshot = _config.get('snapshot_path') and time.monotonic() - _last_snapshot >= SNAPSHOT_INTERVAL
+        if write_snapshot:
+            _last_snapshot = time.monotonic()
+    if _logger.handlers:
+        _logger.info(json.dumps({'ts': round(time.time(), 3), **root.as_dict()}))
+    if write_snapshot:
+        write_snapshot_file(_config['snapshot_path'])
+
+
+def _labels(page, stage, **extra):
+    labels = {'page': page or '', 'stage': stage, **extra}
+    return ','.join('{}="{}"'.format(k, str(v).replace('\\', '\\\\').replace('"', '\\"')) for k, v in labels.items())
+
+
+def snapshot():
+    """Per-stage aggregates in the Prometheus text exposition format."""
+    with _lock:
+        stages = {key: dict(stats, buckets=list(stats['buckets'])) for key, stats in sorted(_stages.items())}
+    lines = [
+        '# HELP bmi_stage_duration_seconds Wall time of each page-run stage.',
+        '# TYPE bmi_stage_duration_seconds histogram',
+    ]
+    for (page, stage), stats in stages.items():
+        for bound, count in zip(BUCKETS, stats['buckets']):
+            lines.append(f'bmi_stage_duration_seconds_bucket{{{_labels(page, stage, le=bound)}}} {count}')
+        lines.append(f'bmi_stage_duration_seconds_bucket{{{_labels(page, stage, le="+Inf")}}} {stats["count"]}')
+        lines.append(f'bmi_stage_duration_seconds_sum{{{_labels(page, stage)}}} {stats["sum"]:.6f}')
+        lines.append(f'bmi_stage_duration_seconds_count{{{_labels(page, stage)}}} {stats["count"]}')
+    for name, key, kind, help_text in (
+        ('bmi_stage_bytes_sent_total', 'bytes', 'counter', 'Bytes sent to the browser during each stage.'),
+        ('bmi_stage_peak_alloc_bytes', 'peak_alloc', 'gauge', 'Largest peak Python allocation seen in each stage.'),
+        ('bmi_stage_errors_total', 'errors', 'counter', 'Stages that raised, including runs cut short by a rerun.'),
+    ):
+        lines += [f'# HELP {name} {help_text}', f'# TYPE {name} {kind}']
+        lines += [f'{name}{{{_labels(page, stage)}}} {stats[key]}' for (page, stage), stats in stages.items()]
+    return '\n'.join(lines) + '\n'
+
+
+def write_snapshot_file(path):
+    tmp = f'{path}.{os.getpid()}.tmp'
+    with open(tmp, 'w') as f:
+        f.write(snapshot())
+    os.replace(tmp, path)
+
+
+def reset():
+    with _lock:
+        _stages.clear()
+
+
+def _serve(port, host=DEFAULT_HOST):
+    global _server
+    import http.server
+
+    class MetricsHandler(http.server.BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.split('?')[0] != '/metrics':
+                self.send_error(404)
+                return
+            body = snapshot().encode()
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    if _server is not None:
+        return
+    try:
+        _server = http.server.ThreadingHTTPServer((host, port), MetricsHandler)
+    except OSError as exc:
+        # Several app processes on one host: the first one serves, the others keep logging.
+        logging.getLogger(__name__).warning('Metrics address %s:%s unavailable: %s', host, port, exc)
+        return
+    threading.Thread(target=_server.serve_forever, name='metrics-server', daemon=True).start()
+
+
+def debug_panel(root):
+    import streamlit as st
+
+    rows = [
+        {
+            'stage': ' ' * depth + span.name,
+            'ms': round(span.duration * 1000, 2),
+            'KB sent': round(span.bytes_sent / 1024, 1),
+            'peak alloc KB': None if span.peak_alloc is None else round(span.peak_alloc / 1024, 1),
+        }
+        for depth, span in root.walk()
+    ]
+    with st.sidebar.expander("Run timings"):
+        st.dataframe(rows, hide_index=True)
+
+
+@atexit.register
+def _final_snapshot():
+    if _config.get('snapshot_path') and _stages:
+        write_snapshot_file(_config['snapshot_path'])
+
+
+configure_from_env()
@@ -0,0 +1,26 @@
+"""Deferred imports for heavy libraries.
+
+``np = lazy_import('numpy')`` binds a placeholder module that performs the
+real import on first attribute access and then copies the module namespace
+into itself, so later lookups cost the same as on the real module. Importing
+a page therefore does not pay for libraries that are only needed after
+"Calculate". The real import goes through ``importlib`` and its per-module
+locks, so concurrent sessions touching the placeholder at once are safe.
+
+Submodules such as ``matplotlib.figure`` are cheapest imported inside the
+function that uses them.
+"""
+import importlib
+import sys
+import types
+
+
+class _LazyModule(types.ModuleType):
+    def __getattr__(self, attr):
+        module = importlib.import_module(self.__name__)
+        self.__dict__.update(module.__dict__)
+        return getattr(module, attr)
+
+
+def lazy_import(name):
+    return sys.modules.get(name) or _LazyModule(name)
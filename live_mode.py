@@ -0,0 +1,43 @@
+"""Opt-in live mode shared by the pages.
+
+With live mode on, results update as the sliders move instead of waiting
+for "Calculate". Pages write their cheap outputs first and then call
+:func:`debounce` with the inputs of their heavy sections. If those inputs
+changed within a short window of the previous change, i.e. during a burst,
+the run waits out the window before continuing; Streamlit
+stops a run as soon as a newer widget change arrives
+(``runner.fastReruns``), so during a slider drag only the last value of a
+burst reaches the expensive code, while a single isolated change goes
+through without delay. The heavy sections themselves are cached
+on their own inputs, so a section whose inputs did not change is served
+from cache, and section-local controls live inside ``st.fragment``
+functions so changing them reruns only that section.
+"""
+import time
+
+import streamlit as st
+
+DEBOUNCE_SECONDS = 0.25
+
+
+def calculate_requested():
+    """Whether to compute this run: always in live mode, otherwise when "Calculate" is clicked."""
+    if st.sidebar.toggle("Live update", key="live_mode", help="Recompute as the sliders move."):
+        return True
+    return st.sidebar.button("Calculate")
+
+
+def debounce(inputs, seconds=DEBOUNCE_SECONDS, key="main"):
+    """In live mode, wait out the debounce window when ``inputs`` changed within ``seconds`` of the last change.
+
+    ``key`` keeps the inputs of each page apart.
+    """
+    inputs_key, changed_key = f"_live_inputs_{key}", f"_live_changed_{key}"
+    if st.session_state.get("live_mode") and st.session_state.get(inputs_key) != inputs:
+        now = time.monotonic()
+        last_change = st.session_state.get(changed_key)
+        st.session_state[changed_key] = now
+        if last_change is not None and now - last_change < seconds:
+            time.sleep(seconds)
+    # Session state access is a yield point: a newer rerun request stops this run here.
+    st.session_state[inputs_key] = inputs
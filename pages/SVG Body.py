@@ -1,54 +1,58 @@
 import streamlit as st
 import streamlit.components.v1 as components
+import svg_assets
+import svg_morph
+from body_composition import calculate_bmi, bmi_category_index
+from instrumentation import page_run, span
+from live_mode import calculate_requested, debounce
 
 components.html("example")
 
 
-def calculate_bmi(weight, height):
-    return weight / (height / 100) ** 2
-
 def get_bmi_category(bmi):
-    if bmi < 18.5:
-        return 'underweight', '#ADD8E6', underweight_svg
-    elif 18.5 <= bmi < 24.9:
-        return 'healthy', '#90EE90', healthy_svg
-    elif 25 <= bmi < 29.9:
-        return 'overweight', '#FFD700', unhealthy_svg
-    else:
-        return 'obese', '#FF6347', unhealthy_svg
-
-underweight_svg = """
-<svg id="Underweight" xmlns="http://www.w3.org/2000/svg" viewBox="0 0 318.05 867.51"><defs><radialGradient id="radial-gradient" cx="159.76" cy="433.75" fx="159.76" fy="433.75" r="324.23" gradientUnits="userSpaceOnUse"><stop offset="0" stop-color="#fff"/><stop offset="1" stop-color="#eafff2"/></radialGradient><style>.cls-1{stroke-width:3px}.cls-1,.cls-4,.cls-5,.cls-7{fill:none;stroke:#8bffb2;stroke-miterlimit:10}.cls-5{stroke-width:2px;stroke-linecap:round}.cls-4{stroke-width:5px}</style></defs><path d="M303.01 449.27c-3.04-8.7-15.04-8.7-17.04-15.7-20-80-24-159-26-240-1-32-40-40-66-53-11-5-14-15-11-27l-1 1c14-28 23-56 14-87-7-22-34-31-54-21-19 10-24 34-19 54 0 1-4 2-4 3 1 14 9 26 15 38 5 12 12 29-2 36-28 15-71 20-72 57-2 80-8 160-26 238 0 0 1 0 1.03-.05-13 8-21.03 22.05-31.03 33.05 9 5 13-7 21-9 2 15-10 29-5 44 11-10 7-26 16-38-1 14-7 27-9 41 16-6 9-28 19-39 3 9-5 16-6 25 0 4-1 11 1 10 11-6 9-22 13-33 4 10-7 22 1 30 2.83-12.33 5.56-24.7 8.17-37.1 12.83-62.9 25.83-125.9 34.83-189.9 7 23 10 47 8 72-4 43-19 84-18 128 .5 13 2.06 25.88 4 38.72 5.81 38.53 15 76.78 9 117.28-3 26-8 52-3.71 77.8 2.93 18.13 5.95 29.84 8.69 39.91s5.22 18.49 7.05 30.03c2.93 18.67 1.53 20.97.96 23.78-.59 2.81-1.16 4.26 1.26 11.13 0 6.38-9.22 19.15-14.3 26.42-3.29 5.48-3.66 5.48-5.63 6.99-3.57 2.75-4.8 6.45-1.37 7.83-1.1 3.03.27 7.43 3.84 5.63-.96 3.16 3.02 5.23 7.28 3.85.97 2.75 4.53 4.4 7.28.55 2.75-3.85 3.17-7.83 5.5-7.14 2.33.69.41 4.12-.82 6.59-1.24 2.47.55 6.45 5.63 6.04 5.08-.41 7.41-3.98 7.69-6.86.27-2.89 1.65-4.81 4.26-7.84 2.61-3.02 3.43-5.36 3.71-10.57.27-5.22 2.47-6.32 4.4-9.07 1.92-2.74 2.47-8.09.82-17.02-1.65-8.93-.96-9.34 0-12.64.96-3.3 0-5.63-1.37-12.08s-1.1-30.06 1.29-43.44c2.38-13.36 7.85-33.54 5.92-60.72-2.8-57.66.21-115.18 5.92-172.69 1.14-11.5 2.39-23.01 3.73-34.51 2 11.33 3.69 22.73 5.12 34.16 7.14 57.16 7.65 115.38 6.52 173.04-1.92 27.18 3.55 47.36 5.93 60.72 2.38 13.37 2.66 36.99 1.28 43.44-1.37 6.45-2.33 8.79-1.37 12.08.67 2.3 1.2 3.2.91 6.55-.08-.92-.23-1.84-.47-2.72-.02-.06-.21-.24-.18-.1.59 2.65.25 5.22-.15 7.86 0 .04.02.1.06.16-.05.29-.1.58-.16.89-1.65 8.92-1.09 14.28.82 17.02.96 1.37 1.98 2.33 2.81 3.59 0 .19-.02.38-.03.55 0 .09.23.39.27.26.03-.09.04-.21.06-.31.67 1.19 1.16 2.69 1.28 4.97.28 5.21 1.09 7.54 3.71 10.57 2.61 3.02 3.98 4.95 4.26 7.84.27 2.88 2.61 6.45 7.69 6.86 5.08.42 6.86-3.56 5.63-6.04-1.24-2.47-3.16-5.9-.82-6.59.42-.12.77-.09 1.08.05.28.37.54.75.77 1.19.08.13.42.32.3.04-.1-.22-.22-.43-.34-.64 1.04 1.24 1.83 3.9 3.68 6.5 2.75 3.85 6.32 2.2 7.28-.55 4.26 1.38 8.24-.69 7.28-3.85 3.57 1.8 4.94-2.6 3.84-5.63 3.44-1.37 2.2-5.08-1.37-7.83-1.96-1.51-2.34-1.51-5.63-6.99-5.08-7.28-14.3-20.04-14.3-26.42 2.42-6.87 1.84-8.32 1.26-11.13-.57-2.8-1.97-5.11.96-23.78 1.83-11.54 4.3-19.96 7.05-30.03s5.77-21.79 8.69-39.91c4.3-27.8.3-54.8-5.7-83.8-1-7-2-14-1-22 6-30 9.44-59.22 10.93-88.15.74-14.46.89-29.29.71-43.67-1.64-49.18-7.64-96.18-14.64-145.18-2-18 3-35 10-51 3 16 5 33 6 49 0-1 1-2 1-3-1 53 25 102 28 155 1 9 4 18 7 26 8-8-3-20 1-30 4 11 3 25 12 34 3-3 2-7 2-11-1-9-9-16-6-25 9 12 3 33 19 39-1-14-9-27-9-41 9 11 2 31 18 36 1-14-8-27-7-42 7 4 11 12 20.25 9.73 2.17-2.92-6.9-7.91-12.21-17.02Z" style="fill:url(#radial-gradient);stroke-width:0"/><path class="cls-4" d="M303.01 449.27c-3.04-8.7-15.04-8.7-17.04-15.7-20-80-24-159-26-240-1-32-40-40-66-53-11-5-14-15-11-27l-1 1c14-28 23-56 14-87-7-22-34-31-54-21-19 10-24 34-19 54 0 1-4 2-4 3 1 14 9 26 15 38 5 12 12 29-2 36-28 15-71 20-72 57-2 80-8 160-26 238 0 0 1 0 1.03-.05-13 8-21.03 22.05-31.03 33.05 9 5 13-7 21-9 2 15-10 29-5 44 11-10 7-26 16-38-1 14-7 27-9 41 16-6 9-28 19-39 3 9-5 16-6 25 0 4-1 11 1 10 11-6 9-22 13-33 4 10-7 22 1 30 2.83-12.33 5.56-24.7 8.17-37.1 12.83-62.9 25.83-125.9 34.83-189.9 7 23 10 47 8 72-4 43-19 84-18 128 .5 13 2.06 25.88 4 38.72 5.81 38.53 15 76.78 9 117.28-3 26-8 52-3.71 77.8 2.93 18.13 5.95 29.84 8.69 39.91s5.22 18.49 7.05 30.03c2.93 18.67 1.53 20.97.96 23.78-.59 2.81-1.16 4.26 1.26 11.13 0 6.38-9.22 19.15-14.3 26.42-3.29 5.48-3.66 5.48-5.63 6.99-3.57 2.75-4.8 6.45-1.37 7.83-1.1 3.03.27 7.43 3.84 5.63-.96 3.16 3.02 5.23 7.28 3.85.97 2.75 4.53 4.4 7.28.55 2.75-3.85 3.17-7.83 5.5-7.14 2.33.69.41 4.12-.82 6.59-1.24 2.47.55 6.45 5.63 6.04 5.08-.41 7.41-3.98 7.69-6.86.27-2.89 1.65-4.81 4.26-7.84 2.61-3.02 3.43-5.36 3.71-10.57.27-5.22 2.47-6.32 4.4-9.07 1.92-2.74 2.47-8.09.82-17.02-1.65-8.93-.96-9.34 0-12.64.96-3.3 0-5.63-1.37-12.08s-1.1-30.06 1.29-43.44c2.38-13.36 7.85-33.54 5.92-60.72-2.8-57.66.21-115.18 5.92-172.69 1.14-11.5 2.39-23.01 3.73-34.51 2 11.33 3.69 22.73 5.12 34.16 7.14 57.16 7.65 115.38 6.52 173.04-1.92 27.18 3.55 47.36 5.93 60.72 2.38 13.37 2.66 36.99 1.28 43.44-1.37 6.45-2.33 8.79-1.37 12.08.67 2.3 1.2 3.2.91 6.55-.08-.92-.23-1.84-.47-2.72-.02-.06-.21-.24-.18-.1.59 2.65.25 5.22-.15 7.86 0 .04.02.1.06.16-.05.29-.1.58-.16.89-1.65 8.92-1.09 14.28.82 17.02.96 1.37 1.98 2.33 2.81 3.59 0 .19-.02.38-.03.55 0 .09.23.39.27.26.03-.09.04-.21.06-.31.67 1.19 1.16 2.69 1.28 4.97.28 5.21 1.09 7.54 3.71 10.57 2.61 3.02 3.98 4.95 4.26 7.84.27 2.88 2.61 6.45 7.69 6.86 5.08.42 6.86-3.56 5.63-6.04-1.24-2.47-3.16-5.9-.82-6.59.42-.12.77-.09 1.08.05.28.37.54.75.77 1.19.08.13.42.32.3.04-.1-.22-.22-.43-.34-.64 1.04 1.24 1.83 3.9 3.68 6.5 2.75 3.85 6.32 2.2 7.28-.55 4.26 1.38 8.24-.69 7.28-3.85 3.57 1.8 4.94-2.6 3.84-5.63 3.44-1.37 2.2-5.08-1.37-7.83-1.96-1.51-2.34-1.51-5.63-6.99-5.08-7.28-14.3-20.04-14.3-26.42 2.42-6.87 1.84-8.32 1.26-11.13-.57-2.8-1.97-5.11.96-23.78 1.83-11.54 4.3-19.96 7.05-30.03s5.77-21.79 8.69-39.91c4.3-27.8.3-54.8-5.7-83.8-1-7-2-14-1-22 6-30 9.44-59.22 10.93-88.15.74-14.46.89-29.29.71-43.67-1.64-49.18-7.64-96.18-14.64-145.18-2-18 3-35 10-51 3 16 5 33 6 49 0-1 1-2 1-3-1 53 25 102 28 155 1 9 4 18 7 26 8-8-3-20 1-30 4 11 3 25 12 34 3-3 2-7 2-11-1-9-9-16-6-25 9 12 3 33 19 39-1-14-9-27-9-41 9 11 2 31 18 36 1-14-8-27-7-42 7 4 11 12 20.25 9.73 2.17-2.92-6.9-7.91-12.21-17.02Z"/><path class="cls-4" d="M303.01 449.27c-3.04-8.7-15.04-8.7-17.04-15.7-20-80-24-159-26-240-1-32-40-40-66-53-11-5-14-15-11-27l-1 1c14-28 23-56 14-87-7-22-34-31-54-21-19 10-24 34-19 54 0 1-4 2-4 3 1 14 9 26 15 38 5 12 12 29-2 36-28 15-71 20-72 57-2 80-8 160-26 238 0 0 1 0 1.03-.05-13 8-21.03 22.05-31.03 33.05 9 5 13-7 21-9 2 15-10 29-5 44 11-10 7-26 16-38-1 14-7 27-9 41 16-6 9-28 19-39 3 9-5 16-6 25 0 4-1 11 1 10 11-6 9-22 13-33 4 10-7 22 1 30 2.83-12.33 5.56-24.7 8.17-37.1 12.83-62.9 25.83-125.9 34.83-189.9 7 23 10 47 8 72-4 43-19 84-18 128 .5 13 2.06 25.88 4 38.72 5.81 38.53 15 76.78 9 117.28-3 26-8 52-3.71 77.8 2.93 18.13 5.95 29.84 8.69 39.91s5.22 18.49 7.05 30.03c2.93 18.67 1.53 20.97.96 23.78-.59 2.81-1.16 4.26 1.26 11.13 0 6.38-9.22 19.15-14.3 26.42-3.29 5.48-3.66 5.48-5.63 6.99-3.57 2.75-4.8 6.45-1.37 7.83-1.1 3.03.27 7.43 3.84 5.63-.96 3.16 3.02 5.23 7.28 3.85.97 2.75 4.53 4.4 7.28.55 2.75-3.85 3.17-7.83 5.5-7.14 2.33.69.41 4.12-.82 6.59-1.24 2.47.55 6.45 5.63 6.04 5.08-.41 7.41-3.98 7.69-6.86.27-2.89 1.65-4.81 4.26-7.84 2.61-3.02 3.43-5.36 3.71-10.57.27-5.22 2.47-6.32 4.4-9.07 1.92-2.74 2.47-8.09.82-17.02-1.65-8.93-.96-9.34 0-12.64.96-3.3 0-5.63-1.37-12.08s-1.1-30.06 1.29-43.44c2.38-13.36 7.85-33.54 5.92-60.72-2.8-57.66.21-115.18 5.92-172.69 1.14-11.5 2.39-23.01 3.73-34.51 2 11.33 3.69 22.73 5.12 34.16 7.14 57.16 7.65 115.38 6.52 173.04-1.92 27.18 3.55 47.36 5.93 60.72 2.38 13.37 2.66 36.99 1.28 43.44-1.37 6.45-2.33 8.79-1.37 12.08.67 2.3 1.2 3.2.91 6.55-.08-.92-.23-1.84-.47-2.72-.02-.06-.21-.24-.18-.1.59 2.65.25 5.22-.15 7.86 0 .04.02.1.06.16-.05.29-.1.58-.16.89-1.65 8.92-1.09 14.28.82 17.02.96 1.37 1.98 2.33 2.81 3.59 0 .19-.02.38-.03.55 0 .09.23.39.27.26.03-.09.04-.21.06-.31.67 1.19 1.16 2.69 1.28 4.97.28 5.21 1.09 7.54 3.71 10.57 2.61 3.02 3.98 4.95 4.26 7.84.27 2.88 2.61 6.45 7.69 6.86 5.08.42 6.86-3.56 5.63-6.04-1.24-2.47-3.16-5.9-.82-6.59.42-.12.77-.09 1.08.05.28.37.54.75.77 1.19.08.13.42.32.3.04-.1-.22-.22-.43-.34-.64 1.04 1.24 1.83 3.9 3.68 6.5 2.75 3.85 6.32 2.2 7.28-.55 4.26 1.38 8.24-.69 7.28-3.85 3.57 1.8 4.94-2.6 3.84-5.63 3.44-1.37 2.2-5.08-1.37-7.83-1.96-1.51-2.34-1.51-5.63-6.99-5.08-7.28-14.3-20.04-14.3-26.42 2.42-6.87 1.84-8.32 1.26-11.13-.57-2.8-1.97-5.11.96-23.78 1.83-11.54 4.3-19.96 7.05-30.03s5.77-21.79 8.69-39.91c4.3-27.8.3-54.8-5.7-83.8-1-7-2-14-1-22 6-30 9.44-59.22 10.93-88.15.74-14.46.89-29.29.71-43.67-1.64-49.18-7.64-96.18-14.64-145.18-2-18 3-35 10-51 3 16 5 33 6 49 0-1 1-2 1-3-1 53 25 102 28 155 1 9 4 18 7 26 8-8-3-20 1-30 4 11 3 25 12 34 3-3 2-7 2-11-1-9-9-16-6-25 9 12 3 33 19 39-1-14-9-27-9-41 9 11 2 31 18 36 1-14-8-27-7-42 7 4 11 12 20.25 9.73 2.17-2.92-6.9-7.91-12.21-17.02Z"/><path class="cls-1" d="M106.66 849.07c-.33-.05-.66-.09-1-.11-.43-.55-.91-1.06-1.46-1.52-.04-.04-.09-.07-.13-.11 1.65-1.6 3-3.52 5.24-7.24l.7-1.01c8.32-11.87 15.21-22.39 15.21-30.87 0-1.13-.19-2.26-.57-3.33-1.17-3.32-1.2-4.28-1.2-4.31.01-.09.11-.54.18-.87l.12-.58c.04-.21.09-.38.13-.57 1.06-4.42 1.72-9.49-1-26.8-1.73-10.87-4-19.17-6.42-27.96-2.9-10.55-6.18-22.5-9.33-42.03-2-12.35-2.14-24.69-1.3-36.91 2.13-24.3 9.13-48.3 7.13-73.3-3-35.25-11.62-69.38-14.48-104.06-.92-11.68-1.22-23.35-.43-35.21 4.91-61.73 33.91-125.73 6.91-186.73-4-10-14-5-16 4-14 59-22 113-34 172-1 5 2 13-4 15-8 3-15-3-21-8 8-2 15-9 16-16 15-82 23-159 26-239 1-31 42-31 66-48 22-15 8-42-1-60-3-6-7-14-6-22 2-11-1-23 4-34 7-14 24-21 38-14 18 10 17 31 14 49 0 2 3 3 3 5-6 21-22 37-17 59 6 28 38 26 59 40 14 10 19 25 19 41 1 75 5 150 24 225 2 6 7 12 15 14-4 3-9 5-13 8-5 3-12-1-13-6-9-64-22-127-37-189-23 8-26 37-24 57 5 49 16 95 16.04 143.73.35 13.52.24 26.99-.41 40.38-1.3 26.78-4.63 53.89-10.63 81.89-6 27 5 53 6.13 80.28.84 12.23.7 24.57-1.3 36.92-3.15 19.53-6.44 31.49-9.33 42.04-2.41 8.78-4.69 17.08-6.41 27.93-2.71 17.31-2.06 22.38-1 26.8.04.19.09.36.13.54l.13.63c.07.33.17.78.18.91s-.04.96-1.2 4.27a9.905 9.905 0 0 0-.57 3.32c0 8.48 6.88 19 15.2 30.87l.71 1.01c2.24 3.72 3.58 5.64 5.24 7.24-.05.04-.09.08-.14.11-.54.46-1.03.97-1.45 1.51-.33.02-.66.06-.98.11-.46-.83-1-1.67-1.69-2.49a9.85 9.85 0 0 0-1.73-1.63 10.1 10.1 0 0 0-2.49-1.63c-1.51-.69-3.11-1.04-4.76-1.04-1.13 0-2.26.17-3.36.5a11.51 11.51 0 0 0-4.79 2.8c-.49-.61-1-1.22-1.52-1.82-.93-1.07-1.12-1.3-1.29-4.57-.19-3.58-1.03-6.65-2.57-9.37-.1-.18-.21-.35-.32-.53-.1-.17-.2-.34-.31-.51-.77-1.18-1.54-2.1-2.16-2.84-.23-.27-.44-.52-.61-.74-.16-.67-.58-3.36.6-9.76l.17-.94c.09-.52.15-1.05.16-1.57.1-.72.2-1.5.28-2.34.22-.69.37-1.42.44-2.17.39-4.43-.23-6.88-1.02-9.4-.08-.24-.16-.49-.24-.77.04-.6.41-2.24.75-3.69.24-1.04.51-2.22.79-3.56 1.83-8.59 1.19-33.77-1.22-47.27-.45-2.55-1-5.19-1.58-7.99-2.51-12.18-5.68-27.97-4.17-48.98 1.95-60.15 2.97-120.18-7.74-180.18-2.14-12.02-4.75-24.21-7.92-36.11-1-4.09-11.99-2.03-13 3.06-1.99 11.9-3.72 23.98-5.2 35.89-7.38 59.52-8.58 118.02-7.47 177.34 1.5 21.01-1.67 36.79-4.17 48.97-.58 2.8-1.12 5.45-1.58 8-2.4 13.47-3.06 38.65-1.22 47.27.29 1.34.55 2.51.79 3.56.33 1.46.71 3.09.75 3.69-.09.3-.17.54-.24.78-1.42 4.54-1.62 7.55.02 16.43 1.18 6.4.76 9.08.6 9.76-.17.22-.38.47-.61.74-1.86 2.21-4.98 5.9-5.36 13.25-.17 3.26-.37 3.49-1.29 4.56-.52.6-1.03 1.2-1.52 1.82a11.718 11.718 0 0 0-4.83-2.81c-1.08-.32-2.21-.49-3.33-.49-5.86 0-8.97 3.88-10.65 6.8Z"/><path class="cls-1" d="M106.66 849.07c-.33-.05-.66-.09-1-.11-.43-.55-.91-1.06-1.46-1.52-.04-.04-.09-.07-.13-.11 1.65-1.6 3-3.52 5.24-7.24l.7-1.01c8.32-11.87 15.21-22.39 15.21-30.87 0-1.13-.19-2.26-.57-3.33-1.17-3.32-1.2-4.28-1.2-4.31.01-.09.11-.54.18-.87l.12-.58c.04-.21.09-.38.13-.57 1.06-4.42 1.72-9.49-1-26.8-1.73-10.87-4-19.17-6.42-27.96-2.9-10.55-6.18-22.5-9.33-42.03-2-12.35-2.14-24.69-1.3-36.91 2.13-24.3 9.13-48.3 7.13-73.3-3-35.25-11.62-69.38-14.48-104.06-.92-11.68-1.22-23.35-.43-35.21 4.91-61.73 33.91-125.73 6.91-186.73-4-10-14-5-16 4-14 59-22 113-34 172-1 5 2 13-4 15-8 3-15-3-21-8 8-2 15-9 16-16 15-82 23-159 26-239 1-31 42-31 66-48 22-15 8-42-1-60-3-6-7-14-6-22 2-11-1-23 4-34 7-14 24-21 38-14 18 10 17 31 14 49 0 2 3 3 3 5-6 21-22 37-17 59 6 28 38 26 59 40 14 10 19 25 19 41 1 75 5 150 24 225 2 6 7 12 15 14-4 3-9 5-13 8-5 3-12-1-13-6-9-64-22-127-37-189-23 8-26 37-24 57 5 49 16 95 16.04 143.73.35 13.52.24 26.99-.41 40.38-1.3 26.78-4.63 53.89-10.63 81.89-6 27 5 53 6.13 80.28.84 12.23.7 24.57-1.3 36.92-3.15 19.53-6.44 31.49-9.33 42.04-2.41 8.78-4.69 17.08-6.41 27.93-2.71 17.31-2.06 22.38-1 26.8.04.19.09.36.13.54l.13.63c.07.33.17.78.18.91s-.04.96-1.2 4.27a9.905 9.905 0 0 0-.57 3.32c0 8.48 6.88 19 15.2 30.87l.71 1.01c2.24 3.72 3.58 5.64 5.24 7.24-.05.04-.09.08-.14.11-.54.46-1.03.97-1.45 1.51-.33.02-.66.06-.98.11-.46-.83-1-1.67-1.69-2.49a9.85 9.85 0 0 0-1.73-1.63 10.1 10.1 0 0 0-2.49-1.63c-1.51-.69-3.11-1.04-4.76-1.04-1.13 0-2.26.17-3.36.5a11.51 11.51 0 0 0-4.79 2.8c-.49-.61-1-1.22-1.52-1.82-.93-1.07-1.12-1.3-1.29-4.57-.19-3.58-1.03-6.65-2.57-9.37-.1-.18-.21-.35-.32-.53-.1-.17-.2-.34-.31-.51-.77-1.18-1.54-2.1-2.16-2.84-.23-.27-.44-.52-.61-.74-.16-.67-.58-3.36.6-9.76l.17-.94c.09-.52.15-1.05.16-1.57.1-.72.2-1.5.28-2.34.22-.69.37-1.42.44-2.17.39-4.43-.23-6.88-1.02-9.4-.08-.24-.16-.49-.24-.77.04-.6.41-2.24.75-3.69.24-1.04.51-2.22.79-3.56 1.83-8.59 1.19-33.77-1.22-47.27-.45-2.55-1-5.19-1.58-7.99-2.51-12.18-5.68-27.97-4.17-48.98 1.95-60.15 2.97-120.18-7.74-180.18-2.14-12.02-4.75-24.21-7.92-36.11-1-4.09-11.99-2.03-13 3.06-1.99 11.9-3.72 23.98-5.2 35.89-7.38 59.52-8.58 118.02-7.47 177.34 1.5 21.01-1.67 36.79-4.17 48.97-.58 2.8-1.12 5.45-1.58 8-2.4 13.47-3.06 38.65-1.22 47.27.29 1.34.55 2.51.79 3.56.33 1.46.71 3.09.75 3.69-.09.3-.17.54-.24.78-1.42 4.54-1.62 7.55.02 16.43 1.18 6.4.76 9.08.6 9.76-.17.22-.38.47-.61.74-1.86 2.21-4.98 5.9-5.36 13.25-.17 3.26-.37 3.49-1.29 4.56-.52.6-1.03 1.2-1.52 1.82a11.718 11.718 0 0 0-4.83-2.81c-1.08-.32-2.21-.49-3.33-.49-5.86 0-8.97 3.88-10.65 6.8Z"/><path d="M125.8 544.59c-2.41-13.51-5.37-27.27-7.48-41.15s-3.21-28.54-2.31-42.05c3.96-57.83 23.96-113.83 14.96-173.83-3-23-16-53-43-47-17-55 35-79 74-83 12-1 36 13 55 24 23 12 14 39 15 59-48 1-49 63-44 100 6 45 14 88 14.25 133.38.13 11.74-.24 23.75-1.38 35.54-1.15 11.72-3.04 23.41-5.87 35.08-3-13-3-26.25-3.75-39.38s-2.25-26.13-8.26-38.82c-7.01-14.53-25.93-19.76-38.94-9.26-14.03 10.35-12.05 29.45-14.75 45.02-.99 10.12-2.06 23.63-3.47 42.46Zm34.1-450.44c-2.93-17.59-15.93-35.59-7.93-54.59 3-5 12-6 14-1 9 16 0 34-5.31 50.2-.2 2.2-.48 4-.76 5.38Z" style="stroke-width:2px;fill:none;stroke:#8bffb2;stroke-miterlimit:10"/><path class="cls-7" d="M159.91 94.15c-2.93-17.59-15.93-35.59-7.93-54.59 3-5 12-6 14-1 9 16 0 34-5.31 50.2-.2 2.2-.48 4-.76 5.38Z"/><path class="cls-5" d="M184.19 439.61h0"/><path d="M175.32 434.5c-11.26-4.58-24.25-3.59-34.87 1.56" style="stroke-linecap:round;stroke-width:2px;stroke-dasharray:0 0 0 10.26;fill:none;stroke:#8bffb2;stroke-miterlimit:10"/><path class="cls-5" d="M135.97 438.56h0"/><path d="M137.93 428.71c14.38-72.68 27.56-155.15-26.96-221.15-7-8 25-22 42-25 22-3 64 15 56 25-50 63-41 141-28.69 209.95 1.19 6.21 2.3 11.85 3.16 17.13" style="stroke-dasharray:0 0 0 10.05;stroke-linecap:round;stroke-width:2px;fill:none;stroke:#8bffb2;stroke-miterlimit:10"/><path class="cls-1" d="M106.66 849.07c-.33-.05-.66-.09-1-.11-.43-.55-.91-1.06-1.46-1.52-.04-.04-.09-.07-.13-.11 1.65-1.6 3-3.52 5.24-7.24l.7-1.01c8.32-11.87 15.21-22.39 15.21-30.87 0-1.13-.19-2.26-.57-3.33-1.17-3.32-1.2-4.28-1.2-4.31.01-.09.11-.54.18-.87l.12-.58c.04-.21.09-.38.13-.57 1.06-4.42 1.72-9.49-1-26.8-1.73-10.87-4-19.17-6.42-27.96-2.9-10.55-6.18-22.5-9.33-42.03-2-12.35-2.14-24.69-1.3-36.91 2.13-24.3 9.13-48.3 7.13-73.3-3-35.25-11.62-69.38-14.48-104.06-.92-11.68-1.22-23.35-.43-35.21 4.91-61.73 33.91-125.73 6.91-186.73-4-10-14-5-16 4-14 59-22 113-34 172-1 5 2 13-4 15-8 3-15-3-21-8 8-2 15-9 16-16 15-82 23-159 26-239 1-31 42-31 66-48 22-15 8-42-1-60-3-6-7-14-6-22 2-11-1-23 4-34 7-14 24-21 38-14 18 10 17 31 14 49 0 2 3 3 3 5-6 21-22 37-17 59 6 28 38 26 59 40 14 10 19 25 19 41 1 75 5 150 24 225 2 6 7 12 15 14-4 3-9 5-13 8-5 3-12-1-13-6-9-64-22-127-37-189-23 8-26 37-24 57 5 49 16 95 16.04 143.73.35 13.52.24 26.99-.41 40.38-1.3 26.78-4.63 53.89-10.63 81.89-6 27 5 53 6.13 80.28.84 12.23.7 24.57-1.3 36.92-3.15 19.53-6.44 31.49-9.33 42.04-2.41 8.78-4.69 17.08-6.41 27.93-2.71 17.31-2.06 22.38-1 26.8.04.19.09.36.13.54l.13.63c.07.33.17.78.18.91s-.04.96-1.2 4.27a9.905 9.905 0 0 0-.57 3.32c0 8.48 6.88 19 15.2 30.87l.71 1.01c2.24 3.72 3.58 5.64 5.24 7.24-.05.04-.09.08-.14.11-.54.46-1.03.97-1.45 1.51-.33.02-.66.06-.98.11-.46-.83-1-1.67-1.69-2.49a9.85 9.85 0 0 0-1.73-1.63 10.1 10.1 0 0 0-2.49-1.63c-1.51-.69-3.11-1.04-4.76-1.04-1.13 0-2.26.17-3.36.5a11.51 11.51 0 0 0-4.79 2.8c-.49-.61-1-1.22-1.52-1.82-.93-1.07-1.12-1.3-1.29-4.57-.19-3.58-1.03-6.65-2.57-9.37-.1-.18-.21-.35-.32-.53-.1-.17-.2-.34-.31-.51-.77-1.18-1.54-2.1-2.16-2.84-.23-.27-.44-.52-.61-.74-.16-.67-.58-3.36.6-9.76l.17-.94c.09-.52.15-1.05.16-1.57.1-.72.2-1.5.28-2.34.22-.69.37-1.42.44-2.17.39-4.43-.23-6.88-1.02-9.4-.08-.24-.16-.49-.24-.77.04-.6.41-2.24.75-3.69.24-1.04.51-2.22.79-3.56 1.83-8.59 1.19-33.77-1.22-47.27-.45-2.55-1-5.19-1.58-7.99-2.51-12.18-5.68-27.97-4.17-48.98 1.95-60.15 2.97-120.18-7.74-180.18-2.14-12.02-4.75-24.21-7.92-36.11-1-4.09-11.99-2.03-13 3.06-1.99 11.9-3.72 23.98-5.2 35.89-7.38 59.52-8.58 118.02-7.47 177.34 1.5 21.01-1.67 36.79-4.17 48.97-.58 2.8-1.12 5.45-1.58 8-2.4 13.47-3.06 38.65-1.22 47.27.29 1.34.55 2.51.79 3.56.33 1.46.71 3.09.75 3.69-.09.3-.17.54-.24.78-1.42 4.54-1.62 7.55.02 16.43 1.18 6.4.76 9.08.6 9.76-.17.22-.38.47-.61.74-1.86 2.21-4.98 5.9-5.36 13.25-.17 3.26-.37 3.49-1.29 4.56-.52.6-1.03 1.2-1.52 1.82a11.718 11.718 0 0 0-4.83-2.81c-1.08-.32-2.21-.49-3.33-.49-5.86 0-8.97 3.88-10.65 6.8Z"/><path d="M124.96 740.72c-2.79-10.17-5.93-21.77-8.94-40.39-1.05-8.77-3.05-17.77-1.05-26.77 10-54.17 4.72-104.17-3.1-155.79-1.56-10.32-3.23-20.71-4.9-31.21-2-12-1-24-1-36 4-65 46-141-4-197-3-5-10-5-15-1-6 5-10 13-9 21-6-46-8-103 53-116 39-9 27-57 9-85-1-2 2-5 2-7-1-12-6-25 2-35 7-7 18-10 27-5 11 6 11 19 10 30-2 30-30 62-9 90 15 20 43 17 59 35 25 25 7 62 11 93 1-11-9-27-19-23-28 12-31 47-27 74 6 48 14 94 14.9 141.46.17 13.34-.01 27.21-.79 40.61-1.56 26.81-5.11 53.93-11.11 81.93-2 7-1 15-1 22 3 30 11 60 5.95 89.77-3.01 18.63-6.15 30.23-8.93 40.39-.42-2.25-.9-4.56-1.36-6.81-2.4-11.64-5.44-26.66-4.01-46.47-1.37-62.4 7.43-129.05-11.01-189.46-3.69-12.12-8.47-24.01-14.63-35.74-2.99-5.18-13.98-1.01-15.99 4.14a474.162 474.162 0 0 0-8.43 36.76c-11.52 61.09-11.19 122.74-9.22 184.3 1.43 19.81-1.61 34.82-4.01 46.46-.49 2.38-.95 4.62-1.36 6.82Zm153.17-293.03c-.08 0-.17 0 0 0Zm-236.31 0s-.03-.02 0 0Zm22.26-72.75c2.93-19.97.05-41.44 8.86-59.19-2.77 26.15-5.24 44.29-8.86 59.19Zm191.74-.54c-3.58-14.97-6-33.28-8.7-59.59.3 1.04.61 2.1.95 3.2 4.99 16.29 6.19 22.79 7.75 56.39Z" style="stroke-width:2.5px;fill:none;stroke:#8bffb2;stroke-miterlimit:10"/><path class="cls-7" d="M194.18 469.75c-4.21-16.19-18.21-30.19-35.21-29.19-15 1-29 12-34 27-1-9 0-19 1-28 9-71 46-162-26-216-7-6-5-20 2-26 17-18 41-31 67-26s72 27 49 49c-62 63-35 151-23.94 223.4.62 6.08.72 15.03.14 25.79Z"/></svg>
-"""
-
-healthy_svg = """
-<svg id="Healthy" xmlns="http://www.w3.org/2000/svg" viewBox="0 0 333.53 867.89"><defs><radialGradient id="radial-gradient" cx="166.76" cy="433.95" fx="166.76" fy="433.95" r="326.44" gradientUnits="userSpaceOnUse"><stop offset="0" stop-color="#fff"/><stop offset="1" stop-color="#f3ffd0"/></radialGradient><style>.cls-1{stroke-width:3px}.cls-1,.cls-11,.cls-4,.cls-7{fill:none;stroke:#c8ff00;stroke-miterlimit:10}.cls-7{stroke-width:2px;stroke-linecap:round}.cls-4{stroke-width:5px}</style></defs><path d="M319.91 450c-4.76-9.71-11.53-12.45-16.66-17.58-.06-.06-.11-.13-.17-.19.11.04.2.06.2.06s-.23-.47-.67-1.04c-.23-.27-.47-.61-.77-.92-.06-.07-.13-.13-.2-.2-3.89-7.19-5.4-24.87-7.35-56.5-2.2-35.7-3.66-44.12-9.98-62.61-6.54-19.15-6.31-24.72-6.31-38.45 1.92-22.79-1.83-38.81-1.47-46.69.37-7.87 3.85-14.09-2.01-38.26-7.87-29.11-20.69-32.59-32.63-37.8-11.94-5.22-29.94-13.19-40.65-18.26-10.71-5.08-10.84-5.69-10.84-11.26s.81-14.99.81-14.99h-.29c2.9-4.39 5.26-11.93 6.2-21 0 0 2.67 1.97 5.36-3.85 5.4-11.67 6.68-15.69 6.32-20.09-.37-4.4-4.39-4.4-4.39-4.4s13.91-49.25-35.34-53.46c-22.16-.92-49.09 14.35-40.65 53.58 0 0-5.97.2-4.18 8.36 1.79 8.15 4.98 12.93 6.97 17.11 1.99 4.18 3.58 4.38 4.77 2.79 0 0 .8 13.9 6.15 20.99.07.66 1.01 9.57 1.01 14.94s-.12 6.17-10.83 11.26c-10.71 5.08-28.7 13.04-40.64 18.26-11.95 5.21-24.76 8.69-32.64 37.8-5.85 24.17-2.38 30.39-2.01 38.26.37 7.88-3.39 23.9-1.46 46.69 0 13.73.22 19.3-6.32 38.45-6.31 18.49-7.78 26.91-9.97 62.61-1.88 30.58-3.36 48.11-6.97 55.74-.3.34-.68.62-.97.95-.31.31-.54.65-.78.92-.43.57-.67 1.04-.67 1.04s.34-.1.82-.32c-.13.16-.27.31-.41.45-5.12 5.13-11.9 7.87-16.66 17.58-4.76 9.7-12.81 14.82-10.8 17.93 1.65 2.57 8.6.19 12.08-4.94 3.48-5.13 7.88-7.51 6.96-1.65-.92 5.86-6.6 32.77-5.86 39.37.73 6.59 5.31 1.65 6.96-4.76 1.65-6.42 6.23-31.86 8.24-31.31 2.01.55-3.12 20.31-5.13 30.39-2.01 10.07-2.38 12.81.54 13.73 2.93.92 5.14-3.48 7.15-14.65 2.02-11.17 6.41-26.92 7.69-26.73 1.28.18-3.84 21.96-5.13 28.93-1.28 6.96-.37 8.97 1.83 9.52 2.2.55 6.41-9.88 8.05-20.88 1.65-10.98 2.01-15.74 3.11-15.37 1.1.36-.18 8.42-.73 15.01s-2.56 17.04.73 17.77c3.3.73 5.86-10.25 8.79-33.88.09-.68.18-1.39.29-2.12.12-.21.24-.41.32-.63.1-.25.12-.53.17-.74.07-.43-.01-.76-.01-.76s-.08.04-.2.12c1.3-9.31 2.97-21.59.22-29.35 0-.19 0-.44-.03-.74-.06-.51-.24-1.15-.57-1.74.12-5.62 7.07-21.98 11.89-34.53 8.07-20.97 11.94-43.8 16.84-80.96.02.14.04.22.04.22s.12-.87.23-2.23c.13-.96.25-1.92.38-2.9 3.29-25.81 7.14-42.29 7.14-42.29s10.21 24.17 9.88 42.84c-.27 15.65-1.37 14.82-3.3 27.74-1.92 12.91-3.02 19.5-5.21 40.64-4.21 23.9-9.34 41.47-11.17 60.88-1.83 19.41.37 57.49 9.15 98.5 8.79 41 13.91 49.79 13.91 73.22-1.09 19.78-9.89 53.84-4.03 90.08 5.86 36.26 12.08 46.87 15.74 69.94 2.93 18.67 1.53 20.97.96 23.78-.59 2.81-1.16 4.26 1.26 11.13 0 6.38-9.22 19.15-14.3 26.42-3.29 5.48-3.66 5.48-5.63 6.99-3.57 2.75-4.8 6.45-1.37 7.83-1.1 3.03.27 7.43 3.84 5.63-.96 3.16 3.02 5.23 7.28 3.85.97 2.75 4.53 4.4 7.28.55 2.75-3.85 3.17-7.83 5.5-7.14 2.33.69.41 4.12-.82 6.59-1.24 2.47.55 6.45 5.63 6.04 5.08-.41 7.41-3.98 7.69-6.86.27-2.89 1.65-4.81 4.26-7.84 2.61-3.02 3.43-5.36 3.71-10.57.27-5.22 2.47-6.32 4.4-9.07 1.92-2.74 2.47-8.09.82-17.02-1.65-8.93-.96-9.34 0-12.64.96-3.3 0-5.63-1.37-12.08s-1.1-30.06 1.29-43.44c2.38-13.36 7.78-31.39 5.86-59.13-1.92-27.74-4.67-46.14-2.48-51.91 2.2-5.76 2.55-22.53 3.58-43.11 1.92-38.52 3.42-107.33 9.43-107.33s9.67 102.87 9.79 107.33c.83 20.59 1.38 37.35 3.57 43.11 2.2 5.77-.55 24.16-2.47 51.91-1.92 27.74 3.48 45.78 5.86 59.13 2.38 13.37 2.66 36.99 1.28 43.44-1.37 6.45-2.33 8.79-1.37 12.08.67 2.3 1.2 3.2.91 6.55-.08-.92-.23-1.84-.47-2.72-.02-.06-.21-.24-.18-.1.59 2.65.25 5.22-.15 7.86 0 .04.02.1.06.16-.05.29-.1.58-.16.89-1.65 8.92-1.09 14.28.82 17.02.96 1.37 1.98 2.33 2.81 3.59 0 .19-.02.38-.03.55 0 .09.23.39.27.26.03-.09.04-.21.06-.31.67 1.19 1.16 2.69 1.28 4.97.28 5.21 1.09 7.54 3.71 10.57 2.61 3.02 3.98 4.95 4.26 7.84.27 2.88 2.61 6.45 7.69 6.86 5.08.42 6.86-3.56 5.63-6.04-1.24-2.47-3.16-5.9-.82-6.59.42-.12.77-.09 1.08.05.28.37.54.75.77 1.19.08.13.42.32.3.04-.1-.22-.22-.43-.34-.64 1.04 1.24 1.83 3.9 3.68 6.5 2.75 3.85 6.32 2.2 7.28-.55 4.26 1.38 8.24-.69 7.28-3.85 3.57 1.8 4.94-2.6 3.84-5.63 3.44-1.37 2.2-5.08-1.37-7.83-1.96-1.51-2.34-1.51-5.63-6.99-5.08-7.28-14.3-20.04-14.3-26.42 2.42-6.87 1.84-8.32 1.26-11.13-.57-2.8-1.97-5.11.96-23.78 3.66-23.07 9.89-33.69 15.74-69.94 5.86-36.24-2.93-70.3-4.03-90.08 0-23.43 5.13-32.22 13.91-73.22 8.79-41.02 10.99-79.1 9.15-98.5-1.82-19.41-6.96-36.98-11.17-60.88-2.19-21.14-3.29-27.73-5.21-40.64s-3.02-12.09-3.29-27.74c-.33-18.67 9.88-42.84 9.88-42.84s3.69 15.82 6.94 40.73c.02 1.29.07 2.5.13 3.52.11 1.9.29 3.17.29 3.17s.11-.61.25-1.59c4.99 37.98 8.85 61.1 17.02 82.33 4.68 12.17 11.35 27.92 11.86 33.99-.03.04-.07.08-.1.12-.51.69-.75 1.53-.83 2.16-.07.64 0 1.07 0 1.07s.18-.17.4-.44c-2.83 7.84-1.09 20.38.23 29.78a4.34 4.34 0 0 0-.63-.43s-.08.33-.01.76c.05.21.07.48.17.74.1.25.24.49.39.74.11.19.26.35.41.5.07.51.14 1.02.2 1.5 2.93 23.62 5.49 34.61 8.79 33.88 3.29-.73 1.28-11.17.74-17.77-.55-6.59-1.83-14.64-.74-15.01 1.1-.37 1.46 4.39 3.12 15.37 1.64 11 5.86 21.43 8.05 20.88 2.19-.55 3.11-2.57 1.83-9.52-1.29-6.97-6.41-28.75-5.13-28.93 1.29-.19 5.68 15.56 7.69 26.73 2.02 11.17 4.21 15.56 7.14 14.65 2.93-.92 2.57-3.66.55-13.73-2.02-10.08-7.14-29.84-5.13-30.39 2.01-.55 6.59 24.9 8.24 31.31 1.65 6.41 6.23 11.35 6.96 4.76.73-6.59-4.94-33.51-5.86-39.37-.91-5.86 3.48-3.48 6.96 1.65s10.43 7.51 12.08 4.94c2.01-3.12-6.04-8.24-10.8-17.93Z" style="fill:url(#radial-gradient);stroke-width:0"/><path class="cls-4" d="M319.91 450c-4.76-9.71-11.53-12.45-16.66-17.58-.06-.06-.11-.13-.17-.19.11.04.2.06.2.06s-.23-.47-.67-1.04c-.23-.27-.47-.61-.77-.92-.06-.07-.13-.13-.2-.2-3.89-7.19-5.4-24.87-7.35-56.5-2.2-35.7-3.66-44.12-9.98-62.61-6.54-19.15-6.31-24.72-6.31-38.45 1.92-22.79-1.83-38.81-1.47-46.69.37-7.87 3.85-14.09-2.01-38.26-7.87-29.11-20.69-32.59-32.63-37.8-11.94-5.22-29.94-13.19-40.65-18.26-10.71-5.08-10.84-5.69-10.84-11.26s.81-14.99.81-14.99h-.29c2.9-4.39 5.26-11.93 6.2-21 0 0 2.67 1.97 5.36-3.85 5.4-11.67 6.68-15.69 6.32-20.09-.37-4.4-4.39-4.4-4.39-4.4s13.91-49.25-35.34-53.46c-22.16-.92-49.09 14.35-40.65 53.58 0 0-5.97.2-4.18 8.36 1.79 8.15 4.98 12.93 6.97 17.11 1.99 4.18 3.58 4.38 4.77 2.79 0 0 .8 13.9 6.15 20.99.07.66 1.01 9.57 1.01 14.94s-.12 6.17-10.83 11.26c-10.71 5.08-28.7 13.04-40.64 18.26-11.95 5.21-24.76 8.69-32.64 37.8-5.85 24.17-2.38 30.39-2.01 38.26.37 7.88-3.39 23.9-1.46 46.69 0 13.73.22 19.3-6.32 38.45-6.31 18.49-7.78 26.91-9.97 62.61-1.88 30.58-3.36 48.11-6.97 55.74-.3.34-.68.62-.97.95-.31.31-.54.65-.78.92-.43.57-.67 1.04-.67 1.04s.34-.1.82-.32c-.13.16-.27.31-.41.45-5.12 5.13-11.9 7.87-16.66 17.58-4.76 9.7-12.81 14.82-10.8 17.93 1.65 2.57 8.6.19 12.08-4.94 3.48-5.13 7.88-7.51 6.96-1.65-.92 5.86-6.6 32.77-5.86 39.37.73 6.59 5.31 1.65 6.96-4.76 1.65-6.42 6.23-31.86 8.24-31.31 2.01.55-3.12 20.31-5.13 30.39-2.01 10.07-2.38 12.81.54 13.73 2.93.92 5.14-3.48 7.15-14.65 2.02-11.17 6.41-26.92 7.69-26.73 1.28.18-3.84 21.96-5.13 28.93-1.28 6.96-.37 8.97 1.83 9.52 2.2.55 6.41-9.88 8.05-20.88 1.65-10.98 2.01-15.74 3.11-15.37 1.1.36-.18 8.42-.73 15.01s-2.56 17.04.73 17.77c3.3.73 5.86-10.25 8.79-33.88.09-.68.18-1.39.29-2.12.12-.21.24-.41.32-.63.1-.25.12-.53.17-.74.07-.43-.01-.76-.01-.76s-.08.04-.2.12c1.3-9.31 2.97-21.59.22-29.35 0-.19 0-.44-.03-.74-.06-.51-.24-1.15-.57-1.74.12-5.62 7.07-21.98 11.89-34.53 8.07-20.97 11.94-43.8 16.84-80.96.02.14.04.22.04.22s.12-.87.23-2.23c.13-.96.25-1.92.38-2.9 3.29-25.81 7.14-42.29 7.14-42.29s10.21 24.17 9.88 42.84c-.27 15.65-1.37 14.82-3.3 27.74-1.92 12.91-3.02 19.5-5.21 40.64-4.21 23.9-9.34 41.47-11.17 60.88-1.83 19.41.37 57.49 9.15 98.5 8.79 41 13.91 49.79 13.91 73.22-1.09 19.78-9.89 53.84-4.03 90.08 5.86 36.26 12.08 46.87 15.74 69.94 2.93 18.67 1.53 20.97.96 23.78-.59 2.81-1.16 4.26 1.26 11.13 0 6.38-9.22 19.15-14.3 26.42-3.29 5.48-3.66 5.48-5.63 6.99-3.57 2.75-4.8 6.45-1.37 7.83-1.1 3.03.27 7.43 3.84 5.63-.96 3.16 3.02 5.23 7.28 3.85.97 2.75 4.53 4.4 7.28.55 2.75-3.85 3.17-7.83 5.5-7.14 2.33.69.41 4.12-.82 6.59-1.24 2.47.55 6.45 5.63 6.04 5.08-.41 7.41-3.98 7.69-6.86.27-2.89 1.65-4.81 4.26-7.84 2.61-3.02 3.43-5.36 3.71-10.57.27-5.22 2.47-6.32 4.4-9.07 1.92-2.74 2.47-8.09.82-17.02-1.65-8.93-.96-9.34 0-12.64.96-3.3 0-5.63-1.37-12.08s-1.1-30.06 1.29-43.44c2.38-13.36 7.78-31.39 5.86-59.13-1.92-27.74-4.67-46.14-2.48-51.91 2.2-5.76 2.55-22.53 3.58-43.11 1.92-38.52 3.42-107.33 9.43-107.33s9.67 102.87 9.79 107.33c.83 20.59 1.38 37.35 3.57 43.11 2.2 5.77-.55 24.16-2.47 51.91-1.92 27.74 3.48 45.78 5.86 59.13 2.38 13.37 2.66 36.99 1.28 43.44-1.37 6.45-2.33 8.79-1.37 12.08.67 2.3 1.2 3.2.91 6.55-.08-.92-.23-1.84-.47-2.72-.02-.06-.21-.24-.18-.1.59 2.65.25 5.22-.15 7.86 0 .04.02.1.06.16-.05.29-.1.58-.16.89-1.65 8.92-1.09 14.28.82 17.02.96 1.37 1.98 2.33 2.81 3.59 0 .19-.02.38-.03.55 0 .09.23.39.27.26.03-.09.04-.21.06-.31.67 1.19 1.16 2.69 1.28 4.97.28 5.21 1.09 7.54 3.71 10.57 2.61 3.02 3.98 4.95 4.26 7.84.27 2.88 2.61 6.45 7.69 6.86 5.08.42 6.86-3.56 5.63-6.04-1.24-2.47-3.16-5.9-.82-6.59.42-.12.77-.09 1.08.05.28.37.54.75.77 1.19.08.13.42.32.3.04-.1-.22-.22-.43-.34-.64 1.04 1.24 1.83 3.9 3.68 6.5 2.75 3.85 6.32 2.2 7.28-.55 4.26 1.38 8.24-.69 7.28-3.85 3.57 1.8 4.94-2.6 3.84-5.63 3.44-1.37 2.2-5.08-1.37-7.83-1.96-1.51-2.34-1.51-5.63-6.99-5.08-7.28-14.3-20.04-14.3-26.42 2.42-6.87 1.84-8.32 1.26-11.13-.57-2.8-1.97-5.11.96-23.78 3.66-23.07 9.89-33.69 15.74-69.94 5.86-36.24-2.93-70.3-4.03-90.08 0-23.43 5.13-32.22 13.91-73.22 8.79-41.02 10.99-79.1 9.15-98.5-1.82-19.41-6.96-36.98-11.17-60.88-2.19-21.14-3.29-27.73-5.21-40.64s-3.02-12.09-3.29-27.74c-.33-18.67 9.88-42.84 9.88-42.84s3.69 15.82 6.94 40.73c.02 1.29.07 2.5.13 3.52.11 1.9.29 3.17.29 3.17s.11-.61.25-1.59c4.99 37.98 8.85 61.1 17.02 82.33 4.68 12.17 11.35 27.92 11.86 33.99-.03.04-.07.08-.1.12-.51.69-.75 1.53-.83 2.16-.07.64 0 1.07 0 1.07s.18-.17.4-.44c-2.83 7.84-1.09 20.38.23 29.78a4.34 4.34 0 0 0-.63-.43s-.08.33-.01.76c.05.21.07.48.17.74.1.25.24.49.39.74.11.19.26.35.41.5.07.51.14 1.02.2 1.5 2.93 23.62 5.49 34.61 8.79 33.88 3.29-.73 1.28-11.17.74-17.77-.55-6.59-1.83-14.64-.74-15.01 1.1-.37 1.46 4.39 3.12 15.37 1.64 11 5.86 21.43 8.05 20.88 2.19-.55 3.11-2.57 1.83-9.52-1.29-6.97-6.41-28.75-5.13-28.93 1.29-.19 5.68 15.56 7.69 26.73 2.02 11.17 4.21 15.56 7.14 14.65 2.93-.92 2.57-3.66.55-13.73-2.02-10.08-7.14-29.84-5.13-30.39 2.01-.55 6.59 24.9 8.24 31.31 1.65 6.41 6.23 11.35 6.96 4.76.73-6.59-4.94-33.51-5.86-39.37-.91-5.86 3.48-3.48 6.96 1.65s10.43 7.51 12.08 4.94c2.01-3.12-6.04-8.24-10.8-17.93Z"/><path class="cls-4" d="M319.91 450c-4.76-9.71-11.53-12.45-16.66-17.58-.06-.06-.11-.13-.17-.19.11.04.2.06.2.06s-.23-.47-.67-1.04c-.23-.27-.47-.61-.77-.92-.06-.07-.13-.13-.2-.2-3.89-7.19-5.4-24.87-7.35-56.5-2.2-35.7-3.66-44.12-9.98-62.61-6.54-19.15-6.31-24.72-6.31-38.45 1.92-22.79-1.83-38.81-1.47-46.69.37-7.87 3.85-14.09-2.01-38.26-7.87-29.11-20.69-32.59-32.63-37.8-11.94-5.22-29.94-13.19-40.65-18.26-10.71-5.08-10.84-5.69-10.84-11.26s.81-14.99.81-14.99h-.29c2.9-4.39 5.26-11.93 6.2-21 0 0 2.67 1.97 5.36-3.85 5.4-11.67 6.68-15.69 6.32-20.09-.37-4.4-4.39-4.4-4.39-4.4s13.91-49.25-35.34-53.46c-22.16-.92-49.09 14.35-40.65 53.58 0 0-5.97.2-4.18 8.36 1.79 8.15 4.98 12.93 6.97 17.11 1.99 4.18 3.58 4.38 4.77 2.79 0 0 .8 13.9 6.15 20.99.07.66 1.01 9.57 1.01 14.94s-.12 6.17-10.83 11.26c-10.71 5.08-28.7 13.04-40.64 18.26-11.95 5.21-24.76 8.69-32.64 37.8-5.85 24.17-2.38 30.39-2.01 38.26.37 7.88-3.39 23.9-1.46 46.69 0 13.73.22 19.3-6.32 38.45-6.31 18.49-7.78 26.91-9.97 62.61-1.88 30.58-3.36 48.11-6.97 55.74-.3.34-.68.62-.97.95-.31.31-.54.65-.78.92-.43.57-.67 1.04-.67 1.04s.34-.1.82-.32c-.13.16-.27.31-.41.45-5.12 5.13-11.9 7.87-16.66 17.58-4.76 9.7-12.81 14.82-10.8 17.93 1.65 2.57 8.6.19 12.08-4.94 3.48-5.13 7.88-7.51 6.96-1.65-.92 5.86-6.6 32.77-5.86 39.37.73 6.59 5.31 1.65 6.96-4.76 1.65-6.42 6.23-31.86 8.24-31.31 2.01.55-3.12 20.31-5.13 30.39-2.01 10.07-2.38 12.81.54 13.73 2.93.92 5.14-3.48 7.15-14.65 2.02-11.17 6.41-26.92 7.69-26.73 1.28.18-3.84 21.96-5.13 28.93-1.28 6.96-.37 8.97 1.83 9.52 2.2.55 6.41-9.88 8.05-20.88 1.65-10.98 2.01-15.74 3.11-15.37 1.1.36-.18 8.42-.73 15.01s-2.56 17.04.73 17.77c3.3.73 5.86-10.25 8.79-33.88.09-.68.18-1.39.29-2.12.12-.21.24-.41.32-.63.1-.25.12-.53.17-.74.07-.43-.01-.76-.01-.76s-.08.04-.2.12c1.3-9.31 2.97-21.59.22-29.35 0-.19 0-.44-.03-.74-.06-.51-.24-1.15-.57-1.74.12-5.62 7.07-21.98 11.89-34.53 8.07-20.97 11.94-43.8 16.84-80.96.02.14.04.22.04.22s.12-.87.23-2.23c.13-.96.25-1.92.38-2.9 3.29-25.81 7.14-42.29 7.14-42.29s10.21 24.17 9.88 42.84c-.27 15.65-1.37 14.82-3.3 27.74-1.92 12.91-3.02 19.5-5.21 40.64-4.21 23.9-9.34 41.47-11.17 60.88-1.83 19.41.37 57.49 9.15 98.5 8.79 41 13.91 49.79 13.91 73.22-1.09 19.78-9.89 53.84-4.03 90.08 5.86 36.26 12.08 46.87 15.74 69.94 2.93 18.67 1.53 20.97.96 23.78-.59 2.81-1.16 4.26 1.26 11.13 0 6.38-9.22 19.15-14.3 26.42-3.29 5.48-3.66 5.48-5.63 6.99-3.57 2.75-4.8 6.45-1.37 7.83-1.1 3.03.27 7.43 3.84 5.63-.96 3.16 3.02 5.23 7.28 3.85.97 2.75 4.53 4.4 7.28.55 2.75-3.85 3.17-7.83 5.5-7.14 2.33.69.41 4.12-.82 6.59-1.24 2.47.55 6.45 5.63 6.04 5.08-.41 7.41-3.98 7.69-6.86.27-2.89 1.65-4.81 4.26-7.84 2.61-3.02 3.43-5.36 3.71-10.57.27-5.22 2.47-6.32 4.4-9.07 1.92-2.74 2.47-8.09.82-17.02-1.65-8.93-.96-9.34 0-12.64.96-3.3 0-5.63-1.37-12.08s-1.1-30.06 1.29-43.44c2.38-13.36 7.78-31.39 5.86-59.13-1.92-27.74-4.67-46.14-2.48-51.91 2.2-5.76 2.55-22.53 3.58-43.11 1.92-38.52 3.42-107.33 9.43-107.33s9.67 102.87 9.79 107.33c.83 20.59 1.38 37.35 3.57 43.11 2.2 5.77-.55 24.16-2.47 51.91-1.92 27.74 3.48 45.78 5.86 59.13 2.38 13.37 2.66 36.99 1.28 43.44-1.37 6.45-2.33 8.79-1.37 12.08.67 2.3 1.2 3.2.91 6.55-.08-.92-.23-1.84-.47-2.72-.02-.06-.21-.24-.18-.1.59 2.65.25 5.22-.15 7.86 0 .04.02.1.06.16-.05.29-.1.58-.16.89-1.65 8.92-1.09 14.28.82 17.02.96 1.37 1.98 2.33 2.81 3.59 0 .19-.02.38-.03.55 0 .09.23.39.27.26.03-.09.04-.21.06-.31.67 1.19 1.16 2.69 1.28 4.97.28 5.21 1.09 7.54 3.71 10.57 2.61 3.02 3.98 4.95 4.26 7.84.27 2.88 2.61 6.45 7.69 6.86 5.08.42 6.86-3.56 5.63-6.04-1.24-2.47-3.16-5.9-.82-6.59.42-.12.77-.09 1.08.05.28.37.54.75.77 1.19.08.13.42.32.3.04-.1-.22-.22-.43-.34-.64 1.04 1.24 1.83 3.9 3.68 6.5 2.75 3.85 6.32 2.2 7.28-.55 4.26 1.38 8.24-.69 7.28-3.85 3.57 1.8 4.94-2.6 3.84-5.63 3.44-1.37 2.2-5.08-1.37-7.83-1.96-1.51-2.34-1.51-5.63-6.99-5.08-7.28-14.3-20.04-14.3-26.42 2.42-6.87 1.84-8.32 1.26-11.13-.57-2.8-1.97-5.11.96-23.78 3.66-23.07 9.89-33.69 15.74-69.94 5.86-36.24-2.93-70.3-4.03-90.08 0-23.43 5.13-32.22 13.91-73.22 8.79-41.02 10.99-79.1 9.15-98.5-1.82-19.41-6.96-36.98-11.17-60.88-2.19-21.14-3.29-27.73-5.21-40.64s-3.02-12.09-3.29-27.74c-.33-18.67 9.88-42.84 9.88-42.84s3.69 15.82 6.94 40.73c.02 1.29.07 2.5.13 3.52.11 1.9.29 3.17.29 3.17s.11-.61.25-1.59c4.99 37.98 8.85 61.1 17.02 82.33 4.68 12.17 11.35 27.92 11.86 33.99-.03.04-.07.08-.1.12-.51.69-.75 1.53-.83 2.16-.07.64 0 1.07 0 1.07s.18-.17.4-.44c-2.83 7.84-1.09 20.38.23 29.78a4.34 4.34 0 0 0-.63-.43s-.08.33-.01.76c.05.21.07.48.17.74.1.25.24.49.39.74.11.19.26.35.41.5.07.51.14 1.02.2 1.5 2.93 23.62 5.49 34.61 8.79 33.88 3.29-.73 1.28-11.17.74-17.77-.55-6.59-1.83-14.64-.74-15.01 1.1-.37 1.46 4.39 3.12 15.37 1.64 11 5.86 21.43 8.05 20.88 2.19-.55 3.11-2.57 1.83-9.52-1.29-6.97-6.41-28.75-5.13-28.93 1.29-.19 5.68 15.56 7.69 26.73 2.02 11.17 4.21 15.56 7.14 14.65 2.93-.92 2.57-3.66.55-13.73-2.02-10.08-7.14-29.84-5.13-30.39 2.01-.55 6.59 24.9 8.24 31.31 1.65 6.41 6.23 11.35 6.96 4.76.73-6.59-4.94-33.51-5.86-39.37-.91-5.86 3.48-3.48 6.96 1.65s10.43 7.51 12.08 4.94c2.01-3.12-6.04-8.24-10.8-17.93Z"/><path class="cls-1" d="M113.46 849.45c-.33-.05-.66-.09-1-.11-.43-.55-.91-1.06-1.46-1.52-.04-.04-.09-.07-.13-.11 1.65-1.6 3-3.52 5.24-7.24l.7-1.01c8.32-11.87 15.21-22.39 15.21-30.87 0-1.13-.19-2.26-.57-3.33-1.17-3.32-1.2-4.28-1.2-4.31.01-.09.11-.54.18-.87l.12-.58c.04-.21.09-.38.13-.57 1.06-4.42 1.72-9.49-1-26.8-1.73-10.87-4-19.17-6.42-27.96-2.9-10.55-6.18-22.5-9.33-42.03-3.99-24.7-.76-48.48 1.85-67.59 1.06-7.75 1.97-14.44 2.29-20.34.01-.18.02-.37.02-.55 0-16.85-2.52-26.94-6.7-43.66-2.02-8.09-4.54-18.16-7.43-31.66-8.62-40.26-10.72-76.96-8.98-95.47 1.08-11.46 3.37-22.27 6.03-34.79 1.67-7.89 3.4-16.04 5.03-25.29.04-.23.07-.47.1-.7 1.94-18.7 2.99-25.71 4.58-36.31l.58-3.89c.57-3.83 1.06-6.36 1.49-8.59 1.12-5.8 1.72-9.34 1.91-20.44.36-20.55-10.22-45.84-10.67-46.91a10.008 10.008 0 0 0-9.21-6.11c-.28 0-.57.01-.86.04-4.32.37-7.9 3.47-8.89 7.69-.16.69-4 17.27-7.32 43.29l-.38 2.87-.06.53c-.02.21-.03.4-.05.57-.07.29-.12.6-.16.9-4.95 37.55-8.65 58.9-16.26 78.67-.92 2.38-1.91 4.89-2.91 7.44-5.9 14.96-9.52 24.44-9.65 30.46-.03 1.29.19 2.58.65 3.78.08.77.25 1.53.51 2.26 1.68 4.75.71 14.14-.23 21.22h-.03c-.39 0-.86.02-1.39.09a10.156 10.156 0 0 0-4.96-2.17c-.46-.07-.96-.1-1.42-.1-1.05 0-2.01.13-2.89.37-1.74-1.77-3.75-2.5-4.7-2.76-.86-.23-1.81-.36-2.7-.36h-.2c-.45-1.03-1.05-1.99-1.79-2.86-.88-1.03-1.93-1.87-3.09-2.51 1.59-1.75 3.39-3.16 5.42-4.75 1.92-1.51 3.91-3.06 5.88-5.03.32-.32.64-.67.95-1.04.67-.79 1.2-1.65 1.59-2.56.57-.67 1.06-1.42 1.44-2.22 4.21-8.91 5.78-24.81 7.91-59.4 2.21-36 3.67-43.04 9.46-60 6.87-20.09 6.86-27.29 6.85-40.36v-1.32c0-.28-.01-.56-.04-.84-1.19-14.05-.06-25.54.77-33.93.49-5 .88-8.96.72-12.39-.1-2.19-.38-4.17-.65-6.09-.81-5.78-1.73-12.33 2.36-29.23 6.05-22.25 14.11-25.67 24.32-29.99.88-.37 1.76-.75 2.63-1.13 8.24-3.6 28.7-12.59 40.93-18.39 11.17-5.3 16.54-8.38 16.54-20.29 0-5.84-.96-14.98-1.07-16a10 10 0 0 0-1.96-4.96c-2.49-3.3-3.93-11.76-4.15-15.55-.24-4.14-3.01-7.7-6.96-8.96-.13-.24-.25-.49-.38-.73-1.51-2.9-3.07-5.88-4.18-10.01.69-.52 1.32-1.13 1.86-1.83a9.972 9.972 0 0 0 1.89-8.25c-2.84-13.23-1.28-23.64 4.63-30.97 5.34-6.61 14.45-10.55 24.36-10.55.42 0 .84 0 1.25.02 11 .98 18.76 4.64 23.09 10.89 8.08 11.68 3.31 29.69 3.26 29.87a10.005 10.005 0 0 0 3.68 10.76c-.56 2.02-1.82 5.19-4.37 10.76a10.012 10.012 0 0 0-6.91 8.49c-.87 8.37-2.94 14.02-4.6 16.52a10.03 10.03 0 0 0-1.53 7.14c-.25 3.31-.65 9.21-.65 13.36 0 11.91 5.37 14.99 16.55 20.29 12.21 5.79 32.69 14.79 40.93 18.39.88.38 1.76.76 2.64 1.13 10.2 4.33 18.27 7.75 24.31 29.99 4.08 16.91 3.17 23.45 2.36 29.23-.27 1.91-.54 3.89-.65 6.08-.16 3.43.23 7.38.72 12.38.83 8.39 1.95 19.88.77 33.93-.02.28-.04.56-.04.84v1.32c0 13.07-.01 20.27 6.85 40.36 5.79 16.95 7.25 23.98 9.47 60 2.12 34.4 3.65 51.6 8.53 60.63.38.71.85 1.36 1.38 1.96.38.74.86 1.43 1.44 2.07.19.21.37.41.56.59 1.94 1.94 3.92 3.5 5.84 5 2.03 1.6 3.83 3 5.42 4.75-1.16.63-2.21 1.48-3.09 2.5-.75.87-1.34 1.82-1.79 2.86h-.19c-.89 0-1.84.13-2.7.36-.95.26-2.96.98-4.7 2.76-.88-.24-1.84-.37-2.9-.37-.48 0-.98.04-1.45.1-1.81.26-3.52 1.02-4.93 2.17-.53-.07-1-.09-1.39-.09h-.03c-.95-7.2-1.9-16.6-.21-21.28.37-1.02.56-2.07.59-3.11.43-1.29.61-2.66.49-4.04-.5-5.91-3.95-15.01-9.58-29.3-1-2.55-2-5.06-2.91-7.44-7.65-19.87-11.4-41.64-16.44-80.04-.1-.75-.28-1.47-.53-2.16-.02-.59-.04-1.21-.05-1.81 0-.38-.03-.75-.08-1.13-3.28-25.12-6.97-41.04-7.12-41.71-.99-4.22-4.57-7.32-8.89-7.69-.29-.02-.57-.04-.86-.04-3.99 0-7.63 2.38-9.21 6.11-.45 1.07-11.04 26.36-10.67 46.92.19 11.09.79 14.63 1.91 20.42.43 2.23.92 4.77 1.49 8.61l.56 3.76c1.6 10.64 2.65 17.66 4.59 36.44.02.24.06.47.1.71 1.63 9.24 3.36 17.38 5.03 25.25 2.66 12.53 4.96 23.36 6.04 34.83 1.75 18.51-.35 55.21-8.98 95.47-2.89 13.51-5.41 23.59-7.44 31.69-4.17 16.7-6.7 26.78-6.7 43.63 0 .19 0 .37.02.55.33 5.89 1.24 12.58 2.29 20.32 2.6 19.12 5.84 42.9 1.85 67.61-3.15 19.53-6.44 31.49-9.33 42.04-2.41 8.78-4.69 17.08-6.41 27.93-2.71 17.31-2.06 22.38-1 26.8.04.19.09.36.13.54l.13.63c.07.33.17.78.18.91s-.04.96-1.2 4.27a9.905 9.905 0 0 0-.57 3.32c0 8.48 6.88 19 15.2 30.87l.71 1.01c2.24 3.72 3.58 5.64 5.24 7.24-.05.04-.09.08-.14.11-.54.46-1.03.97-1.45 1.51-.33.02-.66.06-.98.11-.46-.83-1-1.67-1.69-2.49a9.85 9.85 0 0 0-1.73-1.63 10.1 10.1 0 0 0-2.49-1.63c-1.51-.69-3.11-1.04-4.76-1.04-1.13 0-2.26.17-3.36.5a11.51 11.51 0 0 0-4.79 2.8c-.49-.61-1-1.22-1.52-1.82-.93-1.07-1.12-1.3-1.29-4.57-.19-3.58-1.03-6.65-2.57-9.37-.1-.18-.21-.35-.32-.53-.1-.17-.2-.34-.31-.51-.77-1.18-1.54-2.1-2.16-2.84-.23-.27-.44-.52-.61-.74-.16-.67-.58-3.36.6-9.76l.17-.94c.09-.52.15-1.05.16-1.57.1-.72.2-1.5.28-2.34.22-.69.37-1.42.44-2.17.39-4.43-.23-6.88-1.02-9.4-.08-.24-.16-.49-.24-.77.04-.6.41-2.24.75-3.69.24-1.04.51-2.22.79-3.56 1.83-8.59 1.19-33.77-1.22-47.27-.45-2.55-1-5.19-1.58-7.99-2.51-12.18-5.63-27.33-4.15-48.7.57-8.21 1.21-15.6 1.78-22.12 1.72-19.81 2.33-28.08.06-34.03-1.49-3.91-2.18-21.24-2.79-36.52l-.13-3.38c-.1-3.42-1.05-29.82-2.7-55.63-3.38-52.75-5.77-61.36-17.08-61.36-13.59 0-14.98 11.68-18.37 92.98-.36 8.61-.7 16.75-1.05 23.85-.18 3.65-.34 7.18-.5 10.55-.56 12.3-1.2 26.25-2.43 29.49-2.27 5.96-1.66 14.24.07 34.06.57 6.51 1.21 13.9 1.78 22.1 1.48 21.36-1.64 36.52-4.15 48.69-.58 2.8-1.12 5.45-1.58 8-2.4 13.47-3.06 38.65-1.22 47.27.29 1.34.55 2.51.79 3.56.33 1.46.71 3.09.75 3.69-.09.3-.17.54-.24.78-1.42 4.54-1.62 7.55.02 16.43 1.18 6.4.76 9.08.6 9.76-.17.22-.38.47-.61.74-1.86 2.21-4.98 5.9-5.36 13.25-.17 3.26-.37 3.49-1.29 4.56-.52.6-1.03 1.2-1.52 1.82a11.718 11.718 0 0 0-4.83-2.81c-1.08-.32-2.21-.49-3.33-.49-5.86 0-8.97 3.88-10.65 6.8Z"/><path class="cls-1" d="M113.46 849.45c-.33-.05-.66-.09-1-.11-.43-.55-.91-1.06-1.46-1.52-.04-.04-.09-.07-.13-.11 1.65-1.6 3-3.52 5.24-7.24l.7-1.01c8.32-11.87 15.21-22.39 15.21-30.87 0-1.13-.19-2.26-.57-3.33-1.17-3.32-1.2-4.28-1.2-4.31.01-.09.11-.54.18-.87l.12-.58c.04-.21.09-.38.13-.57 1.06-4.42 1.72-9.49-1-26.8-1.73-10.87-4-19.17-6.42-27.96-2.9-10.55-6.18-22.5-9.33-42.03-3.99-24.7-.76-48.48 1.85-67.59 1.06-7.75 1.97-14.44 2.29-20.34.01-.18.02-.37.02-.55 0-16.85-2.52-26.94-6.7-43.66-2.02-8.09-4.54-18.16-7.43-31.66-8.62-40.26-10.72-76.96-8.98-95.47 1.08-11.46 3.37-22.27 6.03-34.79 1.67-7.89 3.4-16.04 5.03-25.29.04-.23.07-.47.1-.7 1.94-18.7 2.99-25.71 4.58-36.31l.58-3.89c.57-3.83 1.06-6.36 1.49-8.59 1.12-5.8 1.72-9.34 1.91-20.44.36-20.55-10.22-45.84-10.67-46.91a10.008 10.008 0 0 0-9.21-6.11c-.28 0-.57.01-.86.04-4.32.37-7.9 3.47-8.89 7.69-.16.69-4 17.27-7.32 43.29l-.38 2.87-.06.53c-.02.21-.03.4-.05.57-.07.29-.12.6-.16.9-4.95 37.55-8.65 58.9-16.26 78.67-.92 2.38-1.91 4.89-2.91 7.44-5.9 14.96-9.52 24.44-9.65 30.46-.03 1.29.19 2.58.65 3.78.08.77.25 1.53.51 2.26 1.68 4.75.71 14.14-.23 21.22h-.03c-.39 0-.86.02-1.39.09a10.156 10.156 0 0 0-4.96-2.17c-.46-.07-.96-.1-1.42-.1-1.05 0-2.01.13-2.89.37-1.74-1.77-3.75-2.5-4.7-2.76-.86-.23-1.81-.36-2.7-.36h-.2c-.45-1.03-1.05-1.99-1.79-2.86-.88-1.03-1.93-1.87-3.09-2.51 1.59-1.75 3.39-3.16 5.42-4.75 1.92-1.51 3.91-3.06 5.88-5.03.32-.32.64-.67.95-1.04.67-.79 1.2-1.65 1.59-2.56.57-.67 1.06-1.42 1.44-2.22 4.21-8.91 5.78-24.81 7.91-59.4 2.21-36 3.67-43.04 9.46-60 6.87-20.09 6.86-27.29 6.85-40.36v-1.32c0-.28-.01-.56-.04-.84-1.19-14.05-.06-25.54.77-33.93.49-5 .88-8.96.72-12.39-.1-2.19-.38-4.17-.65-6.09-.81-5.78-1.73-12.33 2.36-29.23 6.05-22.25 14.11-25.67 24.32-29.99.88-.37 1.76-.75 2.63-1.13 8.24-3.6 28.7-12.59 40.93-18.39 11.17-5.3 16.54-8.38 16.54-20.29 0-5.84-.96-14.98-1.07-16a10 10 0 0 0-1.96-4.96c-2.49-3.3-3.93-11.76-4.15-15.55-.24-4.14-3.01-7.7-6.96-8.96-.13-.24-.25-.49-.38-.73-1.51-2.9-3.07-5.88-4.18-10.01.69-.52 1.32-1.13 1.86-1.83a9.972 9.972 0 0 0 1.89-8.25c-2.84-13.23-1.28-23.64 4.63-30.97 5.34-6.61 14.45-10.55 24.36-10.55.42 0 .84 0 1.25.02 11 .98 18.76 4.64 23.09 10.89 8.08 11.68 3.31 29.69 3.26 29.87a10.005 10.005 0 0 0 3.68 10.76c-.56 2.02-1.82 5.19-4.37 10.76a10.012 10.012 0 0 0-6.91 8.49c-.87 8.37-2.94 14.02-4.6 16.52a10.03 10.03 0 0 0-1.53 7.14c-.25 3.31-.65 9.21-.65 13.36 0 11.91 5.37 14.99 16.55 20.29 12.21 5.79 32.69 14.79 40.93 18.39.88.38 1.76.76 2.64 1.13 10.2 4.33 18.27 7.75 24.31 29.99 4.08 16.91 3.17 23.45 2.36 29.23-.27 1.91-.54 3.89-.65 6.08-.16 3.43.23 7.38.72 12.38.83 8.39 1.95 19.88.77 33.93-.02.28-.04.56-.04.84v1.32c0 13.07-.01 20.27 6.85 40.36 5.79 16.95 7.25 23.98 9.47 60 2.12 34.4 3.65 51.6 8.53 60.63.38.71.85 1.36 1.38 1.96.38.74.86 1.43 1.44 2.07.19.21.37.41.56.59 1.94 1.94 3.92 3.5 5.84 5 2.03 1.6 3.83 3 5.42 4.75-1.16.63-2.21 1.48-3.09 2.5-.75.87-1.34 1.82-1.79 2.86h-.19c-.89 0-1.84.13-2.7.36-.95.26-2.96.98-4.7 2.76-.88-.24-1.84-.37-2.9-.37-.48 0-.98.04-1.45.1-1.81.26-3.52 1.02-4.93 2.17-.53-.07-1-.09-1.39-.09h-.03c-.95-7.2-1.9-16.6-.21-21.28.37-1.02.56-2.07.59-3.11.43-1.29.61-2.66.49-4.04-.5-5.91-3.95-15.01-9.58-29.3-1-2.55-2-5.06-2.91-7.44-7.65-19.87-11.4-41.64-16.44-80.04-.1-.75-.28-1.47-.53-2.16-.02-.59-.04-1.21-.05-1.81 0-.38-.03-.75-.08-1.13-3.28-25.12-6.97-41.04-7.12-41.71-.99-4.22-4.57-7.32-8.89-7.69-.29-.02-.57-.04-.86-.04-3.99 0-7.63 2.38-9.21 6.11-.45 1.07-11.04 26.36-10.67 46.92.19 11.09.79 14.63 1.91 20.42.43 2.23.92 4.77 1.49 8.61l.56 3.76c1.6 10.64 2.65 17.66 4.59 36.44.02.24.06.47.1.71 1.63 9.24 3.36 17.38 5.03 25.25 2.66 12.53 4.96 23.36 6.04 34.83 1.75 18.51-.35 55.21-8.98 95.47-2.89 13.51-5.41 23.59-7.44 31.69-4.17 16.7-6.7 26.78-6.7 43.63 0 .19 0 .37.02.55.33 5.89 1.24 12.58 2.29 20.32 2.6 19.12 5.84 42.9 1.85 67.61-3.15 19.53-6.44 31.49-9.33 42.04-2.41 8.78-4.69 17.08-6.41 27.93-2.71 17.31-2.06 22.38-1 26.8.04.19.09.36.13.54l.13.63c.07.33.17.78.18.91s-.04.96-1.2 4.27a9.905 9.905 0 0 0-.57 3.32c0 8.48 6.88 19 15.2 30.87l.71 1.01c2.24 3.72 3.58 5.64 5.24 7.24-.05.04-.09.08-.14.11-.54.46-1.03.97-1.45 1.51-.33.02-.66.06-.98.11-.46-.83-1-1.67-1.69-2.49a9.85 9.85 0 0 0-1.73-1.63 10.1 10.1 0 0 0-2.49-1.63c-1.51-.69-3.11-1.04-4.76-1.04-1.13 0-2.26.17-3.36.5a11.51 11.51 0 0 0-4.79 2.8c-.49-.61-1-1.22-1.52-1.82-.93-1.07-1.12-1.3-1.29-4.57-.19-3.58-1.03-6.65-2.57-9.37-.1-.18-.21-.35-.32-.53-.1-.17-.2-.34-.31-.51-.77-1.18-1.54-2.1-2.16-2.84-.23-.27-.44-.52-.61-.74-.16-.67-.58-3.36.6-9.76l.17-.94c.09-.52.15-1.05.16-1.57.1-.72.2-1.5.28-2.34.22-.69.37-1.42.44-2.17.39-4.43-.23-6.88-1.02-9.4-.08-.24-.16-.49-.24-.77.04-.6.41-2.24.75-3.69.24-1.04.51-2.22.79-3.56 1.83-8.59 1.19-33.77-1.22-47.27-.45-2.55-1-5.19-1.58-7.99-2.51-12.18-5.63-27.33-4.15-48.7.57-8.21 1.21-15.6 1.78-22.12 1.72-19.81 2.33-28.08.06-34.03-1.49-3.91-2.18-21.24-2.79-36.52l-.13-3.38c-.1-3.42-1.05-29.82-2.7-55.63-3.38-52.75-5.77-61.36-17.08-61.36-13.59 0-14.98 11.68-18.37 92.98-.36 8.61-.7 16.75-1.05 23.85-.18 3.65-.34 7.18-.5 10.55-.56 12.3-1.2 26.25-2.43 29.49-2.27 5.96-1.66 14.24.07 34.06.57 6.51 1.21 13.9 1.78 22.1 1.48 21.36-1.64 36.52-4.15 48.69-.58 2.8-1.12 5.45-1.58 8-2.4 13.47-3.06 38.65-1.22 47.27.29 1.34.55 2.51.79 3.56.33 1.46.71 3.09.75 3.69-.09.3-.17.54-.24.78-1.42 4.54-1.62 7.55.02 16.43 1.18 6.4.76 9.08.6 9.76-.17.22-.38.47-.61.74-1.86 2.21-4.98 5.9-5.36 13.25-.17 3.26-.37 3.49-1.29 4.56-.52.6-1.03 1.2-1.52 1.82a11.718 11.718 0 0 0-4.83-2.81c-1.08-.32-2.21-.49-3.33-.49-5.86 0-8.97 3.88-10.65 6.8Z"/><path d="M128.66 556.58a769.93 769.93 0 0 1-5.15-22.42c-8.13-37.97-10.17-72.96-8.62-89.4.97-10.32 3.16-20.61 5.68-32.52 1.71-8.07 3.47-16.39 5.16-25.97.12-.69.22-1.41.3-2.11 1.9-18.25 2.92-25.08 4.46-35.41l.58-3.9c.51-3.41.94-5.61 1.35-7.74 1.39-7.16 2.06-11.85 2.27-23.9.43-24.33-10.95-51.97-12.25-55.04a29.936 29.936 0 0 0-27.63-18.32c-.87 0-1.74.04-2.59.11-2.13.18-4.19.58-6.18 1.19.04-.46.09-.91.13-1.36.55-5.58 1.02-10.4.8-15.27-.14-3.11-.52-5.78-.82-7.92-.61-4.38-1.19-8.51 1.92-21.49 2.34-8.51 4.5-11.66 5.59-12.78 1.17-1.21 3.26-2.13 7.16-3.78.94-.4 1.88-.8 2.82-1.21 8.33-3.64 29.02-12.74 41.51-18.66 6.79-3.22 15.69-7.45 21.61-15.93 5.92 8.48 14.82 12.7 21.61 15.92 12.49 5.92 33.18 15.01 41.49 18.65.95.41 1.9.82 2.85 1.22 3.9 1.65 5.99 2.57 7.16 3.78 1.09 1.12 3.25 4.27 5.58 12.77 3.12 12.99 2.54 17.12 1.93 21.48-.3 2.16-.67 4.82-.82 7.92-.22 4.88.25 9.68.79 15.24.05.46.09.93.14 1.41-1.99-.61-4.07-1.01-6.22-1.19a29.947 29.947 0 0 0-30.19 18.21c-1.3 3.07-12.68 30.71-12.24 55.06.21 12.01.88 16.7 2.27 23.86.41 2.13.84 4.32 1.35 7.75l.57 3.78c1.55 10.34 2.58 17.17 4.47 35.45.07.75.18 1.52.32 2.27 1.68 9.52 3.44 17.83 5.15 25.86 2.53 11.92 4.72 22.22 5.69 32.55 1.55 16.44-.48 51.43-8.62 89.41-1.88 8.79-3.6 16.1-5.13 22.35-.36-7.04-.78-14.59-1.26-22.06-1.73-27.01-3.24-43.7-6.26-54.55-5.87-21.1-19.98-25.53-30.78-25.53-9.55 0-17.32 3.31-23.1 9.84-4.68 5.28-7.63 12.21-9.56 22.46-2.4 12.75-3.62 31.66-5.27 69.91Zm37.79-470.26c-.26-1.3-.48-2.72-.54-3.66-.42-7.3-3.53-14.05-8.43-19.13 1.13-4.43 1.24-9.11.25-13.7-1.45-6.73-1.21-11.91.64-14.2 1.21-1.5 4.49-3.12 8.8-3.12h.07c5.51.57 7.6 1.96 7.83 2.29 1.49 2.16 1.42 9.02.38 13.35-1.4 5.08-1.37 10.45-.04 15.5-4.5 4.73-7.43 10.89-8.12 17.58-.22 2.07-.52 3.77-.82 5.09Z" style="stroke-width:2px;fill:none;stroke:#c8ff00;stroke-miterlimit:10"/><path class="cls-11" d="M166.45 86.31c-.26-1.3-.48-2.72-.54-3.66-.42-7.3-3.53-14.05-8.43-19.13 1.13-4.43 1.24-9.11.25-13.7-1.45-6.73-1.21-11.91.64-14.2 1.21-1.5 4.49-3.12 8.8-3.12h.07c5.51.57 7.6 1.96 7.83 2.29 1.49 2.16 1.42 9.02.38 13.35-1.4 5.08-1.37 10.45-.04 15.5-4.5 4.73-7.43 10.89-8.12 17.58-.22 2.07-.52 3.77-.82 5.09Z"/><path class="cls-7" d="M196.04 440.99h0"/><path d="M186.96 436.18c-6.2-2.5-13.04-3.81-20.38-3.81-8.99 0-17.27 1.91-24.58 5.61" style="stroke-dasharray:0 0 0 10.29;stroke-linecap:round;stroke-width:2px;fill:none;stroke:#c8ff00;stroke-miterlimit:10"/><path class="cls-7" d="M137.55 440.53h0"/><path d="M139.24 430.62c.84-4.37 1.81-8.95 2.85-13.83 1.76-8.3 3.56-16.79 5.31-26.72.21-1.19.38-2.42.51-3.66 1.85-17.75 2.84-24.38 4.34-34.42l.58-3.91c.44-2.93.8-4.8 1.18-6.79 1.67-8.6 2.45-14.64 2.67-27.71.5-28.26-11.56-58.26-13.98-63.99-5.62-13.29-16.29-23.35-29.24-28.31" style="stroke-dasharray:0 0 0 10.05;stroke-linecap:round;stroke-width:2px;fill:none;stroke:#c8ff00;stroke-miterlimit:10"/><path class="cls-7" d="M108.69 219.71h0"/><path d="M107.79 209.04c.12-1.3.39-2.97.88-5.3" style="stroke-linecap:round;stroke-width:2px;stroke-dasharray:0 0 0 10.73;fill:none;stroke:#c8ff00;stroke-miterlimit:10"/><path class="cls-7" d="M110 198.54h0"/><path d="M119.57 194.37c10.1-4.45 25.06-11.1 35.01-15.82 2.21-1.05 4.83-2.29 7.67-3.84" style="stroke-dasharray:0 0 0 10.44;stroke-linecap:round;stroke-width:2px;fill:none;stroke:#c8ff00;stroke-miterlimit:10"/><path class="cls-7" d="M166.76 172.08h0"/><path d="M175.92 177.1c1.07.52 2.08 1 3.01 1.45 11.73 5.56 30.33 13.77 39.8 17.92" style="stroke-dasharray:0 0 0 10.44;stroke-linecap:round;stroke-width:2px;fill:none;stroke:#c8ff00;stroke-miterlimit:10"/><path class="cls-7" d="M223.53 198.54h0"/><path d="M225.73 209.04c.19 2.04.03 3.16-.15 4.48-.04.27-.08.56-.12.86" style="stroke-dasharray:0 0 0 10.74;stroke-linecap:round;stroke-width:2px;fill:none;stroke:#c8ff00;stroke-miterlimit:10"/><path class="cls-7" d="M224.84 219.71h0"/><path d="M215.44 223.31c-10.85 5.42-19.69 14.6-24.63 26.28-2.42 5.72-14.48 35.73-13.98 64.02.23 13.03 1 19.06 2.66 27.64.38 1.98.74 3.84 1.19 6.82l.57 3.8c1.51 10.05 2.5 16.68 4.34 34.44.13 1.3.32 2.62.55 3.93 1.73 9.85 3.54 18.33 5.28 26.53 1.47 6.93 2.82 13.28 3.83 19.24" style="stroke-dasharray:0 0 0 10.07;stroke-linecap:round;stroke-width:2px;fill:none;stroke:#c8ff00;stroke-miterlimit:10"/><path class="cls-1" d="M113.46 849.45c-.33-.05-.66-.09-1-.11-.43-.55-.91-1.06-1.46-1.52-.04-.04-.09-.07-.13-.11 1.65-1.6 3-3.52 5.24-7.24l.7-1.01c8.32-11.87 15.21-22.39 15.21-30.87 0-1.13-.19-2.26-.57-3.33-1.17-3.32-1.2-4.28-1.2-4.31.01-.09.11-.54.18-.87l.12-.58c.04-.21.09-.38.13-.57 1.06-4.42 1.72-9.49-1-26.8-1.73-10.87-4-19.17-6.42-27.96-2.9-10.55-6.18-22.5-9.33-42.03-3.99-24.7-.76-48.48 1.85-67.59 1.06-7.75 1.97-14.44 2.29-20.34.01-.18.02-.37.02-.55 0-16.85-2.52-26.94-6.7-43.66-2.02-8.09-4.54-18.16-7.43-31.66-8.62-40.26-10.72-76.96-8.98-95.47 1.08-11.46 3.37-22.27 6.03-34.79 1.67-7.89 3.4-16.04 5.03-25.29.04-.23.07-.47.1-.7 1.94-18.7 2.99-25.71 4.58-36.31l.58-3.89c.57-3.83 1.06-6.36 1.49-8.59 1.12-5.8 1.72-9.34 1.91-20.44.36-20.55-10.22-45.84-10.67-46.91a10.008 10.008 0 0 0-9.21-6.11c-.28 0-.57.01-.86.04-4.32.37-7.9 3.47-8.89 7.69-.16.69-4 17.27-7.32 43.29l-.38 2.87-.06.53c-.02.21-.03.4-.05.57-.07.29-.12.6-.16.9-4.95 37.55-8.65 58.9-16.26 78.67-.92 2.38-1.91 4.89-2.91 7.44-5.9 14.96-9.52 24.44-9.65 30.46-.03 1.29.19 2.58.65 3.78.08.77.25 1.53.51 2.26 1.68 4.75.71 14.14-.23 21.22h-.03c-.39 0-.86.02-1.39.09a10.156 10.156 0 0 0-4.96-2.17c-.46-.07-.96-.1-1.42-.1-1.05 0-2.01.13-2.89.37-1.74-1.77-3.75-2.5-4.7-2.76-.86-.23-1.81-.36-2.7-.36h-.2c-.45-1.03-1.05-1.99-1.79-2.86-.88-1.03-1.93-1.87-3.09-2.51 1.59-1.75 3.39-3.16 5.42-4.75 1.92-1.51 3.91-3.06 5.88-5.03.32-.32.64-.67.95-1.04.67-.79 1.2-1.65 1.59-2.56.57-.67 1.06-1.42 1.44-2.22 4.21-8.91 5.78-24.81 7.91-59.4 2.21-36 3.67-43.04 9.46-60 6.87-20.09 6.86-27.29 6.85-40.36v-1.32c0-.28-.01-.56-.04-.84-1.19-14.05-.06-25.54.77-33.93.49-5 .88-8.96.72-12.39-.1-2.19-.38-4.17-.65-6.09-.81-5.78-1.73-12.33 2.36-29.23 6.05-22.25 14.11-25.67 24.32-29.99.88-.37 1.76-.75 2.63-1.13 8.24-3.6 28.7-12.59 40.93-18.39 11.17-5.3 16.54-8.38 16.54-20.29 0-5.84-.96-14.98-1.07-16a10 10 0 0 0-1.96-4.96c-2.49-3.3-3.93-11.76-4.15-15.55-.24-4.14-3.01-7.7-6.96-8.96-.13-.24-.25-.49-.38-.73-1.51-2.9-3.07-5.88-4.18-10.01.69-.52 1.32-1.13 1.86-1.83a9.972 9.972 0 0 0 1.89-8.25c-2.84-13.23-1.28-23.64 4.63-30.97 5.34-6.61 14.45-10.55 24.36-10.55.42 0 .84 0 1.25.02 11 .98 18.76 4.64 23.09 10.89 8.08 11.68 3.31 29.69 3.26 29.87a10.005 10.005 0 0 0 3.68 10.76c-.56 2.02-1.82 5.19-4.37 10.76a10.012 10.012 0 0 0-6.91 8.49c-.87 8.37-2.94 14.02-4.6 16.52a10.03 10.03 0 0 0-1.53 7.14c-.25 3.31-.65 9.21-.65 13.36 0 11.91 5.37 14.99 16.55 20.29 12.21 5.79 32.69 14.79 40.93 18.39.88.38 1.76.76 2.64 1.13 10.2 4.33 18.27 7.75 24.31 29.99 4.08 16.91 3.17 23.45 2.36 29.23-.27 1.91-.54 3.89-.65 6.08-.16 3.43.23 7.38.72 12.38.83 8.39 1.95 19.88.77 33.93-.02.28-.04.56-.04.84v1.32c0 13.07-.01 20.27 6.85 40.36 5.79 16.95 7.25 23.98 9.47 60 2.12 34.4 3.65 51.6 8.53 60.63.38.71.85 1.36 1.38 1.96.38.74.86 1.43 1.44 2.07.19.21.37.41.56.59 1.94 1.94 3.92 3.5 5.84 5 2.03 1.6 3.83 3 5.42 4.75-1.16.63-2.21 1.48-3.09 2.5-.75.87-1.34 1.82-1.79 2.86h-.19c-.89 0-1.84.13-2.7.36-.95.26-2.96.98-4.7 2.76-.88-.24-1.84-.37-2.9-.37-.48 0-.98.04-1.45.1-1.81.26-3.52 1.02-4.93 2.17-.53-.07-1-.09-1.39-.09h-.03c-.95-7.2-1.9-16.6-.21-21.28.37-1.02.56-2.07.59-3.11.43-1.29.61-2.66.49-4.04-.5-5.91-3.95-15.01-9.58-29.3-1-2.55-2-5.06-2.91-7.44-7.65-19.87-11.4-41.64-16.44-80.04-.1-.75-.28-1.47-.53-2.16-.02-.59-.04-1.21-.05-1.81 0-.38-.03-.75-.08-1.13-3.28-25.12-6.97-41.04-7.12-41.71-.99-4.22-4.57-7.32-8.89-7.69-.29-.02-.57-.04-.86-.04-3.99 0-7.63 2.38-9.21 6.11-.45 1.07-11.04 26.36-10.67 46.92.19 11.09.79 14.63 1.91 20.42.43 2.23.92 4.77 1.49 8.61l.56 3.76c1.6 10.64 2.65 17.66 4.59 36.44.02.24.06.47.1.71 1.63 9.24 3.36 17.38 5.03 25.25 2.66 12.53 4.96 23.36 6.04 34.83 1.75 18.51-.35 55.21-8.98 95.47-2.89 13.51-5.41 23.59-7.44 31.69-4.17 16.7-6.7 26.78-6.7 43.63 0 .19 0 .37.02.55.33 5.89 1.24 12.58 2.29 20.32 2.6 19.12 5.84 42.9 1.85 67.61-3.15 19.53-6.44 31.49-9.33 42.04-2.41 8.78-4.69 17.08-6.41 27.93-2.71 17.31-2.06 22.38-1 26.8.04.19.09.36.13.54l.13.63c.07.33.17.78.18.91s-.04.96-1.2 4.27a9.905 9.905 0 0 0-.57 3.32c0 8.48 6.88 19 15.2 30.87l.71 1.01c2.24 3.72 3.58 5.64 5.24 7.24-.05.04-.09.08-.14.11-.54.46-1.03.97-1.45 1.51-.33.02-.66.06-.98.11-.46-.83-1-1.67-1.69-2.49a9.85 9.85 0 0 0-1.73-1.63 10.1 10.1 0 0 0-2.49-1.63c-1.51-.69-3.11-1.04-4.76-1.04-1.13 0-2.26.17-3.36.5a11.51 11.51 0 0 0-4.79 2.8c-.49-.61-1-1.22-1.52-1.82-.93-1.07-1.12-1.3-1.29-4.57-.19-3.58-1.03-6.65-2.57-9.37-.1-.18-.21-.35-.32-.53-.1-.17-.2-.34-.31-.51-.77-1.18-1.54-2.1-2.16-2.84-.23-.27-.44-.52-.61-.74-.16-.67-.58-3.36.6-9.76l.17-.94c.09-.52.15-1.05.16-1.57.1-.72.2-1.5.28-2.34.22-.69.37-1.42.44-2.17.39-4.43-.23-6.88-1.02-9.4-.08-.24-.16-.49-.24-.77.04-.6.41-2.24.75-3.69.24-1.04.51-2.22.79-3.56 1.83-8.59 1.19-33.77-1.22-47.27-.45-2.55-1-5.19-1.58-7.99-2.51-12.18-5.63-27.33-4.15-48.7.57-8.21 1.21-15.6 1.78-22.12 1.72-19.81 2.33-28.08.06-34.03-1.49-3.91-2.18-21.24-2.79-36.52l-.13-3.38c-.1-3.42-1.05-29.82-2.7-55.63-3.38-52.75-5.77-61.36-17.08-61.36-13.59 0-14.98 11.68-18.37 92.98-.36 8.61-.7 16.75-1.05 23.85-.18 3.65-.34 7.18-.5 10.55-.56 12.3-1.2 26.25-2.43 29.49-2.27 5.96-1.66 14.24.07 34.06.57 6.51 1.21 13.9 1.78 22.1 1.48 21.36-1.64 36.52-4.15 48.69-.58 2.8-1.12 5.45-1.58 8-2.4 13.47-3.06 38.65-1.22 47.27.29 1.34.55 2.51.79 3.56.33 1.46.71 3.09.75 3.69-.09.3-.17.54-.24.78-1.42 4.54-1.62 7.55.02 16.43 1.18 6.4.76 9.08.6 9.76-.17.22-.38.47-.61.74-1.86 2.21-4.98 5.9-5.36 13.25-.17 3.26-.37 3.49-1.29 4.56-.52.6-1.03 1.2-1.52 1.82a11.718 11.718 0 0 0-4.83-2.81c-1.08-.32-2.21-.49-3.33-.49-5.86 0-8.97 3.88-10.65 6.8Z"/><path d="M131.75 741.1c-2.79-10.17-5.93-21.77-8.94-40.39-3.78-23.38-.64-46.43 1.88-64.94 1.08-7.95 2.02-14.8 2.36-21.05.02-.35.03-.7.03-1.05 0-17.96-2.77-29.05-6.97-45.84-2.01-8.03-4.5-18.01-7.37-31.36-8.42-39.32-10.5-74.91-8.82-92.74 1.03-10.95 3.28-21.52 5.87-33.77 1.69-7.96 3.43-16.19 5.09-25.6.08-.44.14-.88.19-1.33 1.92-18.52 2.96-25.44 4.53-35.91l.58-3.9c.54-3.64 1.01-6.07 1.43-8.21 1.19-6.13 1.87-10.17 2.07-22 .39-22.06-10.18-47.72-11.38-50.57a18.961 18.961 0 0 0-17.5-11.6c-.55 0-1.1.02-1.64.07-8.21.7-14.99 6.58-16.87 14.61-.07.29-.75 3.25-1.77 8.42v-1.36c0-.53-.02-1.07-.07-1.6-1.12-13.23-.03-24.24.76-32.28.53-5.37.94-9.61.76-13.69-.12-2.61-.44-4.9-.72-6.92-.73-5.21-1.48-10.6 2.16-25.74 4.89-17.92 9.95-20.06 19.11-23.95.91-.39 1.81-.77 2.72-1.16 8.27-3.62 28.83-12.65 41.19-18.51 10.66-5.06 21.69-10.29 21.69-28.42 0-6.16-.93-15.21-1.12-16.96-.36-3.39-1.63-6.63-3.68-9.36-.93-1.53-2.2-7.19-2.4-10.71-.37-6.38-3.98-12.11-9.35-15.29-.33-.66-.65-1.32-.95-1.99 2.52-4.13 3.38-9.08 2.35-13.88-2.24-10.44-1.29-18.32 2.83-23.42 3.59-4.45 10.25-7.21 17.36-7.21h.7c8.07.76 13.54 3.12 16.24 7.02 4.63 6.7 3.01 18.38 1.97 22.38-1.41 5.05-.62 10.52 2.09 14.98-.28.67-.6 1.41-.96 2.21-5.01 3.06-8.39 8.33-9 14.25-.78 7.47-2.58 11.62-3.15 12.48-2.42 3.66-3.49 8-3.06 12.33-.25 3.46-.61 9.02-.61 13.13 0 18.13 11.03 23.36 21.69 28.42 12.35 5.85 32.91 14.89 41.18 18.51.91.4 1.82.79 2.74 1.17 9.16 3.88 14.22 6.03 19.1 23.94 3.65 15.15 2.89 20.54 2.16 25.75-.28 2.03-.6 4.31-.72 6.91-.19 4.08.23 8.31.75 13.67.79 8.06 1.88 19.07.76 32.31-.04.54-.07 1.07-.07 1.6v1.37c-1.02-5.19-1.71-8.15-1.77-8.44a18.947 18.947 0 0 0-16.88-14.61c-.54-.05-1.08-.07-1.62-.07-7.65 0-14.52 4.55-17.5 11.6-1.21 2.85-11.77 28.5-11.38 50.58.21 11.8.88 15.84 2.07 21.97.41 2.14.88 4.55 1.43 8.22l.57 3.77c1.58 10.5 2.62 17.44 4.54 36.03.04.43.11.9.19 1.37 1.65 9.38 3.4 17.59 5.08 25.53 2.6 12.25 4.85 22.84 5.88 33.8 1.69 17.83-.39 53.42-8.81 92.74-2.87 13.39-5.36 23.37-7.37 31.39-4.19 16.78-6.96 27.86-6.96 45.81 0 .36 0 .72.03 1.07.35 6.24 1.28 13.08 2.36 21.01 2.52 18.53 5.66 41.58 1.88 64.96-3.01 18.63-6.15 30.23-8.93 40.39-.42-2.25-.9-4.56-1.36-6.81-2.4-11.64-5.38-26.12-3.99-46.26.57-8.17 1.2-15.5 1.77-21.96 1.72-19.81 2.59-29.8-.44-37.89-1.06-3.78-1.8-22.53-2.25-33.76l-.14-3.42c-.11-3.71-1.07-30.21-2.71-55.85-3.07-47.91-4.46-69.78-26.06-69.78-15.38 0-19.68 11.8-21.85 23.34-2.48 13.13-3.65 33.83-5.5 78.27-.36 8.57-.69 16.67-1.05 23.78-.18 3.54-.33 6.98-.48 10.26v.33c-.42 8.86-1.09 23.63-1.93 26.87-3.01 8.1-2.14 18.1-.42 37.88.56 6.46 1.2 13.78 1.76 21.94 1.39 20.13-1.59 34.61-3.99 46.25-.49 2.38-.95 4.62-1.36 6.82Zm160.48-292.72c0-.1 0-.19-.01-.29l.3.27-.04.02h-.25ZM41 448.36c.1-.09.21-.18.31-.27 0 .1 0 .19-.01.29h-.25c-.01 0-.03-.02-.04-.03Zm17.36-75.96c2.07-33.02 3.42-39.35 8.84-55.23.38-1.11.74-2.18 1.08-3.22l-.09.61c-3.34 25.3-6.08 43.06-9.83 57.84Zm216.8-.03c-3.76-14.85-6.54-32.8-9.89-58.32.33 1.01.68 2.05 1.04 3.12 5.42 15.87 6.77 22.2 8.85 55.2Z" style="stroke-width:2.5px;fill:none;stroke:#c8ff00;stroke-miterlimit:10"/><path class="cls-11" d="M207.44 475.15c-6.27-20.23-21.07-31.79-40.85-31.79-12.66 0-23.49 4.68-31.34 13.55-4.03 4.55-7.03 9.85-9.28 16.5-.75-11.59-.74-21.15-.13-27.63.91-9.68 3.04-19.69 5.49-31.27 1.73-8.18 3.52-16.59 5.24-26.35.17-.94.3-1.91.4-2.89 1.87-18 2.88-24.73 4.4-34.92l.58-3.91c.47-3.16.85-5.14 1.26-7.24 1.57-8.13 2.26-13.5 2.48-25.83.46-26.04-10.84-54.15-13.11-59.52a40.927 40.927 0 0 0-34.57-24.92c.04-1.65.03-3.3-.04-4.97-.17-3.62-.6-6.69-.91-8.93-.5-3.58-.9-6.42 1.68-17.22 1.22-4.41 2.23-6.62 2.74-7.57.96-.46 2.58-1.15 3.64-1.6.98-.41 1.95-.83 2.92-1.25 8.39-3.67 29.23-12.83 41.83-18.8 4.72-2.24 11-5.22 16.9-9.99 5.9 4.76 12.17 7.74 16.89 9.98 12.66 6 33.45 15.14 41.8 18.79.98.43 1.97.85 2.96 1.27 1.06.45 2.68 1.14 3.64 1.6.51.95 1.52 3.16 2.74 7.57 2.58 10.82 2.19 13.64 1.69 17.21-.31 2.24-.74 5.31-.91 8.93-.08 1.68-.08 3.33-.04 4.98a40.899 40.899 0 0 0-34.57 24.91c-2.27 5.36-13.58 33.46-13.11 59.54.21 12.29.9 17.66 2.46 25.75.41 2.1.79 4.07 1.27 7.28l.57 3.79c1.53 10.2 2.54 16.93 4.41 34.96.1.98.24 2.04.43 3.09 1.71 9.69 3.49 18.08 5.21 26.2 2.46 11.59 4.58 21.6 5.5 31.29.64 6.8.63 16.99-.25 29.37Z"/></svg>
-"""
-
-unhealthy_svg = """
-<svg id="Unhealthy" xmlns="http://www.w3.org/2000/svg" viewBox="0 0 353.53 867.89"><defs><radialGradient id="radial-gradient" cx="176.76" cy="433.95" fx="176.76" fy="433.95" r="329.02" gradientUnits="userSpaceOnUse"><stop offset="0" stop-color="#fff"/><stop offset="1" stop-color="#ffe8d6"/></radialGradient><style>.cls-1{stroke-width:3px}.cls-1,.cls-4,.cls-5,.cls-7{fill:none;stroke:#ff7c21;stroke-miterlimit:10}.cls-5{stroke-width:2px;stroke-linecap:round}.cls-4{stroke-width:5px}</style></defs><path d="M342.34 451.47c-12.68-15.52-19.68-33.52-20.68-53.52 0-17-1-35-5-52-13-52-23-101-27-153-3-48-61-46-86-75-15-17 13-37 13-59 1-1 0-5-3-4 1-8 3-16 .48-24.38-2.73-12.56-11.57-25.92-36.19-28.03-11.08-.46-23.35 3.13-31.8 11.73-9.49 11.67-12.49 26.67-9.49 40.67-2 0-2 2-4 2 0 23 30 43 15 61-21 27-72 23-83 62-9 33-1 66-13 98-13 38-14 77-21 118-2 12-6 23-9.37 35.41-4.72 12.69-23.63 28.59-17.63 39.59 2 4 6-8 12-11 3 16-8 35 1 49 6-13 3-28 8-41 4 15-10 37 2 47 5-14 1-29 7-43 2 13-7 29 1 41 8-11 3-25 6-38 5 12-5 25 5 36 2.5-13.5 2.5-27.25 2.62-40.88s-.14-26.39 2.46-38.88c10.91-58.24 25.91-114.24 43.91-170.24 10 20 5 42 2 64-8 43-20 83-21.61 126.16-.43 14.18.97 27.87 3.31 41.81 6.98 41.91 24.8 81.28 35.3 124.03 3 12-1 25-1.78 37.2-1.15 14-1.85 31.48 1.08 49.6 5.86 36.26 12.08 46.87 15.74 69.94 2.93 18.67 1.53 20.97.96 23.78-.59 2.81-1.16 4.26 1.26 11.13 0 6.38-9.22 19.15-14.3 26.42-3.29 5.48-3.66 5.48-5.63 6.99-3.57 2.75-4.8 6.45-1.37 7.83-1.1 3.03.27 7.43 3.84 5.63-.96 3.16 3.02 5.23 7.28 3.85.97 2.75 4.53 4.4 7.28.55 2.75-3.85 3.17-7.83 5.5-7.14 2.33.69.41 4.12-.82 6.59-1.24 2.47.55 6.45 5.63 6.04 5.08-.41 7.41-3.98 7.69-6.86.27-2.89 1.65-4.81 4.26-7.84 2.61-3.02 3.43-5.36 3.71-10.57.27-5.22 2.47-6.32 4.4-9.07 1.92-2.74 2.47-8.09.82-17.02-1.65-8.93-.96-9.34 0-12.64.96-3.3 0-5.63-1.37-12.08s-1.1-30.06 1.29-43.44c2.38-13.36 7.78-31.39 5.86-59.13-2.29-61.77-2.29-127.77 10.71-187.77 12 62 14 126 10.71 187.77-1.92 27.74 3.48 45.78 5.86 59.13 2.38 13.37 2.66 36.99 1.28 43.44-1.37 6.45-2.33 8.79-1.37 12.08.67 2.3 1.2 3.2.91 6.55-.08-.92-.23-1.84-.47-2.72-.02-.06-.21-.24-.18-.1.59 2.65.25 5.22-.15 7.86 0 .04.02.1.06.16-.05.29-.1.58-.16.89-1.65 8.92-1.09 14.28.82 17.02.96 1.37 1.98 2.33 2.81 3.59 0 .19-.02.38-.03.55 0 .09.23.39.27.26.03-.09.04-.21.06-.31.67 1.19 1.16 2.69 1.28 4.97.28 5.21 1.09 7.54 3.71 10.57 2.61 3.02 3.98 4.95 4.26 7.84.27 2.88 2.61 6.45 7.69 6.86 5.08.42 6.86-3.56 5.63-6.04-1.24-2.47-3.16-5.9-.82-6.59.42-.12.77-.09 1.08.05.28.37.54.75.77 1.19.08.13.42.32.3.04-.1-.22-.22-.43-.34-.64 1.04 1.24 1.83 3.9 3.68 6.5 2.75 3.85 6.32 2.2 7.28-.55 4.26 1.38 8.24-.69 7.28-3.85 3.57 1.8 4.94-2.6 3.84-5.63 3.44-1.37 2.2-5.08-1.37-7.83-1.96-1.51-2.34-1.51-5.63-6.99-5.08-7.28-14.3-20.04-14.3-26.42 2.42-6.87 1.84-8.32 1.26-11.13-.57-2.8-1.97-5.11.96-23.78 3.66-23.07 9.89-33.69 15.74-69.94 2.93-18.12 2.22-35.6 1.08-49.61-.78-12.19-5.78-26.19-1.78-36.19 11.75-26.5 20.12-53.19 25.58-80.02 2.73-13.41 4.72-26.86 6.05-40.33 7.37-68.66-1.63-136.66-18.63-205.66-3-11 1-21 7-30 3 15 11 29 11 44l1-1c7 42 20 83 34 124 1 3 0 5-1 8 0 0 1-1 .66-1.13-1.28 11.67-2.91 25.38-2.53 38.88s2.38 26.25 7.88 35.25c2-12 1-23 1-35 5 12-1 27 7 38 8-12-1-28 1-41 5 14 3 29 7 43 12-11-2-32 2-47 5 13 2 28 8 41 7-14 0-32 0-48 7 0 7 14 16.05 9.4 1.83-3.39-4.65-8.49-8.37-18.88Z" style="fill:url(#radial-gradient);stroke-width:0"/><path class="cls-4" d="M342.34 451.47c-12.68-15.52-19.68-33.52-20.68-53.52 0-17-1-35-5-52-13-52-23-101-27-153-3-48-61-46-86-75-15-17 13-37 13-59 1-1 0-5-3-4 1-8 3-16 .48-24.38-2.73-12.56-11.57-25.92-36.19-28.03-11.08-.46-23.35 3.13-31.8 11.73-9.49 11.67-12.49 26.67-9.49 40.67-2 0-2 2-4 2 0 23 30 43 15 61-21 27-72 23-83 62-9 33-1 66-13 98-13 38-14 77-21 118-2 12-6 23-9.37 35.41-4.72 12.69-23.63 28.59-17.63 39.59 2 4 6-8 12-11 3 16-8 35 1 49 6-13 3-28 8-41 4 15-10 37 2 47 5-14 1-29 7-43 2 13-7 29 1 41 8-11 3-25 6-38 5 12-5 25 5 36 2.5-13.5 2.5-27.25 2.62-40.88s-.14-26.39 2.46-38.88c10.91-58.24 25.91-114.24 43.91-170.24 10 20 5 42 2 64-8 43-20 83-21.61 126.16-.43 14.18.97 27.87 3.31 41.81 6.98 41.91 24.8 81.28 35.3 124.03 3 12-1 25-1.78 37.2-1.15 14-1.85 31.48 1.08 49.6 5.86 36.26 12.08 46.87 15.74 69.94 2.93 18.67 1.53 20.97.96 23.78-.59 2.81-1.16 4.26 1.26 11.13 0 6.38-9.22 19.15-14.3 26.42-3.29 5.48-3.66 5.48-5.63 6.99-3.57 2.75-4.8 6.45-1.37 7.83-1.1 3.03.27 7.43 3.84 5.63-.96 3.16 3.02 5.23 7.28 3.85.97 2.75 4.53 4.4 7.28.55 2.75-3.85 3.17-7.83 5.5-7.14 2.33.69.41 4.12-.82 6.59-1.24 2.47.55 6.45 5.63 6.04 5.08-.41 7.41-3.98 7.69-6.86.27-2.89 1.65-4.81 4.26-7.84 2.61-3.02 3.43-5.36 3.71-10.57.27-5.22 2.47-6.32 4.4-9.07 1.92-2.74 2.47-8.09.82-17.02-1.65-8.93-.96-9.34 0-12.64.96-3.3 0-5.63-1.37-12.08s-1.1-30.06 1.29-43.44c2.38-13.36 7.78-31.39 5.86-59.13-2.29-61.77-2.29-127.77 10.71-187.77 12 62 14 126 10.71 187.77-1.92 27.74 3.48 45.78 5.86 59.13 2.38 13.37 2.66 36.99 1.28 43.44-1.37 6.45-2.33 8.79-1.37 12.08.67 2.3 1.2 3.2.91 6.55-.08-.92-.23-1.84-.47-2.72-.02-.06-.21-.24-.18-.1.59 2.65.25 5.22-.15 7.86 0 .04.02.1.06.16-.05.29-.1.58-.16.89-1.65 8.92-1.09 14.28.82 17.02.96 1.37 1.98 2.33 2.81 3.59 0 .19-.02.38-.03.55 0 .09.23.39.27.26.03-.09.04-.21.06-.31.67 1.19 1.16 2.69 1.28 4.97.28 5.21 1.09 7.54 3.71 10.57 2.61 3.02 3.98 4.95 4.26 7.84.27 2.88 2.61 6.45 7.69 6.86 5.08.42 6.86-3.56 5.63-6.04-1.24-2.47-3.16-5.9-.82-6.59.42-.12.77-.09 1.08.05.28.37.54.75.77 1.19.08.13.42.32.3.04-.1-.22-.22-.43-.34-.64 1.04 1.24 1.83 3.9 3.68 6.5 2.75 3.85 6.32 2.2 7.28-.55 4.26 1.38 8.24-.69 7.28-3.85 3.57 1.8 4.94-2.6 3.84-5.63 3.44-1.37 2.2-5.08-1.37-7.83-1.96-1.51-2.34-1.51-5.63-6.99-5.08-7.28-14.3-20.04-14.3-26.42 2.42-6.87 1.84-8.32 1.26-11.13-.57-2.8-1.97-5.11.96-23.78 3.66-23.07 9.89-33.69 15.74-69.94 2.93-18.12 2.22-35.6 1.08-49.61-.78-12.19-5.78-26.19-1.78-36.19 11.75-26.5 20.12-53.19 25.58-80.02 2.73-13.41 4.72-26.86 6.05-40.33 7.37-68.66-1.63-136.66-18.63-205.66-3-11 1-21 7-30 3 15 11 29 11 44l1-1c7 42 20 83 34 124 1 3 0 5-1 8 0 0 1-1 .66-1.13-1.28 11.67-2.91 25.38-2.53 38.88s2.38 26.25 7.88 35.25c2-12 1-23 1-35 5 12-1 27 7 38 8-12-1-28 1-41 5 14 3 29 7 43 12-11-2-32 2-47 5 13 2 28 8 41 7-14 0-32 0-48 7 0 7 14 16.05 9.4 1.83-3.39-4.65-8.49-8.37-18.88Z"/><path class="cls-4" d="M342.34 451.47c-12.68-15.52-19.68-33.52-20.68-53.52 0-17-1-35-5-52-13-52-23-101-27-153-3-48-61-46-86-75-15-17 13-37 13-59 1-1 0-5-3-4 1-8 3-16 .48-24.38-2.73-12.56-11.57-25.92-36.19-28.03-11.08-.46-23.35 3.13-31.8 11.73-9.49 11.67-12.49 26.67-9.49 40.67-2 0-2 2-4 2 0 23 30 43 15 61-21 27-72 23-83 62-9 33-1 66-13 98-13 38-14 77-21 118-2 12-6 23-9.37 35.41-4.72 12.69-23.63 28.59-17.63 39.59 2 4 6-8 12-11 3 16-8 35 1 49 6-13 3-28 8-41 4 15-10 37 2 47 5-14 1-29 7-43 2 13-7 29 1 41 8-11 3-25 6-38 5 12-5 25 5 36 2.5-13.5 2.5-27.25 2.62-40.88s-.14-26.39 2.46-38.88c10.91-58.24 25.91-114.24 43.91-170.24 10 20 5 42 2 64-8 43-20 83-21.61 126.16-.43 14.18.97 27.87 3.31 41.81 6.98 41.91 24.8 81.28 35.3 124.03 3 12-1 25-1.78 37.2-1.15 14-1.85 31.48 1.08 49.6 5.86 36.26 12.08 46.87 15.74 69.94 2.93 18.67 1.53 20.97.96 23.78-.59 2.81-1.16 4.26 1.26 11.13 0 6.38-9.22 19.15-14.3 26.42-3.29 5.48-3.66 5.48-5.63 6.99-3.57 2.75-4.8 6.45-1.37 7.83-1.1 3.03.27 7.43 3.84 5.63-.96 3.16 3.02 5.23 7.28 3.85.97 2.75 4.53 4.4 7.28.55 2.75-3.85 3.17-7.83 5.5-7.14 2.33.69.41 4.12-.82 6.59-1.24 2.47.55 6.45 5.63 6.04 5.08-.41 7.41-3.98 7.69-6.86.27-2.89 1.65-4.81 4.26-7.84 2.61-3.02 3.43-5.36 3.71-10.57.27-5.22 2.47-6.32 4.4-9.07 1.92-2.74 2.47-8.09.82-17.02-1.65-8.93-.96-9.34 0-12.64.96-3.3 0-5.63-1.37-12.08s-1.1-30.06 1.29-43.44c2.38-13.36 7.78-31.39 5.86-59.13-2.29-61.77-2.29-127.77 10.71-187.77 12 62 14 126 10.71 187.77-1.92 27.74 3.48 45.78 5.86 59.13 2.38 13.37 2.66 36.99 1.28 43.44-1.37 6.45-2.33 8.79-1.37 12.08.67 2.3 1.2 3.2.91 6.55-.08-.92-.23-1.84-.47-2.72-.02-.06-.21-.24-.18-.1.59 2.65.25 5.22-.15 7.86 0 .04.02.1.06.16-.05.29-.1.58-.16.89-1.65 8.92-1.09 14.28.82 17.02.96 1.37 1.98 2.33 2.81 3.59 0 .19-.02.38-.03.55 0 .09.23.39.27.26.03-.09.04-.21.06-.31.67 1.19 1.16 2.69 1.28 4.97.28 5.21 1.09 7.54 3.71 10.57 2.61 3.02 3.98 4.95 4.26 7.84.27 2.88 2.61 6.45 7.69 6.86 5.08.42 6.86-3.56 5.63-6.04-1.24-2.47-3.16-5.9-.82-6.59.42-.12.77-.09 1.08.05.28.37.54.75.77 1.19.08.13.42.32.3.04-.1-.22-.22-.43-.34-.64 1.04 1.24 1.83 3.9 3.68 6.5 2.75 3.85 6.32 2.2 7.28-.55 4.26 1.38 8.24-.69 7.28-3.85 3.57 1.8 4.94-2.6 3.84-5.63 3.44-1.37 2.2-5.08-1.37-7.83-1.96-1.51-2.34-1.51-5.63-6.99-5.08-7.28-14.3-20.04-14.3-26.42 2.42-6.87 1.84-8.32 1.26-11.13-.57-2.8-1.97-5.11.96-23.78 3.66-23.07 9.89-33.69 15.74-69.94 2.93-18.12 2.22-35.6 1.08-49.61-.78-12.19-5.78-26.19-1.78-36.19 11.75-26.5 20.12-53.19 25.58-80.02 2.73-13.41 4.72-26.86 6.05-40.33 7.37-68.66-1.63-136.66-18.63-205.66-3-11 1-21 7-30 3 15 11 29 11 44l1-1c7 42 20 83 34 124 1 3 0 5-1 8 0 0 1-1 .66-1.13-1.28 11.67-2.91 25.38-2.53 38.88s2.38 26.25 7.88 35.25c2-12 1-23 1-35 5 12-1 27 7 38 8-12-1-28 1-41 5 14 3 29 7 43 12-11-2-32 2-47 5 13 2 28 8 41 7-14 0-32 0-48 7 0 7 14 16.05 9.4 1.83-3.39-4.65-8.49-8.37-18.88Z"/><path class="cls-1" d="M122.35 849.45c-.33-.05-.66-.09-1-.11-.43-.55-.91-1.06-1.46-1.52-.04-.04-.09-.07-.13-.11 1.65-1.6 3-3.52 5.24-7.24l.7-1.01c8.32-11.87 15.21-22.39 15.21-30.87 0-1.13-.19-2.26-.57-3.33-1.17-3.32-1.2-4.28-1.2-4.31.01-.09.11-.54.18-.87l.12-.58c.04-.21.09-.38.13-.57 1.06-4.42 1.72-9.49-1-26.8-1.73-10.87-4-19.17-6.42-27.96-2.9-10.55-6.18-22.5-9.33-42.03-2-12.35-2.19-24.47-1.55-35.89s1.47-19.6 2.38-27.67c2.01-6.64 3.01-14.64 0-21.64-16.5-38.62-26.53-77.67-30.83-116.98-1.45-13.07-2.45-25.7-2.9-38.3-1.26-52.72 5.74-104.72 20.74-156.72 5-18 4-37-9-51-3-3-10-5-11-1-25 69-51 138-50 211-7-3-22-4-19-15 2-4 7-7 9-11 12-34 5-71 15-106 14-45 23-91 26-138 3-45 57-43 85-67 13-12 2-30-2-46-2-8-12-11-11-19 0-1 3-3 3-5 0-12-3-24 5.03-33.99 5.35-6.51 14.46-10.46 24.37-10.46.42 0 .84 0 1.25.02 11 .98 18.76 4.64 23.1 10.78 7.24 9.64 3.24 22.64 3.24 33.64 0 2 1 4 4 5-2 7-6 10-9 16-35 53 29 65 65 85 11 6 15 19 16 31 5 45 6 91 24 133 4 9 6 18 7 28 4 34 4 67 17 99 2 4-10 7-17 10 3-22 0-42-5-64-12-46-25-86-35-133-2-5-3-12-9-13-18-4-25 19-23 33 13 76 33 148 19.19 223.59a357.614 357.614 0 0 1-10.75 50.02 358.206 358.206 0 0 1-18.44 49.38c-4 9-3 19-.99 28.61.91 8.08 1.74 16.27 2.38 27.69s.45 23.55-1.55 35.9c-3.15 19.53-6.44 31.49-9.33 42.04-2.41 8.78-4.69 17.08-6.41 27.93-2.71 17.31-2.06 22.38-1 26.8.04.19.09.36.13.54l.13.63c.07.33.17.78.18.91s-.04.96-1.2 4.27a9.905 9.905 0 0 0-.57 3.32c0 8.48 6.88 19 15.2 30.87l.71 1.01c2.24 3.72 3.58 5.64 5.24 7.24-.05.04-.09.08-.14.11-.54.46-1.03.97-1.45 1.51-.33.02-.66.06-.98.11-.46-.83-1-1.67-1.69-2.49a9.85 9.85 0 0 0-1.73-1.63 10.1 10.1 0 0 0-2.49-1.63c-1.51-.69-3.11-1.04-4.76-1.04-1.13 0-2.26.17-3.36.5a11.51 11.51 0 0 0-4.79 2.8c-.49-.61-1-1.22-1.52-1.82-.93-1.07-1.12-1.3-1.29-4.57-.19-3.58-1.03-6.65-2.57-9.37-.1-.18-.21-.35-.32-.53-.1-.17-.2-.34-.31-.51-.77-1.18-1.54-2.1-2.16-2.84-.23-.27-.44-.52-.61-.74-.16-.67-.58-3.36.6-9.76l.17-.94c.09-.52.15-1.05.16-1.57.1-.72.2-1.5.28-2.34.22-.69.37-1.42.44-2.17.39-4.43-.23-6.88-1.02-9.4-.08-.24-.16-.49-.24-.77.04-.6.41-2.24.75-3.69.24-1.04.51-2.22.79-3.56 1.83-8.59 1.19-33.77-1.22-47.27-.45-2.55-1-5.19-1.58-7.99-2.51-12.18-5.63-27.33-4.15-48.7 1.54-43.64 4.72-87.97.75-131.34-.99-10.84-2.44-21.62-4.46-32.32-2.03-10.69-4.63-21.17-7.95-31.35-1.99-7.66-19.05-6.76-21.04 1.9-2.49 10.56-4.46 21.28-6 32.06-7.7 53.92-4.6 107.32-2.67 161.04 1.48 21.36-1.64 36.52-4.15 48.69-.58 2.8-1.12 5.45-1.58 8-2.4 13.47-3.06 38.65-1.22 47.27.29 1.34.55 2.51.79 3.56.33 1.46.71 3.09.75 3.69-.09.3-.17.54-.24.78-1.42 4.54-1.62 7.55.02 16.43 1.18 6.4.76 9.08.6 9.76-.17.22-.38.47-.61.74-1.86 2.21-4.98 5.9-5.36 13.25-.17 3.26-.37 3.49-1.29 4.56-.52.6-1.03 1.2-1.52 1.82a11.718 11.718 0 0 0-4.83-2.81c-1.08-.32-2.21-.49-3.33-.49-5.86 0-8.97 3.88-10.65 6.8Z"/><path class="cls-1" d="M122.35 849.45c-.33-.05-.66-.09-1-.11-.43-.55-.91-1.06-1.46-1.52-.04-.04-.09-.07-.13-.11 1.65-1.6 3-3.52 5.24-7.24l.7-1.01c8.32-11.87 15.21-22.39 15.21-30.87 0-1.13-.19-2.26-.57-3.33-1.17-3.32-1.2-4.28-1.2-4.31.01-.09.11-.54.18-.87l.12-.58c.04-.21.09-.38.13-.57 1.06-4.42 1.72-9.49-1-26.8-1.73-10.87-4-19.17-6.42-27.96-2.9-10.55-6.18-22.5-9.33-42.03-2-12.35-2.19-24.47-1.55-35.89s1.47-19.6 2.38-27.67c2.01-6.64 3.01-14.64 0-21.64-16.5-38.62-26.53-77.67-30.83-116.98-1.45-13.07-2.45-25.7-2.9-38.3-1.26-52.72 5.74-104.72 20.74-156.72 5-18 4-37-9-51-3-3-10-5-11-1-25 69-51 138-50 211-7-3-22-4-19-15 2-4 7-7 9-11 12-34 5-71 15-106 14-45 23-91 26-138 3-45 57-43 85-67 13-12 2-30-2-46-2-8-12-11-11-19 0-1 3-3 3-5 0-12-3-24 5.03-33.99 5.35-6.51 14.46-10.46 24.37-10.46.42 0 .84 0 1.25.02 11 .98 18.76 4.64 23.1 10.78 7.24 9.64 3.24 22.64 3.24 33.64 0 2 1 4 4 5-2 7-6 10-9 16-35 53 29 65 65 85 11 6 15 19 16 31 5 45 6 91 24 133 4 9 6 18 7 28 4 34 4 67 17 99 2 4-10 7-17 10 3-22 0-42-5-64-12-46-25-86-35-133-2-5-3-12-9-13-18-4-25 19-23 33 13 76 33 148 19.19 223.59a357.614 357.614 0 0 1-10.75 50.02 358.206 358.206 0 0 1-18.44 49.38c-4 9-3 19-.99 28.61.91 8.08 1.74 16.27 2.38 27.69s.45 23.55-1.55 35.9c-3.15 19.53-6.44 31.49-9.33 42.04-2.41 8.78-4.69 17.08-6.41 27.93-2.71 17.31-2.06 22.38-1 26.8.04.19.09.36.13.54l.13.63c.07.33.17.78.18.91s-.04.96-1.2 4.27a9.905 9.905 0 0 0-.57 3.32c0 8.48 6.88 19 15.2 30.87l.71 1.01c2.24 3.72 3.58 5.64 5.24 7.24-.05.04-.09.08-.14.11-.54.46-1.03.97-1.45 1.51-.33.02-.66.06-.98.11-.46-.83-1-1.67-1.69-2.49a9.85 9.85 0 0 0-1.73-1.63 10.1 10.1 0 0 0-2.49-1.63c-1.51-.69-3.11-1.04-4.76-1.04-1.13 0-2.26.17-3.36.5a11.51 11.51 0 0 0-4.79 2.8c-.49-.61-1-1.22-1.52-1.82-.93-1.07-1.12-1.3-1.29-4.57-.19-3.58-1.03-6.65-2.57-9.37-.1-.18-.21-.35-.32-.53-.1-.17-.2-.34-.31-.51-.77-1.18-1.54-2.1-2.16-2.84-.23-.27-.44-.52-.61-.74-.16-.67-.58-3.36.6-9.76l.17-.94c.09-.52.15-1.05.16-1.57.1-.72.2-1.5.28-2.34.22-.69.37-1.42.44-2.17.39-4.43-.23-6.88-1.02-9.4-.08-.24-.16-.49-.24-.77.04-.6.41-2.24.75-3.69.24-1.04.51-2.22.79-3.56 1.83-8.59 1.19-33.77-1.22-47.27-.45-2.55-1-5.19-1.58-7.99-2.51-12.18-5.63-27.33-4.15-48.7 1.54-43.64 4.72-87.97.75-131.34-.99-10.84-2.44-21.62-4.46-32.32-2.03-10.69-4.63-21.17-7.95-31.35-1.99-7.66-19.05-6.76-21.04 1.9-2.49 10.56-4.46 21.28-6 32.06-7.7 53.92-4.6 107.32-2.67 161.04 1.48 21.36-1.64 36.52-4.15 48.69-.58 2.8-1.12 5.45-1.58 8-2.4 13.47-3.06 38.65-1.22 47.27.29 1.34.55 2.51.79 3.56.33 1.46.71 3.09.75 3.69-.09.3-.17.54-.24.78-1.42 4.54-1.62 7.55.02 16.43 1.18 6.4.76 9.08.6 9.76-.17.22-.38.47-.61.74-1.86 2.21-4.98 5.9-5.36 13.25-.17 3.26-.37 3.49-1.29 4.56-.52.6-1.03 1.2-1.52 1.82a11.718 11.718 0 0 0-4.83-2.81c-1.08-.32-2.21-.49-3.33-.49-5.86 0-8.97 3.88-10.65 6.8Z"/><path d="M132.55 572.97c-3.72-10.01-7.2-20.14-10.29-30.37s-5.8-20.58-7.98-31.02c-4.61-21.63-7.61-43.63-6.61-65.63 5-65 41-127 20-193-5-17-24-23-39-18 2-19-4-40 9-54 21-22 57-21 78-44 21 23 57 22 78 44 13 14 6 36 10 54-10-2-21-3-29 4-17 14-21 37-18 58 9 64 28 124 23.3 187.5-.83 14.55-2.71 29.42-6.12 44.25-3.41 14.83-8.35 29.58-15.19 44.25-1-17 1.25-36 .38-54 .62-22-9.38-48-32.38-55-39-11-62 31-54.48 65.21-.22 11.79-.03 25.95.37 43.81Zm42.83-489.84c-.72-8.18-5.72-14.18-7.72-21.18s-2-15-2-22c1-9 13-10 17-5 6 7 2 18 1 27-1 4-8 10-7.45 16.4-.22 1.94-.52 3.54-.83 4.78Z" style="stroke-width:2px;fill:none;stroke:#ff7c21;stroke-miterlimit:10"/><path class="cls-7" d="M175.38 83.12c-.72-8.18-5.72-14.18-7.72-21.18s-2-15-2-22c1-9 13-10 17-5 6 7 2 18 1 27-1 4-8 10-7.45 16.4-.22 1.94-.52 3.54-.83 4.78Z"/><path class="cls-5" d="M215 446.52h0"/><path d="M205.81 441.75c-20.48-8.68-45.28-7.42-65.51 1.88" style="stroke-linecap:round;stroke-width:2px;stroke-dasharray:0 0 0 10.37;fill:none;stroke:#ff7c21;stroke-miterlimit:10"/><path class="cls-5" d="M135.66 445.95h0"/><path d="M137.47 436.04c14.56-75.2 50.06-166.02-20.8-232.09-14-13 39-33 59-33 19 1 76 20 58 35-65 57-38 144-24.29 210.42 2 9.1 3.74 17.4 4.93 25.16" style="stroke-dasharray:0 0 0 10.07;stroke-linecap:round;stroke-width:2px;fill:none;stroke:#ff7c21;stroke-miterlimit:10"/><path class="cls-1" d="M122.35 849.45c-.33-.05-.66-.09-1-.11-.43-.55-.91-1.06-1.46-1.52-.04-.04-.09-.07-.13-.11 1.65-1.6 3-3.52 5.24-7.24l.7-1.01c8.32-11.87 15.21-22.39 15.21-30.87 0-1.13-.19-2.26-.57-3.33-1.17-3.32-1.2-4.28-1.2-4.31.01-.09.11-.54.18-.87l.12-.58c.04-.21.09-.38.13-.57 1.06-4.42 1.72-9.49-1-26.8-1.73-10.87-4-19.17-6.42-27.96-2.9-10.55-6.18-22.5-9.33-42.03-2-12.35-2.19-24.47-1.55-35.89s1.47-19.6 2.38-27.67c2.01-6.64 3.01-14.64 0-21.64-16.5-38.62-26.53-77.67-30.83-116.98-1.45-13.07-2.45-25.7-2.9-38.3-1.26-52.72 5.74-104.72 20.74-156.72 5-18 4-37-9-51-3-3-10-5-11-1-25 69-51 138-50 211-7-3-22-4-19-15 2-4 7-7 9-11 12-34 5-71 15-106 14-45 23-91 26-138 3-45 57-43 85-67 13-12 2-30-2-46-2-8-12-11-11-19 0-1 3-3 3-5 0-12-3-24 5.03-33.99 5.35-6.51 14.46-10.46 24.37-10.46.42 0 .84 0 1.25.02 11 .98 18.76 4.64 23.1 10.78 7.24 9.64 3.24 22.64 3.24 33.64 0 2 1 4 4 5-2 7-6 10-9 16-35 53 29 65 65 85 11 6 15 19 16 31 5 45 6 91 24 133 4 9 6 18 7 28 4 34 4 67 17 99 2 4-10 7-17 10 3-22 0-42-5-64-12-46-25-86-35-133-2-5-3-12-9-13-18-4-25 19-23 33 13 76 33 148 19.19 223.59a357.614 357.614 0 0 1-10.75 50.02 358.206 358.206 0 0 1-18.44 49.38c-4 9-3 19-.99 28.61.91 8.08 1.74 16.27 2.38 27.69s.45 23.55-1.55 35.9c-3.15 19.53-6.44 31.49-9.33 42.04-2.41 8.78-4.69 17.08-6.41 27.93-2.71 17.31-2.06 22.38-1 26.8.04.19.09.36.13.54l.13.63c.07.33.17.78.18.91s-.04.96-1.2 4.27a9.905 9.905 0 0 0-.57 3.32c0 8.48 6.88 19 15.2 30.87l.71 1.01c2.24 3.72 3.58 5.64 5.24 7.24-.05.04-.09.08-.14.11-.54.46-1.03.97-1.45 1.51-.33.02-.66.06-.98.11-.46-.83-1-1.67-1.69-2.49a9.85 9.85 0 0 0-1.73-1.63 10.1 10.1 0 0 0-2.49-1.63c-1.51-.69-3.11-1.04-4.76-1.04-1.13 0-2.26.17-3.36.5a11.51 11.51 0 0 0-4.79 2.8c-.49-.61-1-1.22-1.52-1.82-.93-1.07-1.12-1.3-1.29-4.57-.19-3.58-1.03-6.65-2.57-9.37-.1-.18-.21-.35-.32-.53-.1-.17-.2-.34-.31-.51-.77-1.18-1.54-2.1-2.16-2.84-.23-.27-.44-.52-.61-.74-.16-.67-.58-3.36.6-9.76l.17-.94c.09-.52.15-1.05.16-1.57.1-.72.2-1.5.28-2.34.22-.69.37-1.42.44-2.17.39-4.43-.23-6.88-1.02-9.4-.08-.24-.16-.49-.24-.77.04-.6.41-2.24.75-3.69.24-1.04.51-2.22.79-3.56 1.83-8.59 1.19-33.77-1.22-47.27-.45-2.55-1-5.19-1.58-7.99-2.51-12.18-5.63-27.33-4.15-48.7 1.54-43.64 4.72-87.97.75-131.34-.99-10.84-2.44-21.62-4.46-32.32-2.03-10.69-4.63-21.17-7.95-31.35-1.99-7.66-19.05-6.76-21.04 1.9-2.49 10.56-4.46 21.28-6 32.06-7.7 53.92-4.6 107.32-2.67 161.04 1.48 21.36-1.64 36.52-4.15 48.69-.58 2.8-1.12 5.45-1.58 8-2.4 13.47-3.06 38.65-1.22 47.27.29 1.34.55 2.51.79 3.56.33 1.46.71 3.09.75 3.69-.09.3-.17.54-.24.78-1.42 4.54-1.62 7.55.02 16.43 1.18 6.4.76 9.08.6 9.76-.17.22-.38.47-.61.74-1.86 2.21-4.98 5.9-5.36 13.25-.17 3.26-.37 3.49-1.29 4.56-.52.6-1.03 1.2-1.52 1.82a11.718 11.718 0 0 0-4.83-2.81c-1.08-.32-2.21-.49-3.33-.49-5.86 0-8.97 3.88-10.65 6.8Z"/><path d="M140.65 741.1c-2.79-10.17-5.93-21.77-8.94-40.39-1.89-11.69-2.05-23.29-1.56-33.6 1.51-18.17 8.51-37.17 1.51-53.17-16.88-39-26.02-78.14-29.32-117.53-1.12-13.09-1.85-25.45-2.01-38.01-1.67-57.47 12.33-111.47 22.33-169.47 3-18-5-42-25-45-13-2-23 11-25 23 9-32-5-73 21-97 19-17 48-18 68-36s5-50-7-70c-1-2 2-5 2-8-3-12-5-26 8-32 8-4 17-3 25 1 11 7 5 21 5 32 0 3 3 6 2 6-13 20-25 48-10 67 18 23 52 22 72 42 24 24 12 63 20 95-2-16-23-33-36-19-12 12-17 29-14 47 11 53 22 103 23.66 154.62.47 15.73-.05 31.27-1.55 47.68-3 32.81-11.44 65.37-28.11 97.7-11 23-3 48-1.49 72.16.49 10.31.33 21.92-1.56 33.61-3.01 18.63-6.15 30.23-8.93 40.39-.42-2.25-.9-4.56-1.36-6.81-2.4-11.64-5.38-26.12-3.99-46.26 1.56-44.06 5.63-89.85 2.25-134.45-.85-11.15-2.16-22.22-4.09-33.17-1.93-10.94-4.47-21.58-7.77-31.88-4.94-16.14-35.15-16.12-40.11-.94-3.64 10.28-6.37 20.89-8.4 31.82-2.03 10.95-3.34 22.04-4.13 33.2-3.16 44.67 2.03 90.69 2.92 135.42 1.39 20.13-1.59 34.61-3.99 46.25-.49 2.38-.95 4.62-1.36 6.82ZM318.7 450.59c-.07 0-.15 0 0 0Zm-286.11.01s-.03-.02 0 0Zm15.71-84.04c2.36-20.62 5.36-42.62 14.36-61.62v1.09c-5.73 25.72-9.84 44.47-14.36 60.53Zm254.62-.17c-5.25-20.45-9.25-40.45-14.25-60.45 0 1 1 2 1.18 2.71 6.79 16.37 8.65 22.92 13.07 57.74Z" style="stroke-width:2.5px;fill:none;stroke:#ff7c21;stroke-miterlimit:10"/><path class="cls-7" d="M227.64 487.3c-4.98-27.35-33.98-40.35-59.98-37.35-20 3-40 15-44 36-6-62 19-121 25-183 3-35-22-64-42-89-26-33 41-51 70-55 20-3 49 12 67 30 8 6 15 25 3 33s-27 9-33 22c-29 69 12 139 15.94 207.99.51 8.31-.1 20.61-1.96 35.36Z"/></svg>
-"""
+    return [
+        ('underweight', '#ADD8E6', 'underweight'),
+        ('healthy', '#90EE90', 'healthy'),
+        ('overweight', '#FFD700', 'unhealthy'),
+        ('obese', '#FF6347', 'unhealthy'),
+    ][bmi_category_index(bmi)]
+
+@st.fragment
+def show_silhouette(bmi, waist, hip, height, svg_name):
+    # The style toggle is local to this fragment, so flipping it reruns only the figure
+    continuous = st.toggle("Continuous silhouette", value=True, key="continuous_silhouette")
+    # The fixed figures are sent as a content-hash URL the browser caches
+    with span('svg_payload', page='SVG Body'):
+        if continuous:
+            st.image(svg_morph.body_svg(bmi, waist, hip, height), width=160)
+        else:
+            st.image(svg_assets.url(svg_name), width=160)
 
 # Streamlit app
-st.title("BMI 2.0 Calculator and Visualizer")
-
-st.sidebar.header("User Input Parameters")
-gender = st.sidebar.selectbox("Select Gender", ["male", "female"])
-weight = st.sidebar.slider("Weight (kg)", 30.0, 150.0, 70.0)
-height = st.sidebar.slider("Height (cm)", 100.0, 220.0, 170.0)
-neck = st.sidebar.slider("Neck circumference (cm)", 20.0, 60.0, 40.0)
-waist = st.sidebar.slider("Waist circumference (cm)", 40.0, 150.0, 70.0)
-
-hip = None
-if gender == 'female':
-    hip = st.sidebar.slider("Hip circumference (cm)", 70.0, 160.0, 100.0)
-
-if st.sidebar.button("Calculate"):
-    bmi = calculate_bmi(weight, height)
-    category, color, svg_code = get_bmi_category(bmi)
+with page_run('SVG Body'):
+    st.title("BMI 2.0 Calculator and Visualizer")
+
+    with span('widgets'):
+        st.sidebar.header("User Input Parameters")
+        gender = st.sidebar.selectbox("Select Gender", ["male", "female"])
+        weight = st.sidebar.slider("Weight (kg)", 30.0, 150.0, 70.0)
+        height = st.sidebar.slider("Height (cm)", 100.0, 220.0, 170.0)
+        neck = st.sidebar.slider("Neck circumference (cm)", 20.0, 60.0, 40.0)
+        waist = st.sidebar.slider("Waist circumference (cm)", 40.0, 150.0, 70.0)
+
+        hip = None
+        if gender == 'female':
+            hip = st.sidebar.slider("Hip circumference (cm)", 70.0, 160.0, 100.0)
+
+        calculate = calculate_requested()
+
+    if calculate:
+        with span('calculate_bmi'):
+            bmi = calculate_bmi(weight, height)
+        category, color, svg_name = get_bmi_category(bmi)
     
-    st.write(f"Calculated BMI: {bmi:.2f}")
-    st.write(f"BMI Category: {category}")
+        st.write(f"Calculated BMI: {bmi:.2f}")
+        st.write(f"BMI Category: {category}")
 
-    # Display SVG
-    components.html(svg_code, height=400)
+        debounce((bmi, waist, hip, height), key='svg_body')
+        show_silhouette(bmi, waist, hip, height, svg_name)
@@ -0,0 +1,176 @@
+"""Population percentiles of BMI and body fat by gender and age band.
+
+The reference distribution is built once from a raw CSV (columns
+``gender, age`` plus one column per metric) into ``assets/percentiles``:
+for each metric, ``<metric>.values.npy`` holds the observations sorted
+within each gender/age-band group and ``<metric>.offsets.npy`` the start of
+every group. The arrays are opened memory-mapped and shared by all sessions
+of a process, so a lookup is a binary search that touches a handful of
+pages and no session holds a copy of the table.
+
+    python percentiles.py assets/reference/population.csv --synthetic    # rebuild the bundled index
+"""
+import argparse
+import bisect
+import functools
+import json
+import math
+import os
+from dataclasses import dataclass
+
+from lazy_import import lazy_import
+
+np = lazy_import('numpy')
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+REFERENCE_CSV = os.path.join(ROOT, 'assets', 'reference', 'population.csv')
+INDEX_DIR = os.path.join(ROOT, 'assets', 'percentiles')
+
+GENDERS = ('male', 'female')
+# Lower edge of each adult age band; the last band is open-ended.
+AGE_BANDS = (18, 25, 35, 45, 55, 65, 75)
+METRICS = ('bmi', 'body_fat_percentage')
+
+
+def age_band(age):
+    """Index of the age band containing ``age``; -1 below the first band."""
+    return bisect.bisect_right(AGE_BANDS, age) - 1
+
+
+def age_band_label(band):
+    if band + 1 == len(AGE_BANDS):
+        return f'{AGE_BANDS[band]}+'
+    return f'{AGE_BANDS[band]}-{AGE_BANDS[band + 1] - 1}'
+
+
+def group_index(gender, age):
+    """Gender/age-band group of each row; -1 for unknown genders and missing ages or ages under the first band."""
+    gender = np.asarray(gender)
+    age = np.asarray(age, dtype=float)
+    # digitize puts NaN past the last edge, i.e. in the open-ended band.
+    band = np.digitize(age, AGE_BANDS) - 1
+    gender_index = np.select([gender == name for name in GENDERS], range(len(GENDERS)), -1)
+    valid = (gender_index >= 0) & (band >= 0) & np.isfinite(age)
+    return np.where(valid, gender_index * len(AGE_BANDS) + band, -1)
+
+
+@dataclass(frozen=True)
+class ReferenceTable:
+    values: dict
+    offsets: dict
+    manifest: dict
+
+    @property
+    def synthetic(self):
+        """Whether the reference data is a made-up sample rather than survey data."""
+        return self.manifest.get('synthetic', False)
+
+
+def build_index(csv_path, out_dir=INDEX_DIR, source=None, synthetic=False):
+    """Sort a raw reference CSV into the memory-mappable index format and return its manifest."""
+    import pandas as pd
+
+    frame = pd.read_csv(csv_path)
+    frame['gender'] = frame['gender'].astype(str).str.strip().str.lower()
+    group = group_index(frame['gender'].to_numpy(), pd.to_numeric(frame['age'], errors='coerce').to_numpy())
+    n_groups = len(GENDERS) * len(AGE_BANDS)
+
+    os.makedirs(out_dir, exist_ok=True)
+    manifest = {
+        'source': source or os.path.basename(csv_path),
+        'synthetic': synthetic,
+        'genders': list(GENDERS),
+        'age_bands': list(AGE_BANDS),
+        'metrics': {},
+    }
+    for metric in METRICS:
+        if metric not in frame:
+            continue
+        values = pd.to_numeric(frame[metric], errors='coerce').to_numpy(dtype=float)
+        keep = (group >= 0) & np.isfinite(values)
+        order = np.lexsort((values[keep], group[keep]))
+        sorted_groups = group[keep][order]
+        offsets = np.searchsorted(sorted_groups, np.arange(n_groups + 1)).astype(np.int64)
+        _save(os.path.join(out_dir, f'{metric}.values.npy'), values[keep][order].astype(np.float32))
+        _save(os.path.join(out_dir, f'{metric}.offsets.npy'), offsets)
+        manifest['metrics'][metric] = {'rows': int(keep.sum()), 'group_rows': np.diff(offsets).tolist()}
+
+    with open(os.path.join(out_dir, 'index.json'), 'w') as f:
+        json.dump(manifest, f, indent=2)
+        f.write('\n')
+    load.cache_clear()
+    return manifest
+
+
+def _save(path, array):
+    tmp = f'{path}.{os.getpid()}.tmp'
+    with open(tmp, 'wb') as f:
+        np.save(f, array)
+    os.replace(tmp, path)
+
+
+@functools.lru_cache(maxsize=None)
+def load(index_dir=INDEX_DIR):
+    with open(os.path.join(index_dir, 'index.json')) as f:
+        manifest = json.load(f)
+    values, offsets = {}, {}
+    for metric in manifest['metrics']:
+        values[metric] = np.load(os.path.join(index_dir, f'{metric}.values.npy'), mmap_mode='r')
+        offsets[metric] = np.load(os.path.join(index_dir, f'{metric}.offsets.npy'))
+    return ReferenceTable(values, offsets, manifest)
+
+
+def percentiles(values, gender, age, metric='bmi', index_dir=INDEX_DIR):
+    """Percentile (0-100) of each value within its gender/age-band group; NaN where there is no reference.
+
+    Ties count half, so a value equal to the group median gets 50.
+    """
+    table = load(index_dir)
+    values, gender, age = np.broadcast_arrays(np.asarray(values, dtype=float), np.asarray(gender), np.asarray(age))
+    group = group_index(gender, age)
+    group[~np.isfinite(values)] = -1
+    result = np.full(values.shape, np.nan)
+    offsets = table.offsets[metric]
+    for g in np.unique(group[group >= 0]):
+        start, stop = offsets[g], offsets[g + 1]
+        if stop == start:
+            continue
+        reference = table.values[metric][start:stop]
+        mask = group == g
+        queries = values[mask].astype(np.float32)
+        below = np.searchsorted(reference, queries, side='left')
+        at_or_below = np.searchsorted(reference, queries, side='right')
+        result[mask] = 50.0 * (below + at_or_below) / (stop - start)
+    return result
+
+
+def percentile(value, gender, age, metric='bmi', index_dir=INDEX_DIR):
+    """Scalar :func:`percentiles`, without the array set-up."""
+    table = load(index_dir)
+    if gender not in GENDERS or not age >= AGE_BANDS[0] or not math.isfinite(value):
+        return math.nan
+    group = GENDERS.index(gender) * len(AGE_BANDS) + age_band(age)
+    start, stop = table.offsets[metric][group:group + 2]
+    if stop == start:
+        return math.nan
+    reference = table.values[metric][start:stop]
+    query = np.float32(value)
+    below = reference.searchsorted(query, side='left')
+    at_or_below = reference.searchsorted(query, side='right')
+    return float(50.0 * (below + at_or_below) / (stop - start))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Build the percentile index from a reference CSV.')
+    parser.add_argument('csv', nargs='?', default=REFERENCE_CSV, help='columns gender, age, bmi, body_fat_percentage')
+    parser.add_argument('--output', default=INDEX_DIR, help='index directory (default: assets/percentiles)')
+    parser.add_argument('--source', help='description of the data recorded in the manifest')
+    parser.add_argument('--synthetic', action='store_true', help='mark the data as a synthetic sample')
+    args = parser.parse_args(argv)
+    manifest = build_index(args.csv, args.output, args.source, args.synthetic)
+    for metric, info in manifest['metrics'].items():
+        print(f"{metric}: {info['rows']:,} rows in {len(info['group_rows'])} groups -> {args.output}")
+
+
+if __name__ == '__main__':
+    main()
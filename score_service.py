@@ -0,0 +1,308 @@
+"""Headless HTTP scoring service with request micro-batching.
+
+    python score_service.py --port 8080 --max-wait-ms 2
+
+``POST /score`` takes one JSON object with ``weight, height, neck, waist,
+hip, gender, units`` (``hip`` only for women, ``units`` defaults to
+metric) and answers ``{"bmi", "body_fat_percentage", "bmi_category"}``.
+Requests that queue up while a batch is being scored (up to
+``--max-batch``, collected for at most ``--max-wait-ms``) are scored
+together in one vectorized call; a lone request is scored right away.
+``GET /stats`` reports request counts, batch sizes and p50/p99 latency;
+``GET /healthz`` answers ``ok``.
+
+The server speaks plain HTTP/1.1 on asyncio streams and keeps connections
+alive unless the client sends ``Connection: close`` or stays idle for
+``IDLE_TIMEOUT`` seconds. Bodies need a ``Content-Length``; chunked uploads
+are refused, and so are header lines over 64 KB or more than
+``MAX_HEADERS`` headers.
+"""
+import argparse
+import asyncio
+import collections
+import json
+import math
+import sys
+import time
+import traceback
+
+import numpy as np
+
+from body_composition import calculate_bmi, calculate_body_fat_percentage, get_bmi_category
+
+GENDERS = ('male', 'female')
+UNITS = ('metric', 'imperial')
+MAX_BODY = 64 * 1024
+MAX_HEADERS = 100
+IDLE_TIMEOUT = 30.0
+LATENCY_SAMPLES = 10_000
+REASONS = {200: 'OK', 400: 'Bad Request', 404: 'Not Found', 405: 'Method Not Allowed', 408: 'Request Timeout',
+           411: 'Length Required', 413: 'Payload Too Large', 431: 'Request Header Fields Too Large',
+           500: 'Internal Server Error'}
+UNDEFINED_BODY_FAT = 'circumferences give a non-positive log argument'
+
+
+class BadRequest(ValueError):
+    pass
+
+
+def parse_person(payload):
+    """Validated ``(weight, height, neck, waist, hip, gender, units)`` from a request body."""
+    if not isinstance(payload, dict):
+        raise BadRequest('body must be a JSON object')
+    gender = str(payload.get('gender', '')).strip().lower()
+    units = str(payload.get('units', 'metric')).strip().lower()
+    if gender not in GENDERS:
+        raise BadRequest('gender must be male or female')
+    if units not in UNITS:
+        raise BadRequest('units must be metric or imperial')
+    values = []
+    for field in ('weight', 'height', 'neck', 'waist', 'hip'):
+        value = payload.get(field)
+        if value is None and (field != 'hip' or gender == 'female'):
+            raise BadRequest(f'missing {field}')
+        if value is not None:
+            if isinstance(value, bool) or not isinstance(value, (int, float)):
+                raise BadRequest(f'{field} must be a number')
+            try:
+                value = float(value)
+            except OverflowError:
+                # A JSON integer too large for a float.
+                raise BadRequest(f'{field} must be a number') from None
+            if not math.isfinite(value):
+                raise BadRequest(f'{field} must be a number')
+            if value <= 0:
+                raise BadRequest(f'{field} must be positive')
+        values.append(math.nan if value is None else value)
+    return (*values, gender, units)
+
+
+def score_batch(people):
+    """Score parsed people in one vectorized pass; one result dict per person."""
+    weight, height, neck, waist, hip, gender, units = (np.array(column) for column in zip(*people))
+    bmi = calculate_bmi(weight, height, units)
+    bfp = calculate_body_fat_percentage(weight, height, neck, waist, hip, gender, units)
+    category = get_bmi_category(bmi)[0]
+    return [
+        {
+            'bmi': round(float(b), 2),
+            'body_fat_percentage': None if math.isnan(f) else float(f),
+            'bmi_category': str(c),
+        }
+        for b, f, c in zip(bmi, bfp, category)
+    ]
+
+
+class MicroBatcher:
+    """Scores whatever has queued up together, up to ``max_batch`` items.
+
+    Collection stops as soon as the queue drains (after letting other
+    connections run once), so a lone request does not wait; ``max_wait``
+    only bounds how long a steady trickle can keep a batch open.
+    """
+
+    def __init__(self, max_batch=512, max_wait=0.002):
+        self.max_batch = max_batch
+        self.max_wait = max_wait
+        self.batch_sizes = collections.Counter()
+        self._queue = asyncio.Queue()
+
+    async def score(self, person):
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((person, future))
+        return await future
+
+    async def run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.max_wait
+            while len(batch) < self.max_batch and loop.time() < deadline:
+                if self._queue.empty():
+                    # Let connections with a request already buffered enqueue it.
+                    await asyncio.sleep(0)
+                    if self._queue.empty():
+                        break
+                batch.append(self._queue.get_nowait())
+            self.batch_sizes[len(batch)] += 1
+            try:
+                results = score_batch([person for person, _ in batch])
+            except Exception as exc:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(exc)
+                continue
+            for (_, future), result in zip(batch, results):
+                if not future.done():
+                    future.set_result(result)
+
+
+class ScoreServer:
+    def __init__(self, batcher):
+        self.batcher = batcher
+        self.requests = 0
+        self.errors = 0
+        self.latencies = collections.deque(maxlen=LATENCY_SAMPLES)
+        self.started = time.monotonic()
+
+    async def handle(self, reader, writer):
+        try:
+            while await self._handle_one(reader, writer):
+                pass
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    async def _handle_one(self, reader, writer):
+        """Serve one request; False when the connection should close."""
+        try:
+            request_line = await asyncio.wait_for(reader.readuntil(b'\r\n'), IDLE_TIMEOUT)
+        except (asyncio.IncompleteReadError, asyncio.TimeoutError):
+            return False
+        except asyncio.LimitOverrunError:
+            await self._respond(writer, 431, {'error': 'request line too long'}, keep_alive=False)
+            return False
+        started = time.perf_counter()
+        try:
+            headers = await asyncio.wait_for(self._read_headers(reader), IDLE_TIMEOUT)
+        except asyncio.TimeoutError:
+            await self._respond(writer, 408, {'error': 'timed out reading headers'}, keep_alive=False)
+            return False
+        except asyncio.LimitOverrunError:
+            await self._respond(writer, 431, {'error': 'header line too long'}, keep_alive=False)
+            return False
+        except BadRequest as exc:
+            await self._respond(writer, 431, {'error': str(exc)}, keep_alive=False)
+            return False
+        try:
+            method, path, version = request_line.decode('latin-1').split()
+        except ValueError:
+            await self._respond(writer, 400, {'error': 'malformed request line'}, keep_alive=False)
+            return False
+        connection = headers.get('connection', '').lower()
+        keep_alive = connection == 'keep-alive' if version == 'HTTP/1.0' else connection != 'close'
+
+        if 'chunked' in headers.get('transfer-encoding', '').lower():
+            await self._respond(writer, 411, {'error': 'chunked bodies are not supported'}, keep_alive=False)
+            return False
+        try:
+            length = int(headers.get('content-length') or 0)
+        except ValueError:
+            await self._respond(writer, 400, {'error': 'bad Content-Length'}, keep_alive=False)
+            return False
+        if length > MAX_BODY:
+            await self._respond(writer, 413, {'error': 'body too large'}, keep_alive=False)
+            return False
+        try:
+            body = await asyncio.wait_for(reader.readexactly(length), IDLE_TIMEOUT) if length else b''
+        except asyncio.TimeoutError:
+            await self._respond(writer, 408, {'error': 'timed out reading body'}, keep_alive=False)
+            return False
+
+        try:
+            status, payload = await self._route(method, path.split('?')[0], body)
+        except Exception:
+            traceback.print_exc(file=sys.stderr)
+            status, payload, keep_alive = 500, {'error': 'internal error'}, False
+        await self._respond(writer, status, payload, keep_alive)
+        if path.startswith('/score'):
+            self.requests += 1
+            self.errors += status != 200
+            self.latencies.append(time.perf_counter() - started)
+        return keep_alive
+
+    async def _read_headers(self, reader):
+        headers = {}
+        while True:
+            line = await reader.readuntil(b'\r\n')
+            if line == b'\r\n':
+                return headers
+            if len(headers) >= MAX_HEADERS:
+                raise BadRequest(f'more than {MAX_HEADERS} headers')
+            name, _, value = line.decode('latin-1').partition(':')
+            headers[name.strip().lower()] = value.strip()
+
+    async def _route(self, method, path, body):
+        if path == '/score':
+            if method != 'POST':
+                return 405, {'error': 'use POST'}
+            try:
+                person = parse_person(json.loads(body or b'null'))
+            except (BadRequest, ValueError) as exc:
+                return 400, {'error': str(exc)}
+            result = await self.batcher.score(person)
+            if result['body_fat_percentage'] is None:
+                return 400, {'error': UNDEFINED_BODY_FAT}
+            return 200, result
+        if path == '/stats':
+            return 200, self.stats()
+        if path == '/healthz':
+            return 200, 'ok'
+        return 404, {'error': 'not found'}
+
+    async def _respond(self, writer, status, payload, keep_alive):
+        body = json.dumps(payload).encode()
+        writer.write(
+            f'HTTP/1.1 {status} {REASONS[status]}\r\n'
+            f'Content-Type: application/json\r\n'
+            f'Content-Length: {len(body)}\r\n'
+            f'Connection: {"keep-alive" if keep_alive else "close"}\r\n\r\n'.encode() + body
+        )
+        await writer.drain()
+
+    def stats(self):
+        latencies = np.array(self.latencies) * 1000
+        batch_sizes = self.batcher.batch_sizes
+        batches = sum(batch_sizes.values())
+        return {
+            'requests': self.requests,
+            'errors': self.errors,
+            'uptime_s': round(time.monotonic() - self.started, 1),
+            'batches': batches,
+            'mean_batch_size': round(sum(n * count for n, count in batch_sizes.items()) / max(batches, 1), 2),
+            'latency_ms': {
+                'p50': round(float(np.percentile(latencies, 50)), 3) if len(latencies) else None,
+                'p99': round(float(np.percentile(latencies, 99)), 3) if len(latencies) else None,
+                'samples': len(latencies),
+            },
+        }
+
+
+async def serve(host='127.0.0.1', port=8080, max_batch=512, max_wait=0.002, stats_interval=None, ready=None):
+    batcher = MicroBatcher(max_batch, max_wait)
+    app = ScoreServer(batcher)
+    batch_task = asyncio.create_task(batcher.run())
+    server = await asyncio.start_server(app.handle, host, port)
+    print(f'Scoring on http://{host}:{port} (max batch {max_batch}, max wait {max_wait * 1000:g} ms)',
+          file=sys.stderr, flush=True)
+    if ready is not None:
+        ready.set()
+    try:
+        async with server:
+            if not stats_interval:
+                await server.serve_forever()
+            while True:
+                await asyncio.sleep(stats_interval)
+                print(json.dumps(app.stats()), file=sys.stderr, flush=True)
+    finally:
+        batch_task.cancel()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='HTTP BMI / body-fat scoring service with micro-batching.')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8080)
+    parser.add_argument('--max-batch', type=int, default=512, help='most requests scored together (default: 512)')
+    parser.add_argument('--max-wait-ms', type=float, default=2.0,
+                        help='longest a batch keeps collecting queued requests (default: 2)')
+    parser.add_argument('--stats-interval', type=float, help='log /stats to stderr every N seconds')
+    args = parser.parse_args(argv)
+    try:
+        asyncio.run(serve(args.host, args.port, args.max_batch, args.max_wait_ms / 1000, args.stats_interval))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
@@ -1,111 +1,146 @@
-import streamlit as st
-import matplotlib.pyplot as plt
-import numpy as np
 import math
-import plotly.graph_objects as go
-
-def calculate_bmi(weight, height):
-    return weight / (height / 100) ** 2
-
-def calculate_body_fat_percentage(weight, height, neck, waist, hip, gender, units='metric'):
-    if units == 'imperial':
-        weight = weight * 0.453592
-        height = height * 2.54
-        neck = neck * 2.54
-        waist = waist * 2.54
-        if hip:
-            hip = hip * 2.54
+import uuid
 
-    if gender == 'male':
-        bfp = 495 / (1.0324 - 0.19077 * math.log10(waist - neck) + 0.15456 * math.log10(height)) - 450
-    else:
-        bfp = 495 / (1.29579 - 0.35004 * math.log10(waist + hip - neck) + 0.22100 * math.log10(height)) - 450
-
-    return round(bfp, 2)
+import streamlit as st
+import history
+from body_composition import BODY_FAT_UNDEFINED, calculate_bmi, calculate_body_fat_percentage
+from body_fat_chart import FEMALE_BANDS, MALE_BANDS, render_body_fat_chart_png
+from body_mesh import LEVELS_OF_DETAIL, body_mesh_figure, payload_bytes
+from instrumentation import add_bytes, page_run, span
+from live_mode import calculate_requested, debounce
+from percentiles import AGE_BANDS, age_band, age_band_label, load as load_percentiles, percentile
+from whatif_grid import grid_key, view
+from whatif_heatmap import whatif_heatmap, widget_key
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def _body_mesh_figure(weight, height, neck, waist, hip, units, lod):
+    return body_mesh_figure(weight, height, neck, waist, hip, units, lod)
 
 def plot_body_fat_categories(height, neck, waist, hip, gender, user_weight, user_bfp, units='metric'):
-    weights = np.linspace(40, 150, 300)
-    bfp_values = [calculate_body_fat_percentage(weight, height, neck, waist, hip, gender, units) for weight in weights]
-
-    plt.figure(figsize=(12, 6))
-    plt.plot(weights, bfp_values, label='Body Fat %')
-
-    if gender == 'male':
-        plt.fill_between(weights, 0, 6, color='blue', alpha=0.3, label='Essential fat')
-        plt.fill_between(weights, 6, 14, color='green', alpha=0.3, label='Athletes')
-        plt.fill_between(weights, 14, 18, color='yellow', alpha=0.3, label='Fitness')
-        plt.fill_between(weights, 18, 25, color='orange', alpha=0.3, label='Average')
-        plt.fill_between(weights, 25, max(bfp_values), color='red', alpha=0.3, label='Obese')
-    else:
-        plt.fill_between(weights, 0, 13, color='blue', alpha=0.3, label='Essential fat')
-        plt.fill_between(weights, 13, 21, color='green', alpha=0.3, label='Athletes')
-        plt.fill_between(weights, 21, 25, color='yellow', alpha=0.3, label='Fitness')
-        plt.fill_between(weights, 25, 32, color='orange', alpha=0.3, label='Average')
-        plt.fill_between(weights, 32, max(bfp_values), color='red', alpha=0.3, label='Obese')
-
-    plt.scatter([user_weight], [user_bfp], color='black', zorder=5)
-    plt.text(user_weight, user_bfp, f' {user_bfp}%', fontsize=12, verticalalignment='bottom')
-
-    plt.title('Body Fat Percentage Categories')
-    plt.xlabel('Weight (kg)')
-    plt.ylabel('Body Fat %')
-    plt.legend(loc='upper left')
-    plt.grid(True)
-    st.pyplot(plt)
-
-def plot_3d_shape(weight, height, waist, hip, gender):
-    # Generate a simple 3D shape that changes with weight and height
-    fig = go.Figure(data=[
-        go.Mesh3d(
-            x=[0, weight, 0, -weight],
-            y=[0, height, -height, 0],
-            z=[0, waist, hip if hip else waist, 0],
-            color='lightblue',
-            opacity=0.50
+    with span('plot_body_fat_categories'):
+        png = render_body_fat_chart_png(height, neck, waist, hip, gender, user_weight, user_bfp, units)
+        add_bytes(len(png))
+        st.image(png)
+
+def _percent(value):
+    return f"{value:.0f}%" if math.isfinite(value) else "–"
+
+def show_percentiles(bmi, bfp, gender, age):
+    with span('percentiles'):
+        band = age_band_label(age_band(age))
+        bmi_pct = percentile(bmi, gender, age, 'bmi')
+        bfp_pct = percentile(bfp, gender, age, 'body_fat_percentage')
+        note = " (synthetic sample data, for illustration only)" if load_percentiles().synthetic else ""
+        st.caption(f"Compared with {gender}s aged {band}{note}: BMI higher than {_percent(bmi_pct)}, "
+                   f"body fat higher than {_percent(bfp_pct)}")
+
+def history_user():
+    # Anonymous visitors get an id in the URL, so a bookmarked link keeps their history
+    if "user" not in st.query_params:
+        st.query_params["user"] = uuid.uuid4().hex[:16]
+    return st.query_params["user"]
+
+def _per_week(slope):
+    # A slope needs measurements at two different times
+    return f"{slope * 7:+.2f}" if math.isfinite(slope) else "-"
+
+def show_history(bmi, bfp):
+    with span('history'):
+        user = history_user()
+        store = history.store()
+        # Only an explicit Calculate press is a measurement; live-mode reruns follow every slider step
+        live = st.session_state.get("live_mode")
+        if not live:
+            store.wait(store.record(user, bmi, bfp))
+        rows = store.daily(user)
+        trends = store.trends(user)
+        st.subheader("History")
+        if live:
+            st.caption("Live results are not saved. Turn off live update and press Calculate to record one.")
+        if len(rows) > 1:
+            st.plotly_chart(history.trend_figure(rows))
+        st.markdown("\n".join([
+            "| Window | Calculations | BMI range | BMI / week | Body fat range | Body fat / week |",
+            "|---|---|---|---|---|---|",
+        ] + [
+            f"| {days} days | {trend.count} | {trend.bmi_min:.1f}-{trend.bmi_max:.1f} | {_per_week(trend.bmi_slope)} "
+            f"| {trend.body_fat_min:.1f}-{trend.body_fat_max:.1f}% | {_per_week(trend.body_fat_slope)} |"
+            for days, trend in trends.items()
+        ]))
+
+@st.fragment
+def what_if_explorer(height, neck, waist, hip, gender, units='metric'):
+    # Zooming reruns only this fragment, which sends a finer grid for the visible window
+    with span('what_if_explorer', page='streamlit_app'):
+        st.subheader("What-if explorer")
+        y_axis = "neck"
+        if gender == 'female':
+            y_axis = st.radio("Second axis", ["neck", "hip"], horizontal=True, key="whatif_axis")
+        grid = grid_key(height, neck, waist, hip, gender, units, y_axis)
+        zoom = st.session_state.get(widget_key(y_axis))
+        grid_view = view(grid, zoom['x'], zoom['y']) if zoom else view(grid)
+        unit = "cm" if units == 'metric' else "in"
+        whatif_heatmap(
+            grid_view, grid,
+            bands=MALE_BANDS if gender == 'male' else FEMALE_BANDS,
+            marker=(waist, neck if y_axis == "neck" else hip),
+            axis_labels=(f"Waist ({unit})", f"{y_axis.capitalize()} ({unit})"),
         )
-    ])
-
-    fig.update_layout(
-        scene=dict(
-            xaxis=dict(nticks=4, range=[-100, 100]),
-            yaxis=dict(nticks=4, range=[0, 220]),
-            zaxis=dict(nticks=4, range=[0, 150]),
-            xaxis_title='Weight',
-            yaxis_title='Height',
-            zaxis_title='Waist/Hip'
-        )
-    )
-    
-    st.plotly_chart(fig)
 
+@st.fragment
+def plot_3d_shape(weight, height, neck, waist, hip, units='metric'):
+    # The detail selector is local to this fragment, so changing it reruns only the mesh
+    with span('plot_3d_shape', page='streamlit_app'):
+        lod = st.selectbox("3D mesh detail", list(LEVELS_OF_DETAIL), index=1, key="mesh_lod")
+        fig, stats = _body_mesh_figure(weight, height, neck, waist, hip, units, lod)
+        st.plotly_chart(fig)
+        st.caption(f"{stats['triangles']:,} triangles, {payload_bytes(lod) / 1024:.0f} KB chart payload")
+
+@page_run('streamlit_app')
 def main():
     st.set_page_config(page_title="BMI 2.0 Calculator and 3D Visualizer", page_icon="🏃‍♂️")
 
     st.title("BMI 2.0 Calculator and 3D Visualizer")
 
-    st.sidebar.header("User Input Parameters")
+    with span('widgets'):
+        st.sidebar.header("User Input Parameters")
     
-    gender = st.sidebar.selectbox("Select Gender", ["male", "female"])
-    units = st.sidebar.selectbox("Select Units", ["metric", "imperial"])
+        gender = st.sidebar.selectbox("Select Gender", ["male", "female"])
+        units = st.sidebar.selectbox("Select Units", ["metric", "imperial"])
+        age = st.sidebar.slider("Age (years)", AGE_BANDS[0], 90, 35)
     
-    weight = st.sidebar.slider("Weight (kg)", 30.0, 150.0, 70.0)
-    height = st.sidebar.slider("Height (cm)", 100.0, 220.0, 170.0)
-    neck = st.sidebar.slider("Neck circumference (cm)", 20.0, 60.0, 40.0)
-    waist = st.sidebar.slider("Waist circumference (cm)", 40.0, 150.0, 70.0)
+        weight = st.sidebar.slider("Weight (kg)", 30.0, 150.0, 70.0)
+        height = st.sidebar.slider("Height (cm)", 100.0, 220.0, 170.0)
+        neck = st.sidebar.slider("Neck circumference (cm)", 20.0, 60.0, 40.0)
+        waist = st.sidebar.slider("Waist circumference (cm)", 40.0, 150.0, 70.0)
     
-    hip = None
-    if gender == 'female':
-        hip = st.sidebar.slider("Hip circumference (cm)", 70.0, 160.0, 100.0)
+        hip = None
+        if gender == 'female':
+            hip = st.sidebar.slider("Hip circumference (cm)", 70.0, 160.0, 100.0)
+
+        calculate = calculate_requested()
 
-    if st.sidebar.button("Calculate"):
-        bmi = calculate_bmi(weight, height)
-        bfp = calculate_body_fat_percentage(weight, height, neck, waist, hip, gender, units)
+    if calculate:
+        with span('calculate_bmi'):
+            bmi = calculate_bmi(weight, height)
+        with span('calculate_body_fat_percentage'):
+            bfp = calculate_body_fat_percentage(weight, height, neck, waist, hip, gender, units)
         
         st.write(f"Calculated BMI: {bmi:.2f}")
-        st.write(f"Calculated Body Fat Percentage: {bfp:.2f}%")
+        valid = math.isfinite(bfp)
+        if valid:
+            st.write(f"Calculated Body Fat Percentage: {bfp:.2f}%")
+            show_percentiles(bmi, bfp, gender, age)
+        else:
+            st.warning(BODY_FAT_UNDEFINED)
         
-        plot_body_fat_categories(height, neck, waist, hip, gender, weight, bfp, units)
-        plot_3d_shape(weight, height, waist, hip, gender)
+        debounce((gender, units, weight, height, neck, waist, hip))
+        if valid:
+            plot_body_fat_categories(height, neck, waist, hip, gender, weight, bfp, units)
+        what_if_explorer(height, neck, waist, hip, gender, units)
+        plot_3d_shape(weight, height, neck, waist, hip, units)
+        if valid:
+            show_history(bmi, bfp)
 
 if __name__ == "__main__":
     main()
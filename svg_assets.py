@@ -0,0 +1,138 @@
+"""Minified, precompressed SVG figures served by content-hash URL.
+
+Source figures live in ``assets/svg``. On first use each one is minified
+once per process and published to Streamlit's ``static`` directory as
+``<name>.<hash>.svg`` together with ``.gz`` (and, when the ``brotli``
+package is installed, ``.br``) copies that a reverse proxy can serve
+directly. Pages only send the ``/app/static/...`` URL to the browser, so
+the markup is downloaded once and cached by the browser afterwards.
+
+    python svg_assets.py    # publish every asset and print the sizes
+"""
+import functools
+import gzip
+import hashlib
+import os
+import re
+from dataclasses import dataclass
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+ASSET_DIR = os.path.join(ROOT, 'assets', 'svg')
+STATIC_DIR = os.path.join(ROOT, 'static')
+STATIC_URL = '/app/static'
+
+# Relative path commands accumulate rounding error, so keep the precision of the source files.
+PATH_PRECISION = 2
+
+_PATH_DATA = re.compile(r'(\sd=")([^"]*)(")')
+PATH_TOKEN = re.compile(r'[A-Za-z]|[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?')
+
+
+@dataclass(frozen=True)
+class SvgAsset:
+    name: str
+    markup: bytes
+    digest: str
+    gzip: bytes
+    brotli: bytes = None
+
+    @property
+    def filename(self):
+        return f'{self.name}.{self.digest}.svg'
+
+    @property
+    def url(self):
+        return f'{STATIC_URL}/{self.filename}'
+
+
+def _format_number(value, precision):
+    text = f'{value:.{precision}f}'.rstrip('0').rstrip('.')
+    if text in ('-0', ''):
+        return '0'
+    if text.startswith('0.'):
+        return text[1:]
+    if text.startswith('-0.'):
+        return '-' + text[2:]
+    return text
+
+
+def minify_path_data(data, precision=PATH_PRECISION):
+    out = []
+    previous = None
+    for token in PATH_TOKEN.findall(data):
+        if token.isalpha():
+            out.append(token)
+            previous = None
+            continue
+        number = _format_number(float(token), precision)
+        if previous is not None and not number.startswith('-') and not (number.startswith('.') and '.' in previous):
+            out.append(' ')
+        out.append(number)
+        previous = number
+    return ''.join(out)
+
+
+def minify_svg(markup, precision=PATH_PRECISION):
+    markup = re.sub(r'>\s+<', '><', markup.strip())
+    return _PATH_DATA.sub(lambda m: m.group(1) + minify_path_data(m.group(2), precision) + m.group(3), markup)
+
+
+def asset_names():
+    return sorted(os.path.splitext(name)[0] for name in os.listdir(ASSET_DIR) if name.endswith('.svg'))
+
+
+@functools.lru_cache(maxsize=None)
+def load(name):
+    with open(os.path.join(ASSET_DIR, f'{name}.svg'), encoding='utf-8') as f:
+        markup = minify_svg(f.read()).encode('utf-8')
+    return SvgAsset(
+        name=name,
+        markup=markup,
+        digest=hashlib.sha256(markup).hexdigest()[:12],
+        gzip=gzip.compress(markup, compresslevel=9, mtime=0),
+        brotli=brotli.compress(markup, quality=11) if brotli is not None else None,
+    )
+
+
+def _write_once(path, data):
+    if not os.path.exists(path):
+        tmp_path = f'{path}.{os.getpid()}.tmp'
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+
+
+@functools.lru_cache(maxsize=None)
+def publish(name):
+    asset = load(name)
+    os.makedirs(STATIC_DIR, exist_ok=True)
+    path = os.path.join(STATIC_DIR, asset.filename)
+    _write_once(path, asset.markup)
+    _write_once(path + '.gz', asset.gzip)
+    if asset.brotli is not None:
+        _write_once(path + '.br', asset.brotli)
+    return asset.url
+
+
+def url(name):
+    """Content-hash URL for an asset, publishing it on first use."""
+    return publish(name)
+
+
+def main():
+    for name in asset_names():
+        with open(os.path.join(ASSET_DIR, f'{name}.svg'), 'rb') as f:
+            source_size = len(f.read())
+        asset = load(name)
+        brotli_size = len(asset.brotli) if asset.brotli is not None else '-'
+        print(f'{publish(name)}  source {source_size:,} B  minified {len(asset.markup):,} B  '
+              f'gzip {len(asset.gzip):,} B  brotli {brotli_size} B')
+
+
+if __name__ == '__main__':
+    main()
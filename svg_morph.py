@@ -0,0 +1,223 @@
+"""Continuous body silhouette driven by BMI, waist and hip.
+
+On first use the outline path of each figure in ``assets/svg`` is
+flattened to a polyline and resampled by arc length to the same number of
+vertices, starting at the top of the head and running in the same
+direction. A morph is then a piecewise-linear blend of those vertex arrays
+plus a horizontal stretch around the waist and hips, written back out as
+one path. Results are cached per quantized (bmi, waist, hip) bucket.
+"""
+import functools
+import re
+from collections import namedtuple
+
+import svg_assets
+from lazy_import import lazy_import
+
+np = lazy_import('numpy')
+
+VERTICES = 720
+CURVE_SAMPLES = 8
+
+# Figure name -> BMI the figure is drawn for, in increasing order.
+ANCHORS = (('underweight', 17.0), ('healthy', 22.0), ('unhealthy', 30.0))
+
+# Vertical positions as a fraction of the figure height, and the band width of the stretch.
+WAIST_Y, HIP_Y, BAND = 0.40, 0.50, 0.04
+REFERENCE_WAIST_TO_HEIGHT = 0.45
+REFERENCE_HIP_TO_HEIGHT = 0.55
+
+BMI_QUANTUM = 0.25
+RATIO_QUANTUM = 0.01
+
+_ARGUMENT_COUNTS = {'m': 2, 'l': 2, 'h': 1, 'v': 1, 'c': 6, 's': 4, 'a': 7, 'z': 0}
+
+
+def _bezier(p0, p1, p2, p3, t):
+    u = 1 - t
+    return u ** 3 * p0 + 3 * u ** 2 * t * p1 + 3 * u * t ** 2 * p2 + t ** 3 * p3
+
+
+def flatten_subpaths(data, samples=CURVE_SAMPLES):
+    """One absolute polyline per subpath of ``data``; arcs become straight segments."""
+    tokens = svg_assets.PATH_TOKEN.findall(data)
+    t = np.linspace(0, 1, samples + 1)[1:, None]
+    subpaths = []
+    points = []
+    position = start = np.zeros(2)
+    control = None
+    command = None
+    i = 0
+    while i < len(tokens):
+        if tokens[i].isalpha():
+            command = tokens[i]
+            i += 1
+        kind = command.lower()
+        if kind not in _ARGUMENT_COUNTS:
+            raise ValueError(f'Unsupported path command {command!r}')
+        count = _ARGUMENT_COUNTS[kind]
+        args = np.array(tokens[i:i + count], dtype=float)
+        i += count
+        origin = position if command.islower() else np.zeros(2)
+
+        if kind == 'z':
+            position = start
+            control = None
+            continue
+        if kind == 'h':
+            target = np.array([origin[0] + args[0], position[1]])
+        elif kind == 'v':
+            target = np.array([position[0], origin[1] + args[0]])
+        else:
+            target = origin + args[-2:]
+
+        if kind == 'c':
+            c1, c2 = origin + args[0:2], origin + args[2:4]
+            points.extend(_bezier(position, c1, c2, target, t))
+            control = c2
+        elif kind == 's':
+            c1 = 2 * position - control if control is not None else position
+            c2 = origin + args[0:2]
+            points.extend(_bezier(position, c1, c2, target, t))
+            control = c2
+        else:
+            points.append(target)
+            control = None
+
+        position = target
+        if kind == 'm':
+            if len(points) > 1:
+                subpaths.append(np.array(points[:-1]))
+            points = points[-1:]
+            start = target
+            # Extra coordinate pairs after a moveto are implicit linetos.
+            command = 'l' if command.islower() else 'L'
+    if len(points):
+        subpaths.append(np.array(points))
+    return subpaths
+
+
+def flatten_path(data, samples=CURVE_SAMPLES):
+    """Absolute polyline for a single-subpath outline; arcs become straight segments."""
+    return np.concatenate(flatten_subpaths(data, samples))
+
+
+def resample(polyline, vertices=VERTICES):
+    """Closed outline with ``vertices`` points evenly spaced by arc length."""
+    area = np.sum(polyline[:, 0] * np.roll(polyline[:, 1], -1) - np.roll(polyline[:, 0], -1) * polyline[:, 1])
+    if area < 0:
+        polyline = polyline[::-1]
+    top = np.argmin(polyline[:, 1])
+    polyline = np.roll(polyline, -top, axis=0)
+    closed = np.vstack([polyline, polyline[:1]])
+    distance = np.concatenate([[0], np.cumsum(np.hypot(*np.diff(closed, axis=0).T))])
+    s = np.linspace(0, distance[-1], vertices, endpoint=False)
+    return np.column_stack([np.interp(s, distance, closed[:, 0]), np.interp(s, distance, closed[:, 1])])
+
+
+def _hex_to_rgb(color):
+    color = color.lstrip('#')
+    if len(color) == 3:
+        color = ''.join(c * 2 for c in color)
+    return np.array([int(color[i:i + 2], 16) for i in (0, 2, 4)], dtype=float)
+
+
+def _load_figure(name):
+    markup = svg_assets.load(name).markup.decode('utf-8')
+    width, height = (float(v) for v in re.search(r'viewBox="0 0 ([\d.]+) ([\d.]+)"', markup).groups())
+    outline = re.search(r'<path d="([^"]*)"', markup).group(1)
+    vertices = resample(flatten_path(outline))
+    vertices[:, 0] -= width / 2
+    stroke = re.search(r'stroke:(#[0-9a-fA-F]+)', markup).group(1)
+    fill = re.findall(r'stop-color="(#[0-9a-fA-F]+)"', markup)[-1]
+    return vertices, height, _hex_to_rgb(stroke), _hex_to_rgb(fill)
+
+
+Anchors = namedtuple('Anchors', ['bmi', 'vertices', 'height', 'view_width', 'stroke', 'fill', 'waist_profile', 'hip_profile'])
+
+
+@functools.lru_cache(maxsize=None)
+def anchors():
+    """Aligned vertex arrays and colors of the anchor figures, parsed once per process."""
+    figures = [_load_figure(name) for name, _ in ANCHORS]
+    vertices = np.stack([f[0] for f in figures])
+    height = max(f[1] for f in figures)
+    level = vertices[1, :, 1] / height
+    return Anchors(
+        bmi=np.array([bmi for _, bmi in ANCHORS]),
+        vertices=vertices,
+        height=height,
+        view_width=2 * np.abs(vertices[:, :, 0]).max() * 1.25,
+        stroke=np.stack([f[2] for f in figures]),
+        fill=np.stack([f[3] for f in figures]),
+        waist_profile=np.exp(-((level - WAIST_Y) / BAND) ** 2),
+        hip_profile=np.exp(-((level - HIP_Y) / BAND) ** 2),
+    )
+
+
+def _blend(bmi):
+    anchor_bmi = anchors().bmi
+    bmi = np.clip(bmi, anchor_bmi[0], anchor_bmi[-1])
+    upper = np.clip(np.searchsorted(anchor_bmi, bmi, side='right'), 1, len(anchor_bmi) - 1)
+    lower = upper - 1
+    t = (bmi - anchor_bmi[lower]) / (anchor_bmi[upper] - anchor_bmi[lower])
+    return lower, upper, t
+
+
+def morph_vertices(bmi, waist_scale=1.0, hip_scale=1.0):
+    """(VERTICES, 2) outline centred on x=0 for the given BMI and local stretches."""
+    a = anchors()
+    lower, upper, t = _blend(bmi)
+    vertices = (1 - t) * a.vertices[lower] + t * a.vertices[upper]
+    stretch = 1 + (waist_scale - 1) * a.waist_profile + (hip_scale - 1) * a.hip_profile
+    vertices[:, 0] *= stretch
+    return vertices
+
+
+def _color(colors, lower, upper, t):
+    r, g, b = np.rint((1 - t) * colors[lower] + t * colors[upper]).astype(int)
+    return f'#{r:02x}{g:02x}{b:02x}'
+
+
+def path_data(vertices, scale=10):
+    """Polyline path in integer units of 1/scale; draw it with ``transform="scale(1/scale)"``."""
+    coordinates = np.rint(vertices * scale).astype(np.int32).ravel().tolist()
+    return ('M' + ' '.join(['%d'] * len(coordinates)) + 'Z') % tuple(coordinates)
+
+
+def _ratio_scale(ratio, reference):
+    return 1.0 if ratio is None else float(np.clip(ratio / reference, 0.8, 1.3))
+
+
+def _quantize(value, quantum):
+    return None if value is None else round(value / quantum) * quantum
+
+
+@functools.lru_cache(maxsize=4096)
+def _body_svg(bmi, waist_to_height, hip_to_height):
+    a = anchors()
+    lower, upper, t = _blend(bmi)
+    vertices = morph_vertices(bmi, _ratio_scale(waist_to_height, REFERENCE_WAIST_TO_HEIGHT),
+                              _ratio_scale(hip_to_height, REFERENCE_HIP_TO_HEIGHT))
+    vertices[:, 0] += a.view_width / 2
+    d = path_data(vertices)
+    stroke = _color(a.stroke, lower, upper, t)
+    fill = _color(a.fill, lower, upper, t)
+    return (
+        f'<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 {a.view_width:.2f} {a.height:.2f}">'
+        f'<defs><radialGradient id="body-fill" cx="50%" cy="50%" r="60%">'
+        f'<stop offset="0" stop-color="#fff"/><stop offset="1" stop-color="{fill}"/></radialGradient></defs>'
+        f'<path d="{d}" transform="scale(.1)" style="fill:url(#body-fill);stroke:{stroke};stroke-width:50;stroke-linejoin:round"/></svg>'
+    )
+
+
+def body_svg(bmi, waist=None, hip=None, height=None):
+    """SVG markup for a silhouette morphed to the BMI and, if given, waist/hip to height ratios."""
+    waist_to_height = waist / height if waist is not None and height else None
+    hip_to_height = hip / height if hip is not None and height else None
+    return _body_svg(_quantize(float(bmi), BMI_QUANTUM), _quantize(waist_to_height, RATIO_QUANTUM),
+                     _quantize(hip_to_height, RATIO_QUANTUM))
+
+
+cache_info = _body_svg.cache_info
+cache_clear = _body_svg.cache_clear
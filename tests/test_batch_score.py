@@ -0,0 +1,70 @@
+import os
+import sys
+
+import pandas as pd
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import batch_score  # noqa: E402
+
+
+def test_parquet_output_with_int_then_float_chunks(tmp_path):
+    pytest.importorskip('pyarrow')
+    roster = tmp_path / 'people.csv'
+    output = tmp_path / 'scores.parquet'
+    # With chunk_size=2 the first chunk's weight and age look like integers and
+    # the second chunk's like floats; the pass-through visit column goes the other way.
+    roster.write_text(
+        'weight,height,neck,waist,gender,age,visit\n'
+        '70,175,38,85,male,30,1.5\n'
+        '80,175,38,85,male,40,2.5\n'
+        '70.5,175,38,85,male,,3\n'
+        ',175,38,85,male,50.5,4\n'
+    )
+
+    with open(os.devnull, 'w') as log:
+        rows, bad_rows = batch_score.run(str(roster), str(output), chunk_size=2, workers=1, log=log)
+
+    result = pd.read_parquet(output)
+    assert (rows, bad_rows) == (4, 1)
+    assert result['weight'].tolist()[:3] == [70.0, 80.0, 70.5]
+    assert result['visit'].tolist() == ['1.5', '2.5', '3', '4']
+    assert result['error'].tolist()[3] == 'missing or non-numeric weight'
+
+
+def test_parquet_output_with_blank_then_text_pass_through(tmp_path):
+    pytest.importorskip('pyarrow')
+    roster = tmp_path / 'people.csv'
+    output = tmp_path / 'scores.parquet'
+    roster.write_text(
+        'weight,height,neck,waist,gender,note\n'
+        '70,175,38,85,male,\n'
+        '80,175,38,85,male,\n'
+        '75,175,38,85,male,late\n'
+    )
+
+    with open(os.devnull, 'w') as log:
+        rows, bad_rows = batch_score.run(str(roster), str(output), chunk_size=2, workers=1, log=log)
+
+    result = pd.read_parquet(output)
+    assert (rows, bad_rows) == (3, 0)
+    assert result['note'].isna().tolist() == [True, True, False]
+    assert result['note'].tolist()[2] == 'late'
+
+
+def test_score_chunk_numeric_columns_are_float():
+    frame = pd.DataFrame({'weight': [70], 'height': [175], 'neck': [38], 'waist': [85], 'gender': ['male'],
+                          'age': [30]})
+    scored = batch_score.score_chunk(frame)
+    for column in batch_score.NUMERIC_COLUMNS + ['age', 'bmi', 'body_fat_percentage']:
+        assert scored[column].dtype == float, column
+
+
+def test_score_chunk_flags_non_positive_circumferences():
+    frame = pd.DataFrame({'weight': [70, 70, 60, 70], 'height': [175, 175, 165, 175], 'neck': [0, 38, 32, 38],
+                          'waist': [85, -85, 70, 85], 'hip': [None, None, 0, None],
+                          'gender': ['male', 'male', 'female', 'male']})
+    scored = batch_score.score_chunk(frame)
+    assert scored['error'].tolist() == ['circumferences must be positive'] * 3 + ['']
+    assert scored['body_fat_percentage'].isna().tolist() == [True, True, True, False]
@@ -0,0 +1,38 @@
+import math
+import os
+import sys
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import percentiles  # noqa: E402
+
+
+def test_missing_age_matches_scalar_lookup():
+    batched = percentiles.percentiles([25.0, 25.0], ['male', 'male'], [np.nan, 40], 'bmi')
+    assert math.isnan(batched[0]) and math.isnan(percentiles.percentile(25.0, 'male', math.nan, 'bmi'))
+    assert batched[1] == percentiles.percentile(25.0, 'male', 40, 'bmi')
+
+
+def test_group_index_drops_missing_age():
+    assert percentiles.group_index(['male', 'female', 'male'], [np.nan, 80, 17]).tolist() == [
+        -1, len(percentiles.AGE_BANDS) + len(percentiles.AGE_BANDS) - 1, -1]
+
+
+def test_build_index_drops_rows_without_age(tmp_path):
+    csv_path = tmp_path / 'reference.csv'
+    csv_path.write_text(
+        'gender,age,bmi,body_fat_percentage\n'
+        'male,80,24,20\n'
+        'male,,30,30\n'
+        'male,unknown,31,31\n'
+        'female,30,22,28\n'
+    )
+
+    manifest = percentiles.build_index(str(csv_path), str(tmp_path / 'index'))
+
+    assert manifest['metrics']['bmi']['rows'] == 2
+    group_rows = manifest['metrics']['bmi']['group_rows']
+    assert group_rows[len(percentiles.AGE_BANDS) - 1] == 1  # male 75+: only the row with an age
+    assert percentiles.percentiles([30.0], ['male'], [80], 'bmi', str(tmp_path / 'index'))[0] == 100.0
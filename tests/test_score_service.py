@@ -0,0 +1,160 @@
+import asyncio
+import json
+import os
+import socket
+import sys
+import threading
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import score_service  # noqa: E402
+
+PERSON = {'weight': 70, 'height': 170, 'neck': 40, 'waist': 80, 'gender': 'male'}
+
+
+@pytest.fixture(scope='module')
+def port():
+    with socket.socket() as probe:
+        probe.bind(('127.0.0.1', 0))
+        port = probe.getsockname()[1]
+    loop = asyncio.new_event_loop()
+    ready = threading.Event()
+    task = loop.create_task(score_service.serve('127.0.0.1', port, ready=ready))
+
+    def run():
+        try:
+            loop.run_until_complete(task)
+        except asyncio.CancelledError:
+            pass
+        finally:
+            loop.close()
+
+    thread = threading.Thread(target=run, daemon=True)
+    thread.start()
+    assert ready.wait(5)
+    yield port
+    loop.call_soon_threadsafe(task.cancel)
+    thread.join(5)
+
+
+def _request(method, path, body=None, headers=()):
+    if body is not None and not isinstance(body, bytes):
+        body = json.dumps(body).encode()
+    lines = [f'{method} {path} HTTP/1.1', 'Host: localhost', *headers]
+    if body is not None:
+        lines.append(f'Content-Length: {len(body)}')
+    return '\r\n'.join(lines).encode() + b'\r\n\r\n' + (body or b'')
+
+
+def _read_response(stream):
+    status = int(stream.readline().split()[1])
+    headers = {}
+    while (line := stream.readline()) != b'\r\n':
+        name, _, value = line.decode('latin-1').partition(':')
+        headers[name.strip().lower()] = value.strip()
+    return status, headers, json.loads(stream.read(int(headers['content-length'])))
+
+
+def _exchange(port, *requests):
+    """Send raw requests on one connection; the responses and whether the server then closed it."""
+    with socket.create_connection(('127.0.0.1', port), timeout=5) as sock, sock.makefile('rb') as stream:
+        responses = []
+        for request in requests:
+            sock.sendall(request)
+            responses.append(_read_response(stream))
+        closed = responses[-1][1]['connection'] == 'close' and stream.read() == b''
+    return responses, closed
+
+
+def test_score(port):
+    [(status, headers, body)], _ = _exchange(port, _request('POST', '/score', PERSON))
+    assert status == 200
+    assert headers['content-type'] == 'application/json'
+    assert body['bmi'] == 24.22
+    assert round(body['body_fat_percentage'], 2) == 11.96
+    assert body['bmi_category'] == 'normal weight'
+
+
+def test_keep_alive_serves_several_requests(port):
+    responses, closed = _exchange(
+        port,
+        _request('POST', '/score', PERSON),
+        _request('GET', '/healthz'),
+        _request('POST', '/score', PERSON, headers=['Connection: close']),
+    )
+    assert [status for status, _, _ in responses] == [200, 200, 200]
+    assert [headers['connection'] for _, headers, _ in responses] == ['keep-alive', 'keep-alive', 'close']
+    assert responses[1][2] == 'ok'
+    assert closed
+
+
+@pytest.mark.parametrize('request_bytes, status, error', [
+    (_request('POST', '/score', b'{not json'), 400, None),
+    (_request('POST', '/score', dict(PERSON, waist=None)), 400, 'missing waist'),
+    (_request('POST', '/score', dict(PERSON, gender='female')), 400, 'missing hip'),
+    (_request('POST', '/score', dict(PERSON, neck=-1)), 400, 'neck must be positive'),
+    (_request('POST', '/score', dict(PERSON, height=True)), 400, 'height must be a number'),
+    (_request('POST', '/score', b'{"weight": 1' + b'0' * 400 + b', "height": 170, "neck": 40, "waist": 80, '
+                                b'"gender": "male"}'), 400, 'weight must be a number'),
+    (_request('POST', '/score', dict(PERSON, neck=90)), 400, score_service.UNDEFINED_BODY_FAT),
+    (_request('GET', '/score'), 405, 'use POST'),
+    (_request('GET', '/missing'), 404, 'not found'),
+], ids=['bad-json', 'missing-field', 'missing-hip', 'negative', 'bool', 'huge-int', 'undefined-body-fat',
+        'wrong-method', 'unknown-path'])
+def test_rejected_requests_keep_the_connection(port, request_bytes, status, error):
+    responses, _ = _exchange(port, request_bytes, _request('GET', '/healthz'))
+    assert responses[0][0] == status
+    if error is not None:
+        assert responses[0][2] == {'error': error}
+    assert responses[1][0] == 200
+
+
+@pytest.mark.parametrize('request_bytes, status', [
+    (b'POST /score HTTP/1.1\r\nTransfer-Encoding: chunked\r\n\r\n', 411),
+    (f'POST /score HTTP/1.1\r\nContent-Length: {score_service.MAX_BODY + 1}\r\n\r\n'.encode(), 413),
+    (b'POST /score HTTP/1.1\r\nContent-Length: many\r\n\r\n', 400),
+    (b'GET /healthz HTTP/1.1\r\nX-Long: ' + b'a' * 70_000 + b'\r\n\r\n', 431),
+    (b'GET /healthz HTTP/1.1\r\n' + b''.join(b'X-%d: 1\r\n' % i for i in range(score_service.MAX_HEADERS + 1))
+     + b'\r\n', 431),
+    (b'GARBAGE\r\n\r\n', 400),
+], ids=['chunked', 'too-large', 'bad-length', 'long-header', 'too-many-headers', 'bad-request-line'])
+def test_malformed_requests_close_the_connection(port, request_bytes, status):
+    [(got, _, _)], closed = _exchange(port, request_bytes)
+    assert got == status
+    assert closed
+
+
+def test_unexpected_error_answers_500(port, monkeypatch):
+    def fail(people):
+        raise RuntimeError('boom')
+
+    monkeypatch.setattr(score_service, 'score_batch', fail)
+    [(status, _, body)], closed = _exchange(port, _request('POST', '/score', PERSON))
+    assert status == 500
+    assert body == {'error': 'internal error'}
+    assert closed
+
+
+def test_micro_batcher_scores_queued_requests_together():
+    people = [score_service.parse_person(dict(PERSON, weight=60 + i)) for i in range(5)]
+
+    async def score(max_batch):
+        batcher = score_service.MicroBatcher(max_batch=max_batch, max_wait=10)
+        runner = asyncio.create_task(batcher.run())
+        try:
+            results = await asyncio.wait_for(asyncio.gather(*(batcher.score(person) for person in people)), 5)
+            # A lone request is scored right away, not after max_wait.
+            await asyncio.wait_for(batcher.score(people[0]), 1)
+        finally:
+            runner.cancel()
+        return results, batcher.batch_sizes
+
+    results, batch_sizes = asyncio.run(score(max_batch=512))
+    assert results == score_service.score_batch(people)
+    assert batch_sizes == {5: 1, 1: 1}
+
+    results, batch_sizes = asyncio.run(score(max_batch=2))
+    assert results == score_service.score_batch(people)
+    assert batch_sizes == {2: 2, 1: 2}
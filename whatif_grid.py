@@ -0,0 +1,132 @@
+"""Body-fat % over a grid of two circumferences, computed in cached tiles.
+
+Each axis of the what-if explorer spans the range of its sidebar slider.
+Level ``L`` of the pyramid samples that range with ``BASE_POINTS * 2**L``
+points per axis and is split into ``TILE`` x ``TILE`` tiles, each one a
+single broadcast call to :func:`calculate_body_fat_percentage`. A view
+picks the coarsest level that still has ``max_points`` samples across the
+visible window and only builds the tiles it overlaps, so zooming in refines
+the visible part without ever materialising the full fine grid (level 5 is
+8192 x 8192).
+
+Tiles are cached per (gender, units, height bucket, axes, fixed third
+measurement), so every user in the same bucket shares them.
+"""
+import functools
+from collections import namedtuple
+
+from body_composition import calculate_body_fat_percentage
+from lazy_import import lazy_import
+
+np = lazy_import('numpy')
+
+# Axis name -> (low, high), matching the sidebar sliders.
+AXES = {
+    'waist': (40.0, 150.0),
+    'neck': (20.0, 60.0),
+    'hip': (70.0, 160.0),
+}
+TILE = 256
+BASE_POINTS = 256
+MAX_LEVEL = 5
+VIEW_POINTS = 320
+HEIGHT_QUANTUM = 1.0
+FIXED_QUANTUM = 0.5
+# uint16 transport encoding: hundredths of a percent above ENCODE_MIN; NaN (no valid formula) -> ENCODE_NAN.
+ENCODE_MIN = -50.0
+ENCODE_NAN = 65535
+
+GridKey = namedtuple('GridKey', ['gender', 'units', 'height', 'x_axis', 'y_axis', 'fixed_axis', 'fixed'])
+View = namedtuple('View', ['x', 'y', 'z', 'level'])
+
+
+def grid_key(height, neck, waist, hip, gender, units='metric', y_axis='neck'):
+    """Cache key for a waist x ``y_axis`` grid; the remaining circumference (women only) is held fixed."""
+    fixed_axis, fixed = None, None
+    if gender == 'female':
+        fixed_axis, fixed = ('hip', hip) if y_axis == 'neck' else ('neck', neck)
+        fixed = round(float(fixed) / FIXED_QUANTUM) * FIXED_QUANTUM
+    return GridKey(gender, units, round(float(height) / HEIGHT_QUANTUM) * HEIGHT_QUANTUM, 'waist', y_axis,
+                   fixed_axis, fixed)
+
+
+def points(level):
+    return BASE_POINTS << level
+
+
+def axis_coords(axis, level, start=0, stop=None):
+    """Sample positions (cell centres) ``start:stop`` of ``axis`` at ``level``."""
+    low, high = AXES[axis]
+    n = points(level)
+    stop = n if stop is None else stop
+    return low + (np.arange(start, stop) + 0.5) * ((high - low) / n)
+
+
+@functools.lru_cache(maxsize=256)
+def tile(key, level, tx, ty):
+    """float32 (TILE, TILE) block of the grid, rows along ``key.y_axis``."""
+    x = axis_coords(key.x_axis, level, tx * TILE, (tx + 1) * TILE)
+    y = axis_coords(key.y_axis, level, ty * TILE, (ty + 1) * TILE)
+    measurements = {key.x_axis: x[None, :], key.y_axis: y[:, None]}
+    if key.fixed_axis is not None:
+        measurements[key.fixed_axis] = key.fixed
+    bfp = calculate_body_fat_percentage(
+        0.0, key.height, measurements['neck'], measurements['waist'], measurements.get('hip'), key.gender, key.units)
+    return np.asarray(bfp, dtype=np.float32)
+
+
+def _index_range(axis, level, low, high):
+    axis_low, axis_high = AXES[axis]
+    n = points(level)
+    scale = n / (axis_high - axis_low)
+    start = int(np.clip(np.floor((low - axis_low) * scale), 0, n - 1))
+    stop = int(np.clip(np.ceil((high - axis_low) * scale), start + 1, n))
+    return start, stop
+
+
+def choose_level(key, x_range, y_range, max_points=VIEW_POINTS):
+    """Coarsest level with at least ``max_points`` samples across the narrower side of the view."""
+    fraction = min(
+        (x_range[1] - x_range[0]) / (AXES[key.x_axis][1] - AXES[key.x_axis][0]),
+        (y_range[1] - y_range[0]) / (AXES[key.y_axis][1] - AXES[key.y_axis][0]),
+    )
+    level = 0
+    while level < MAX_LEVEL and points(level) * fraction < max_points:
+        level += 1
+    return level
+
+
+def view(key, x_range=None, y_range=None, max_points=VIEW_POINTS):
+    """:class:`View` of the grid inside the ranges, at most ``max_points`` samples per axis."""
+    x_range = x_range or AXES[key.x_axis]
+    y_range = y_range or AXES[key.y_axis]
+    level = choose_level(key, x_range, y_range, max_points)
+    x0, x1 = _index_range(key.x_axis, level, *x_range)
+    y0, y1 = _index_range(key.y_axis, level, *y_range)
+
+    rows = [
+        np.concatenate([tile(key, level, tx, ty) for tx in range(x0 // TILE, (x1 - 1) // TILE + 1)], axis=1)
+        for ty in range(y0 // TILE, (y1 - 1) // TILE + 1)
+    ]
+    block = np.concatenate(rows, axis=0)
+    bx, by = (x0 // TILE) * TILE, (y0 // TILE) * TILE
+    x_step = -(-(x1 - x0) // max_points)
+    y_step = -(-(y1 - y0) // max_points)
+    z = block[y0 - by:y1 - by:y_step, x0 - bx:x1 - bx:x_step]
+    x = axis_coords(key.x_axis, level, x0, x1)[::x_step]
+    y = axis_coords(key.y_axis, level, y0, y1)[::y_step]
+    return View(x, y, z, level)
+
+
+def encode(z):
+    """uint16 little-endian bytes of ``z`` in hundredths of a percent above ``ENCODE_MIN``."""
+    scaled = np.clip(np.round((z - ENCODE_MIN) * 100), 0, ENCODE_NAN - 1)
+    return np.where(np.isnan(z), ENCODE_NAN, scaled).astype('<u2').tobytes()
+
+
+def cache_info():
+    return tile.cache_info()
+
+
+def cache_clear():
+    tile.cache_clear()
@@ -0,0 +1,51 @@
+"""Zoomable body-fat heatmap component for the what-if explorer.
+
+The grid goes to the browser as uint16 bytes (see :func:`whatif_grid.encode`)
+and is drawn into a canvas in ``frontend/whatif_heatmap/index.html``, which
+also maps hovered values to their category band. Wheel zoom and drag pan
+rescale the current image immediately and, once the gesture settles, report
+the visible ranges as the component value, so the next run sends a refined
+grid for just that window.
+"""
+import os
+
+import streamlit.components.v1 as components
+
+from whatif_grid import AXES, ENCODE_MIN, ENCODE_NAN, encode
+
+_component = components.declare_component(
+    'whatif_heatmap',
+    path=os.path.join(os.path.dirname(os.path.abspath(__file__)), 'frontend', 'whatif_heatmap'),
+)
+
+FRAME_HEIGHT = 460
+
+
+def widget_key(y_axis):
+    """Session-state key holding the last zoomed ranges for a ``waist x y_axis`` explorer."""
+    return f'whatif_{y_axis}'
+
+
+def whatif_heatmap(view, grid, bands, marker, axis_labels):
+    """Draw a :class:`whatif_grid.View`; returns ``{'x': [lo, hi], 'y': [lo, hi]}`` after a zoom, else None."""
+    x, y = view.x, view.y
+    x_half = (x[1] - x[0]) / 2 if len(x) > 1 else 0.0
+    y_half = (y[1] - y[0]) / 2 if len(y) > 1 else 0.0
+    return _component(
+        z=encode(view.z),
+        nx=len(x),
+        ny=len(y),
+        x_range=[float(x[0] - x_half), float(x[-1] + x_half)],
+        y_range=[float(y[0] - y_half), float(y[-1] + y_half)],
+        x_limits=list(AXES[grid.x_axis]),
+        y_limits=list(AXES[grid.y_axis]),
+        level=view.level,
+        encode_min=ENCODE_MIN,
+        encode_nan=ENCODE_NAN,
+        bands=[[low, high, color, label] for low, high, color, label in bands],
+        marker=[float(marker[0]), float(marker[1])],
+        axis_labels=list(axis_labels),
+        frame_height=FRAME_HEIGHT,
+        key=widget_key(grid.y_axis),
+        default=None,
+    )